@@ -42,6 +42,7 @@ from ..models import (
     UserAuthorizationProfile,
 )
 from ..permissions import object_type_registry, registry
+from ..snapshot import bump_snapshot_version
 from .utils import group_permissions
 
 
@@ -469,6 +470,8 @@ class HandleAccessRequestSerializer(serializers.HyperlinkedModelSerializer):
                     )
                 )
             UserAtomicPermission.objects.bulk_create(user_atomic_permissions)
+            # bulk_create doesn't send post_save signals
+            transaction.on_commit(bump_snapshot_version)
 
         # send email
         request = self.context.get("request")
@@ -1,4 +1,5 @@
 from datetime import date
+from unittest.mock import patch
 
 from django.contrib.sites.models import Site
 from django.core import mail
@@ -241,6 +242,47 @@ class HandleAccessRequestPermissionsTests(ClearCachesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+class HandleAccessRequestSnapshotTests(ClearCachesMixin, APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.handler = SuperUserFactory.create()
+        self.requester = UserFactory.create()
+        ServiceFactory.create(api_type=APITypes.zrc, api_root=ZAKEN_ROOT)
+        self.zaak = generate_oas_component(
+            "zrc",
+            "schemas/Zaak",
+            url=ZAAK_URL,
+            bronorganisatie=BRONORGANISATIE,
+            identificatie=IDENTIFICATIE,
+        )
+
+        self.client.force_authenticate(self.handler)
+
+    @requests_mock.Mocker()
+    @patch("zac.accounts.api.serializers.bump_snapshot_version")
+    def test_snapshots_invalidated_after_commit(self, m, m_bump):
+        mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
+        mock_resource_get(m, self.zaak)
+        access_request = AccessRequestFactory.create(
+            requester=self.requester, zaak=ZAAK_URL
+        )
+        endpoint = reverse("accessrequest-detail", args=[access_request.id])
+        data = {
+            "result": AccessRequestResult.approve,
+            "permissions": [zaken_inzien.name],
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(endpoint, data)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            # the granted permissions are not committed yet
+            m_bump.assert_not_called()
+
+        m_bump.assert_called_once_with()
+
+
 class HandleAccessRequestAPITests(FreezeTimeMixin, APITransactionTestCase):
     frozen_time = "2020-01-01"
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.html import format_html
@@ -39,6 +39,38 @@ class Blueprint(Serializer):
     def search_query(self, on_nested_field: Optional[str] = "") -> Query:
         raise NotImplementedError("This method must be implemented by a subclass")
 
+    @classmethod
+    def get_policy_key(cls, policy: dict) -> Tuple[str, str]:
+        """
+        Return the (catalogus domein, omschrijving) pair the policy applies to.
+        """
+        raise NotImplementedError("This method must be implemented by a subclass")
+
+    @classmethod
+    def get_object_key(cls, obj) -> Tuple[str, str]:
+        """
+        Return the (catalogus domein, omschrijving) pair of the type of the object.
+        """
+        raise NotImplementedError("This method must be implemented by a subclass")
+
+    @classmethod
+    def search_query_for_policies(
+        cls, policies: Dict[Tuple[str, str], int], on_nested_field: Optional[str] = ""
+    ) -> List[Query]:
+        """
+        Compile the search queries for a set of collapsed policies at once.
+
+        ``policies`` maps (catalogus domein, omschrijving) to the maximum VA order.
+        """
+        raise NotImplementedError("This method must be implemented by a subclass")
+
+    @classmethod
+    def check_requester(cls, obj, permission: Optional[str] = None, user=None) -> bool:
+        """
+        Hook for permissions that depend on the relation between requester and object.
+        """
+        return True
+
     def short_display(self) -> str:
         return "-"
 
@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    ApplicationToken,
+    ApplicationTokenAuthorizationProfile,
+    AtomicPermission,
+    AuthorizationProfile,
+    BlueprintPermission,
+    Role,
+    User,
+    UserAtomicPermission,
+    UserAuthorizationProfile,
+)
+from .snapshot import bump_snapshot_version
+
+PERMISSION_MODELS = (
+    ApplicationTokenAuthorizationProfile,
+    AtomicPermission,
+    AuthorizationProfile,
+    BlueprintPermission,
+    Role,
+    UserAtomicPermission,
+    UserAuthorizationProfile,
+)
+
+PERMISSION_RELATIONS = (
+    AuthorizationProfile.blueprint_permissions.through,
+    User.atomic_permissions.through,
+    User.auth_profiles.through,
+    ApplicationToken.auth_profiles.through,
+)
+
+
+@receiver([post_save, post_delete])
+def invalidate_permission_snapshots(sender, **kwargs):
+    if sender in PERMISSION_MODELS:
+        # other processes must not rebuild a snapshot from the uncommitted state
+        transaction.on_commit(bump_snapshot_version)
+
+
+@receiver(m2m_changed)
+def invalidate_permission_snapshots_relations(sender, action: str, **kwargs):
+    if sender in PERMISSION_RELATIONS and action.startswith("post_"):
+        transaction.on_commit(bump_snapshot_version)
@@ -0,0 +1,232 @@
+"""
+Compiled permission snapshots.
+
+Evaluating permissions used to hit the database for every permission class on
+every request, and every blueprint permission had to be deserialized and checked
+separately. A :class:`PermissionSnapshot` compiles all permissions of a requester
+(user or application token) into plain lookup tables:
+
+* the atomic permissions as sets of object URLs per object type and permission;
+* the blueprint permissions indexed by ``(object_type, permission)`` and
+  ``(catalogus domein, omschrijving)``, mapping to the highest allowed
+  ``vertrouwelijkheidaanduiding``.
+
+Snapshots are cached and versioned - any change to the underlying permission
+models bumps the version (see :mod:`zac.accounts.signals`), which invalidates all
+cached snapshots at once.
+"""
+
+import hashlib
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from django.core.cache import cache, caches
+from django.utils import timezone
+
+from .datastructures import VA_ORDER
+from .models import (
+    ApplicationTokenAuthorizationProfile,
+    BlueprintPermission,
+    UserAtomicPermission,
+    UserAuthorizationProfile,
+)
+from .permissions import object_type_registry
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "permission_snapshot:version"
+SNAPSHOT_TIMEOUT = 60 * 60
+
+PolicyKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class PermissionSnapshot:
+    version: int = 0
+    valid_until: Optional[datetime] = None
+    # (object type, permission name) -> object URLs
+    atomic_urls: Dict[Tuple[str, str], FrozenSet[str]] = field(default_factory=dict)
+    # (object type, permission name) -> {(catalogus domein, omschrijving): max VA order}
+    blueprints: Dict[Tuple[str, str], Dict[PolicyKey, int]] = field(
+        default_factory=dict
+    )
+
+    def is_valid(self, version: int) -> bool:
+        if self.version != version:
+            return False
+        return self.valid_until is None or self.valid_until > timezone.now()
+
+    def has_any(self, object_type: str, permission: str) -> bool:
+        """
+        Check if the requester has the permission for at least one object.
+        """
+        key = (object_type, permission)
+        return key in self.blueprints or key in self.atomic_urls
+
+    def has_atomic(self, permission: str, object_url: str) -> bool:
+        # atomic permissions are checked regardless of the type of the object
+        return any(
+            object_url in urls
+            for (_, name), urls in self.atomic_urls.items()
+            if name == permission
+        )
+
+    def get_atomic_urls(self, object_type: str, permission: str) -> FrozenSet[str]:
+        return self.atomic_urls.get((object_type, permission), frozenset())
+
+    def get_policies(self, object_type: str, permission: str) -> Dict[PolicyKey, int]:
+        return self.blueprints.get((object_type, permission), {})
+
+    def has_blueprint_access(
+        self, object_type: str, permission: str, obj, user=None
+    ) -> bool:
+        policies = self.get_policies(object_type, permission)
+        if not policies:
+            return False
+
+        blueprint_class = object_type_registry[object_type].blueprint_class
+        if not blueprint_class.check_requester(obj, permission, user=user):
+            return False
+
+        max_va_order = policies.get(blueprint_class.get_object_key(obj))
+        if max_va_order is None:
+            return False
+
+        return VA_ORDER[obj.vertrouwelijkheidaanduiding] <= max_va_order
+
+    def has_access(self, object_type: str, permission: str, obj, user=None) -> bool:
+        if self.has_atomic(permission, obj.url):
+            return True
+        return self.has_blueprint_access(object_type, permission, obj, user=user)
+
+
+def get_requester_key(request) -> Optional[str]:
+    user = request.user
+    if user:
+        return f"user:{user.pk}" if user.pk else None
+
+    token = getattr(request.auth, "token", None)
+    if not token:
+        return None
+    # the key ends up in the shared cache and in ES, which must not hold the token
+    return f"application:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def bump_snapshot_version() -> None:
+    """
+    Invalidate all cached permission snapshots.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+    caches["request"].clear()
+
+
+def _track_boundary(boundaries: list, now: datetime, start, end) -> bool:
+    """
+    Record when the validity of a time-bound permission changes next.
+
+    Returns whether the permission is currently active.
+    """
+    if start and start > now:
+        boundaries.append(start)
+        return False
+    if end is not None:
+        if end < now:
+            return False
+        boundaries.append(end)
+    return True
+
+
+def build_snapshot(request, version: int = 0) -> PermissionSnapshot:
+    now = timezone.now()
+    boundaries = [now + timedelta(seconds=SNAPSHOT_TIMEOUT)]
+
+    atomic_urls = defaultdict(set)
+    if user := request.user:
+        user_atomic_permissions = UserAtomicPermission.objects.filter(
+            user=user
+        ).values_list(
+            "atomic_permission__permission",
+            "atomic_permission__object_type",
+            "atomic_permission__object_url",
+            "start_date",
+            "end_date",
+        )
+        for permission, object_type, url, start, end in user_atomic_permissions:
+            if _track_boundary(boundaries, now, start, end):
+                atomic_urls[(object_type, permission)].add(url)
+
+        auth_profile_periods = UserAuthorizationProfile.objects.filter(
+            user=user
+        ).values_list("start", "end")
+    else:
+        auth_profile_periods = ApplicationTokenAuthorizationProfile.objects.filter(
+            application=request.auth
+        ).values_list("start", "end")
+
+    for start, end in auth_profile_periods:
+        _track_boundary(boundaries, now, start, end)
+
+    blueprints = defaultdict(dict)
+    blueprint_permissions = (
+        BlueprintPermission.objects.for_requester(request, actual=True)
+        .values_list("object_type", "policy", "role__permissions")
+        .distinct()
+    )
+    for object_type, policy, permissions in blueprint_permissions:
+        blueprint_class = object_type_registry[object_type].blueprint_class
+        try:
+            policy_key = blueprint_class.get_policy_key(policy)
+            va_order = VA_ORDER[policy["max_va"]]
+        except (KeyError, TypeError):
+            logger.warning("Incomplete blueprint policy %r", policy)
+            policy_key = None
+
+        for permission in permissions:
+            # the permission is registered even if the policy can't grant access
+            # to any object, to keep ``has_any`` in line with the database
+            policies = blueprints[(object_type, permission)]
+            if policy_key is not None:
+                policies[policy_key] = max(policies.get(policy_key, -1), va_order)
+
+    return PermissionSnapshot(
+        version=version,
+        valid_until=min(boundaries),
+        atomic_urls={key: frozenset(urls) for key, urls in atomic_urls.items()},
+        blueprints=dict(blueprints),
+    )
+
+
+def get_permission_snapshot(request) -> PermissionSnapshot:
+    """
+    Return the (cached) permission snapshot of the requester.
+
+    The snapshot is stored in the request cache as well, so that multiple
+    permission classes within one request don't go to the shared cache again.
+    """
+    requester_key = get_requester_key(request)
+    if requester_key is None:
+        return PermissionSnapshot()
+
+    cache_key = f"permission_snapshot:{requester_key}"
+    request_cache = caches["request"]
+    snapshot = request_cache.get(cache_key)
+    if snapshot is not None and snapshot.is_valid(snapshot.version):
+        return snapshot
+
+    cached = cache.get_many([VERSION_KEY, cache_key])
+    version = cached.get(VERSION_KEY) or 0
+    snapshot = cached.get(cache_key)
+    if snapshot is None or not snapshot.is_valid(version):
+        snapshot = build_snapshot(request, version=version)
+        timeout = (snapshot.valid_until - timezone.now()).total_seconds()
+        cache.set(cache_key, snapshot, timeout=max(int(timeout), 1))
+        logger.debug("Built permission snapshot for '%s'", requester_key)
+
+    request_cache.set(cache_key, snapshot)
+    return snapshot
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
+
+from zac.core.permissions import zaken_inzien, zaken_wijzigen
+from zac.core.tests.utils import ClearCachesMixin
+
+from ..constants import PermissionObjectTypeChoices
+from ..datastructures import VA_ORDER
+from ..snapshot import build_snapshot, get_permission_snapshot, get_requester_key
+from .factories import (
+    AtomicPermissionFactory,
+    BlueprintPermissionFactory,
+    UserAtomicPermissionFactory,
+    UserFactory,
+)
+
+
+class PermissionSnapshotTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = UserFactory.create()
+        self.request = MagicMock()
+        self.request.user = self.user
+
+    def test_build_snapshot_blueprint_permissions(self):
+        for max_va in [
+            VertrouwelijkheidsAanduidingen.openbaar,
+            VertrouwelijkheidsAanduidingen.geheim,
+        ]:
+            BlueprintPermissionFactory.create(
+                role__name=f"role-{max_va}",
+                role__permissions=[zaken_inzien.name, zaken_wijzigen.name],
+                for_user=self.user,
+                policy={
+                    "catalogus": "some-domein",
+                    "zaaktype_omschrijving": "ZT1",
+                    "max_va": max_va,
+                },
+            )
+
+        snapshot = build_snapshot(self.request)
+
+        # the highest VA wins for the same zaaktype
+        key = (PermissionObjectTypeChoices.zaak, zaken_inzien.name)
+        self.assertEqual(
+            snapshot.blueprints[key],
+            {("some-domein", "ZT1"): VA_ORDER[VertrouwelijkheidsAanduidingen.geheim]},
+        )
+        self.assertTrue(
+            snapshot.has_any(PermissionObjectTypeChoices.zaak, zaken_wijzigen.name)
+        )
+        self.assertFalse(
+            snapshot.has_any(PermissionObjectTypeChoices.document, zaken_inzien.name)
+        )
+
+    def test_build_snapshot_atomic_permissions(self):
+        active = AtomicPermissionFactory.create(
+            permission=zaken_inzien.name, object_url="https://zaken.nl/zaken/1"
+        )
+        expired = AtomicPermissionFactory.create(
+            permission=zaken_inzien.name, object_url="https://zaken.nl/zaken/2"
+        )
+        end_date = timezone.now() + timedelta(minutes=5)
+        UserAtomicPermissionFactory.create(
+            user=self.user, atomic_permission=active, end_date=end_date
+        )
+        UserAtomicPermissionFactory.create(
+            user=self.user,
+            atomic_permission=expired,
+            end_date=timezone.now() - timedelta(days=1),
+        )
+
+        snapshot = build_snapshot(self.request)
+
+        self.assertTrue(snapshot.has_atomic(zaken_inzien.name, active.object_url))
+        self.assertFalse(snapshot.has_atomic(zaken_inzien.name, expired.object_url))
+        # the snapshot expires together with the atomic permission
+        self.assertEqual(snapshot.valid_until, end_date)
+
+    def test_snapshot_invalidated_on_permission_change(self):
+        snapshot = get_permission_snapshot(self.request)
+        self.assertFalse(
+            snapshot.has_any(PermissionObjectTypeChoices.zaak, zaken_inzien.name)
+        )
+        # served from cache
+        self.assertEqual(get_permission_snapshot(self.request), snapshot)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            AtomicPermissionFactory.create(
+                permission=zaken_inzien.name,
+                object_url="https://zaken.nl/zaken/1",
+                for_user=self.user,
+            )
+
+        # the snapshots are invalidated once the change is committed
+        self.assertTrue(callbacks)
+        snapshot = get_permission_snapshot(self.request)
+        self.assertTrue(
+            snapshot.has_atomic(zaken_inzien.name, "https://zaken.nl/zaken/1")
+        )
+
+    def test_requester_key_application_token(self):
+        request = MagicMock(user=None)
+        request.auth.token = "some-secret-token"
+
+        requester_key = get_requester_key(request)
+
+        self.assertTrue(requester_key.startswith("application:"))
+        self.assertNotIn("some-secret-token", requester_key)
@@ -1,7 +1,4 @@
 import logging
-from typing import Optional
-
-from django.db.models import QuerySet
 
 from rest_framework import permissions
 from rest_framework.request import Request
@@ -9,7 +6,7 @@ from rest_framework.views import APIView
 from zds_client import ClientError
 
 from zac.accounts.constants import PermissionObjectTypeChoices
-from zac.accounts.models import BlueprintPermission, UserAtomicPermission
+from zac.accounts.snapshot import PermissionSnapshot, get_permission_snapshot
 from zac.core.permissions import Permission
 from zac.core.services import get_document, get_informatieobjecttype, get_zaak
 
@@ -28,49 +25,20 @@ class DefinitionBasePermission(permissions.BasePermission):
 
         return self.permission
 
-    def get_blueprint_permissions(self, request, permission_name) -> QuerySet:
-        return BlueprintPermission.objects.for_requester(request, actual=True).filter(
-            role__permissions__contains=[permission_name],
-            object_type=self.object_type,
-        )
-
-    def user_atomic_permissions_exists(
-        self, request, permission_name, obj_url: Optional[str] = ""
-    ) -> bool:
-        filters = {
-            "user": request.user,
-            "atomic_permission__permission": permission_name,
-        }
-        if obj_url:
-            filters["atomic_permission__object_url"] = obj_url
-        else:
-            filters["atomic_permission__object_type"] = self.object_type
-
-        return (
-            UserAtomicPermission.objects.select_related("atomic_permission")
-            .filter(**filters)
-            .actual()
-            .exists()
-        )
+    def get_permission_snapshot(self, request) -> PermissionSnapshot:
+        return get_permission_snapshot(request)
 
     def has_object_permission(self, request: Request, view: APIView, obj):
         if request.user.is_superuser:
             return True
 
         permission_name = self.get_permission(request).name
-        # first check atomic permissions - this checks both atomic permissions directly attached to the user
-        # and atomic permissions defined to authorization profiles
-        if self.user_atomic_permissions_exists(
-            request, permission_name, obj_url=obj.url
-        ):
-            return True
-
-        # then check blueprint permissions
-        for permission in self.get_blueprint_permissions(request, permission_name):
-            if permission.has_access(obj, request.user, permission_name):
-                return True
-
-        return False
+        # atomic permissions are checked before blueprint permissions - both are
+        # looked up in the compiled permission snapshot of the requester
+        snapshot = self.get_permission_snapshot(request)
+        return snapshot.has_access(
+            self.object_type, permission_name, obj, user=request.user
+        )
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         if request.user.is_superuser:
@@ -78,9 +46,8 @@ class DefinitionBasePermission(permissions.BasePermission):
 
         permission_name = self.get_permission(request).name
         # check if the user has permissions for any object
-        if (not self.get_blueprint_permissions(request, permission_name).exists()) and (
-            not self.user_atomic_permissions_exists(request, permission_name)
-        ):
+        snapshot = self.get_permission_snapshot(request)
+        if not snapshot.has_any(self.object_type, permission_name):
             return False
 
         return super().has_permission(request, view)
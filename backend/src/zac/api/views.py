@@ -10,6 +10,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from zac.core.config_snapshot import get_config
 from zac.core.models import WarningBanner
 
 HEADERS_TO_KEEP = (
@@ -91,7 +92,7 @@ class PingView(APIView):
     )
     def get(self, request: Request, *args, **kwargs):
         response = {"pong": True}
-        warning = WarningBanner.get_solo()
+        warning = get_config(WarningBanner)
         if warning.warning:
             response["warning"] = warning.warning
 
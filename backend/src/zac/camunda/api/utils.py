@@ -3,6 +3,7 @@ from typing import Dict, Optional
 from django_camunda.client import get_client
 from django_camunda.types import CamundaId
 
+from zac.core.config_snapshot import get_config
 from zac.core.models import CoreConfig
 
 
@@ -16,7 +17,7 @@ def get_bptl_app_id_variable() -> Dict[str, str]:
     """
     Get the name and value of the bptl app ID variable for BPTL.
     """
-    core_config = CoreConfig.get_solo()
+    core_config = get_config(CoreConfig)
     return {
         "bptlAppId": core_config.app_id,
     }
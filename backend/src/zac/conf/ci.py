@@ -21,6 +21,12 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "request",
     },
+    # bounded cache for bulk jobs, see zac.utils.decorators.bulk_cache
+    "bulk": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "bulk",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
 }
 
 LOGGING = None  # Quiet is nice
@@ -38,3 +44,12 @@ PASSWORD_HASHERS = [
 ]
 
 ENVIRONMENT = "ci"
+
+# write index updates right away
+ES_WRITER_MAX_DELAY = 0
+
+# test cases change the configuration in transactions that are rolled back
+CONFIG_SNAPSHOT_TIMEOUT = 0
+
+# don't wait for newer address suggestion requests
+ADDRESS_SUGGESTIONS_DEBOUNCE = 0
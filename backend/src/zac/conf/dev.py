@@ -91,6 +91,11 @@ if not config("USE_REDIS_CACHE", default=False):
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "request",
         },
+        "bulk": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "bulk",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        },
     }
 
 # THOU SHALT NOT USE NAIVE DATETIMES
@@ -110,6 +115,9 @@ if "test" in sys.argv:
     ES_INDEX_ZAKEN = "zaken_test"
     ES_INDEX_DOCUMENTEN = "documenten_test"
     ES_INDEX_OBJECTEN = "objecten_test"
+    ES_INDEX_META_OBJECTEN = "meta_objecten_test"
+    CONFIG_SNAPSHOT_TIMEOUT = 0
+    ADDRESS_SUGGESTIONS_DEBOUNCE = 0
 
 
 # Override settings with local settings.
@@ -70,6 +70,11 @@ CACHES = {
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "IGNORE_EXCEPTIONS": True,
+            "SERIALIZER": "zac.utils.cache_serializers.CompactSerializer",
+            # cached values larger than this (in bytes) are compressed
+            "SERIALIZER_COMPRESS_MIN_LENGTH": config(
+                "CACHE_COMPRESS_MIN_LENGTH", default=1024
+            ),
         },
     },
     "axes": {
@@ -109,6 +114,12 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "request",
     },
+    # bounded cache for bulk jobs, see zac.utils.decorators.bulk_cache
+    "bulk": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "bulk",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
 }
 
 # Application definition
@@ -399,6 +410,35 @@ SHOW_ALERT = True
 MAX_WORKERS = config("MAX_WORKERS", default=2)
 CHUNK_SIZE = config("CHUNK_SIZE", default=100)
 
+# Document downloads are streamed from the DRC in chunks of this many bytes.
+DOCUMENT_DOWNLOAD_CHUNK_SIZE = config("DOCUMENT_DOWNLOAD_CHUNK_SIZE", default=64 * 1024)
+# When set, document downloads are handed off to the reverse proxy with an
+# X-Accel-Redirect to this internal location, followed by the DRC download URL.
+# No credentials are passed along: the location must authenticate with the DRC
+# itself, and only with the DRC. For nginx, with DOCUMENT_DOWNLOAD_ACCEL_REDIRECT
+# set to "/_documents/":
+#
+#     location ~ ^/_documents/https?:/+drc\.example\.nl/(.*)$ {
+#         internal;
+#         resolver <DNS server>;
+#         proxy_pass https://drc.example.nl/$1$is_args$args;
+#         proxy_set_header Authorization "<credentials of ZAC for the DRC>";
+#     }
+#
+# As the internal location can't be verified from here, the mode is only enabled
+# once DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED confirms it is set up. See
+# zac.core.checks.
+DOCUMENT_DOWNLOAD_ACCEL_REDIRECT = config("DOCUMENT_DOWNLOAD_ACCEL_REDIRECT", "")
+DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED = config(
+    "DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED", default=False
+)
+# Uploaded files larger than this many bytes (by default Django's limit for
+# keeping uploads in memory) are base64 encoded while they're sent to the DRC.
+DOCUMENT_UPLOAD_STREAM_THRESHOLD = config(
+    "DOCUMENT_UPLOAD_STREAM_THRESHOLD", default=2621440
+)
+DOCUMENT_UPLOAD_CHUNK_SIZE = 3 * 64 * 1024
+
 ##############################
 #                            #
 # 3RD PARTY LIBRARY SETTINGS #
@@ -579,6 +619,32 @@ CB_FAILURE_THRESHOLD = config("CB_FAILURE_THRESHOLD", default=5)
 CB_FAILURE_WINDOW = config("CB_FAILURE_WINDOW", default=60)  # seconds
 CB_RECOVERY_TIMEOUT = config("CB_RECOVERY_TIMEOUT", default=30)  # seconds
 
+# On a cache miss only one process computes the value (see @cache_result), others
+# poll the cache every CACHE_LOCK_POLL_INTERVAL seconds for at most
+# CACHE_LOCK_TIMEOUT seconds before computing it themselves.
+CACHE_LOCK_TIMEOUT = config("CACHE_LOCK_TIMEOUT", default=30)  # seconds
+CACHE_LOCK_POLL_INTERVAL = config("CACHE_LOCK_POLL_INTERVAL", default=0.1)  # seconds
+
+# The singleton configuration models are read from a process-local snapshot, which
+# is rebuilt when a configuration changes or after CONFIG_SNAPSHOT_TIMEOUT seconds.
+# 0 reads the configuration from the database every time.
+CONFIG_SNAPSHOT_TIMEOUT = config("CONFIG_SNAPSHOT_TIMEOUT", default=60)  # seconds
+
+# Address suggestions of the PDOK locatieserver are cached per process for
+# ADDRESS_SUGGESTIONS_CACHE_TIMEOUT seconds, for at most
+# ADDRESS_SUGGESTIONS_CACHE_MAX_ENTRIES queries. A suggestion request waits
+# ADDRESS_SUGGESTIONS_DEBOUNCE seconds and is dropped if the same user made a newer
+# one in the meantime.
+ADDRESS_SUGGESTIONS_CACHE_TIMEOUT = config(
+    "ADDRESS_SUGGESTIONS_CACHE_TIMEOUT", default=5 * 60
+)  # seconds
+ADDRESS_SUGGESTIONS_CACHE_MAX_ENTRIES = config(
+    "ADDRESS_SUGGESTIONS_CACHE_MAX_ENTRIES", default=1000
+)
+ADDRESS_SUGGESTIONS_DEBOUNCE = config(
+    "ADDRESS_SUGGESTIONS_DEBOUNCE", default=0.15
+)  # seconds
+
 ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
     os.path.join(DJANGO_PROJECT_DIR, "tests", "schemas"),
     os.path.join(DJANGO_PROJECT_DIR, "contrib", "objects", "tests", "schemas"),
@@ -598,6 +664,8 @@ ES_INDEX_DOCUMENTEN = "documenten"
 ES_INDEX_OBJECTEN = "objecten"
 ES_INDEX_ZIO = "zaakinformatieobjecten"
 ES_INDEX_ZO = "zaakobjecten"
+ES_INDEX_PERMISSIONS = "permissions"
+ES_INDEX_META_OBJECTEN = "meta_objecten"
 
 # USED FOR INDEXING EDGE NGRAM ANALYZER
 MAX_GRAM = config("MAX_GRAM", 16)
@@ -607,6 +675,25 @@ ES_MAX_RETRIES = 10
 ES_MAX_BACKOFF = 120
 ES_CHUNK_SIZE = 100
 ES_SIZE = 1000  # default page size for searches
+# seconds to cache quick search results per user and search term, 0 disables it
+QUICK_SEARCH_CACHE_TIMEOUT = config("QUICK_SEARCH_CACHE_TIMEOUT", default=0)
+# seconds to cache the management dashboard summary per user, 0 disables it
+MANAGEMENT_DASHBOARD_SUMMARY_CACHE_TIMEOUT = config(
+    "MANAGEMENT_DASHBOARD_SUMMARY_CACHE_TIMEOUT", default=60
+)
+# keep alive of the point in time used by cursor pagination, e.g. "5m". Requires
+# Elasticsearch 7.10 or newer - leave empty to paginate without a point in time.
+ES_PAGINATION_KEEP_ALIVE = config("ES_PAGINATION_KEEP_ALIVE", default="")
+# buffered index updates are sent in bulk after this many seconds or documents
+ES_WRITER_MAX_DELAY = config("ES_WRITER_MAX_DELAY", default=1.0)
+ES_WRITER_MAX_ACTIONS = config("ES_WRITER_MAX_ACTIONS", default=500)
+ES_REFRESH_INTERVAL = 1.0  # seconds, the refresh_interval of the indices
+# throttle of update by query requests in documents per second, -1 disables it
+ES_UPDATE_BY_QUERY_REQUESTS_PER_SECOND = config(
+    "ES_UPDATE_BY_QUERY_REQUESTS_PER_SECOND", default=-1
+)
+# atomic permission URL lists longer than this are stored in a terms lookup document
+ES_PERMISSIONS_TERMS_LOOKUP_THRESHOLD = 500
 
 # SCIM
 # SCIM_SERVICE_PROVIDER = {
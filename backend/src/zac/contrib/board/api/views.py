@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
@@ -9,12 +11,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
-from zac.core.services import get_zaaktypen
+from zac.core.services import get_zaaktype_omschrijvingen
 from zac.elasticsearch.documents import ZaakDocument
 from zac.elasticsearch.drf_api.serializers import ZaakDocumentSerializer
 from zac.elasticsearch.drf_api.views import PaginatedSearchMixin, PerformSearchMixin
 from zac.elasticsearch.searches import count_by_zaaktype
 
+from ..cache import get_summary_cache_key
 from ..models import Board, BoardItem
 from .filters import BoardItemFilter
 from .pagination import DashboardPagination
@@ -114,38 +117,23 @@ class ManagementDashboardSummaryView(APIView):
         responses={200: SummaryManagementDashboardSerializer(many=True)},
     )
     def post(self, request, *args, **kwargs):
-        results = count_by_zaaktype(request=request)
-
-        # For presentation purposes separate zaaktypen
-        # by catalogus and map identificatie to omschrijving.
-        zts = get_zaaktypen()
-        catalogi = {zt.catalogus for zt in zts}
-        zts_per_catalogus = {}
-        for catalogus in catalogi:
-            zts_per_catalogus[catalogus] = list(
-                filter(lambda zt: zt.catalogus == catalogus, zts)
-            )
-
-        for catalogus in catalogi:
-            max_versiedatum_per_zaaktype = {}
-            for zt in (zts := zts_per_catalogus[catalogus]):
-                if old_zt_versiedatum := max_versiedatum_per_zaaktype.get(
-                    zt.identificatie
-                ):
-                    if zt.versiedatum > old_zt_versiedatum:
-                        max_versiedatum_per_zaaktype[zt.identificatie] = zt.versiedatum
-                else:
-                    max_versiedatum_per_zaaktype[zt.identificatie] = zt.versiedatum
-            zts_per_catalogus[catalogus] = {
-                zt.identificatie: zt.omschrijving
-                for zt in zts
-                if zt.versiedatum == max_versiedatum_per_zaaktype[zt.identificatie]
-            }
+        cache_key = get_summary_cache_key(request)
+        if cache_key and (data := cache.get(cache_key)) is not None:
+            return Response(data)
 
+        results = count_by_zaaktype(request=request)
+        # For presentation purposes map identificatie to omschrijving per catalogus.
         serializer = self.serializer_class(
             results,
             many=True,
-            context={"zaaktypen": zts_per_catalogus},
+            context={"zaaktypen": get_zaaktype_omschrijvingen()},
         )
+        data = sorted(serializer.data, key=lambda zts: zts["catalogus"])
 
-        return Response(sorted(serializer.data, key=lambda zts: zts["catalogus"]))
+        if cache_key:
+            cache.set(
+                cache_key,
+                data,
+                timeout=settings.MANAGEMENT_DASHBOARD_SUMMARY_CACHE_TIMEOUT,
+            )
+        return Response(data)
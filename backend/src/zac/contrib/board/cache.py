@@ -0,0 +1,37 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework.request import Request
+
+from zac.accounts.snapshot import get_permission_snapshot, get_requester_key
+
+SUMMARY_VERSION_KEY = "management_dashboard:summary:version"
+
+
+def get_summary_cache_key(request: Request) -> Optional[str]:
+    """
+    Cache key of the management dashboard summary of the requester.
+
+    The summary depends on the permissions of the requester, so it is cached per
+    permission snapshot version.
+    """
+    if not settings.MANAGEMENT_DASHBOARD_SUMMARY_CACHE_TIMEOUT:
+        return None
+    if (requester_key := get_requester_key(request)) is None:
+        return None
+
+    version = cache.get(SUMMARY_VERSION_KEY) or 0
+    snapshot = get_permission_snapshot(request)
+    return f"management_dashboard:summary:{version}:{requester_key}:{snapshot.version}"
+
+
+def invalidate_management_dashboard_summary_cache() -> None:
+    """
+    Invalidate the cached summaries of all requesters.
+    """
+    try:
+        cache.incr(SUMMARY_VERSION_KEY)
+    except ValueError:
+        cache.set(SUMMARY_VERSION_KEY, 1, timeout=None)
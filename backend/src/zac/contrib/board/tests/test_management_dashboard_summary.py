@@ -1,7 +1,13 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
 from django.urls import reverse_lazy
 
 import requests_mock
-from rest_framework.test import APITransactionTestCase
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
+from rest_framework.test import APITestCase, APITransactionTestCase
+from zgw_consumers.api_models.base import factory
 from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
 from zgw_consumers.constants import APITypes
 
@@ -15,13 +21,16 @@ from zac.accounts.tests.factories import (
 from zac.camunda.constants import AssigneeTypeChoices
 from zac.core.permissions import zaken_inzien
 from zac.core.tests.utils import ClearCachesMixin
+from zac.elasticsearch.data import ParentAggregation
 from zac.elasticsearch.documents import ZaakDocument, ZaakTypeDocument
+from zac.elasticsearch.searches import count_by_zaaktype
 from zac.elasticsearch.tests.utils import ESMixin
 from zac.tests import ServiceFactory
 from zac.tests.compat import generate_oas_component, mock_service_oas_get
 from zac.tests.utils import paginated_response
 
 from ..api.permissions import management_dashboard_inzien
+from ..cache import invalidate_management_dashboard_summary_cache
 
 CATALOGI_ROOT = "https://api.catalogi.nl/api/v1/"
 ZAKEN_ROOT = "https://api.zaken.nl/api/v1/"
@@ -211,3 +220,114 @@ class ManagementDashboardSummaryTests(
                 }
             ],
         )
+
+
+def composite_response(search, buckets, after_key=None):
+    aggregation = {
+        "buckets": [
+            {
+                "key": {"catalogus": catalogus, "identificatie": identificatie},
+                "doc_count": doc_count,
+            }
+            for catalogus, identificatie, doc_count in buckets
+        ]
+    }
+    if after_key:
+        aggregation["after_key"] = after_key
+    return Response(
+        search,
+        {
+            "hits": {"total": {"value": 0}, "hits": []},
+            "aggregations": {"zaaktypen": aggregation},
+        },
+    )
+
+
+@override_settings(ES_SIZE=2)
+class CountByZaaktypeTests(SimpleTestCase):
+    def test_pages_through_composite_buckets(self):
+        catalogus = f"{CATALOGI_ROOT}catalogussen/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+        pages = iter(
+            [
+                [(catalogus, "zaaktype_id_1", 3), (catalogus, "zaaktype_id_2", 1)],
+                [("other-catalogus", "zaaktype_id_1", 2)],
+            ]
+        )
+        searches = []
+
+        def execute(search):
+            searches.append(search.to_dict())
+            buckets = next(pages)
+            after_key = {"catalogus": buckets[-1][0], "identificatie": buckets[-1][1]}
+            return composite_response(search, buckets, after_key)
+
+        request = MagicMock(user=MagicMock(is_superuser=True), auth=None)
+        with patch.object(Search, "execute", autospec=True, side_effect=execute):
+            results = count_by_zaaktype(request=request)
+
+        self.assertEqual(len(searches), 2)
+        self.assertNotIn("after", searches[0]["aggs"]["zaaktypen"]["composite"])
+        self.assertEqual(
+            searches[1]["aggs"]["zaaktypen"]["composite"]["after"],
+            {"catalogus": catalogus, "identificatie": "zaaktype_id_2"},
+        )
+        self.assertEqual(
+            [(result.key, result.doc_count) for result in results],
+            [(catalogus, 4), ("other-catalogus", 2)],
+        )
+        self.assertEqual(
+            [(bucket.key, bucket.doc_count) for bucket in results[0].child.buckets],
+            [("zaaktype_id_1", 3), ("zaaktype_id_2", 1)],
+        )
+
+
+@override_settings(MANAGEMENT_DASHBOARD_SUMMARY_CACHE_TIMEOUT=60)
+@patch(
+    "zac.contrib.board.api.views.get_zaaktype_omschrijvingen",
+    return_value={"catalogus": {"zaaktype_id_1": "zaaktype1"}},
+)
+@patch(
+    "zac.contrib.board.api.views.count_by_zaaktype",
+    return_value=factory(
+        ParentAggregation,
+        [
+            {
+                "key": "catalogus",
+                "doc_count": 1,
+                "child": {"buckets": [{"key": "zaaktype_id_1", "doc_count": 1}]},
+            }
+        ],
+    ),
+)
+class ManagementDashboardSummaryCacheTests(ClearCachesMixin, APITestCase):
+    endpoint = reverse_lazy("management-dashboard-summary")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(SuperUserFactory.create())
+
+    def test_summary_is_cached(self, m_count, m_omschrijvingen):
+        response1 = self.client.post(self.endpoint)
+        response2 = self.client.post(self.endpoint)
+
+        self.assertEqual(response1.json(), response2.json())
+        self.assertEqual(
+            response2.json()[0]["zaaktypen"][0]["zaaktypeOmschrijving"], "zaaktype1"
+        )
+        m_count.assert_called_once()
+
+    def test_invalidate(self, m_count, m_omschrijvingen):
+        self.client.post(self.endpoint)
+
+        invalidate_management_dashboard_summary_cache()
+        self.client.post(self.endpoint)
+
+        self.assertEqual(m_count.call_count, 2)
+
+    def test_cached_per_user(self, m_count, m_omschrijvingen):
+        self.client.post(self.endpoint)
+
+        self.client.force_authenticate(SuperUserFactory.create())
+        self.client.post(self.endpoint)
+
+        self.assertEqual(m_count.call_count, 2)
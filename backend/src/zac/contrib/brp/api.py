@@ -1,11 +1,17 @@
 import logging
-from typing import Optional
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
 
 import requests
 from zds_client import ClientError
-from zds_client.schema import get_operation_url
+from zds_client.schema import DEFAULT_PATH_PARAMETERS, get_operation_url
 from zgw_consumers.api_models.base import factory
+from zgw_consumers.concurrent import parallel
 
+from zac.core.config_snapshot import get_config
 from zac.utils.decorators import cache as cache_result
 from zac.zgw_client import ZGWClient
 
@@ -36,7 +42,7 @@ class HalClient(ZGWClient):
 
 
 def get_client() -> HalClient:
-    config = BRPConfig.get_solo()
+    config = get_config(BRPConfig)
     service = config.service
 
     assert service, "A service must be configured first"
@@ -49,6 +55,46 @@ def get_client() -> HalClient:
     return client
 
 
+@dataclass(frozen=True)
+class PooledClient:
+    config: BRPConfig
+    client: HalClient
+    # path of the ``ingeschrevenNatuurlijkPersoon`` operation
+    persoon_url: str
+
+
+_pooled_client: Optional[PooledClient] = None
+_pool_lock = threading.Lock()
+
+
+def get_pooled_client() -> PooledClient:
+    """
+    Return the BRP client shared by this process.
+
+    The client (and its connection pool) is rebuilt when the configuration changes.
+    """
+    global _pooled_client
+
+    config = get_config(BRPConfig)
+    pooled = _pooled_client
+    if pooled is not None and pooled.config is config:
+        return pooled
+
+    with _pool_lock:
+        if _pooled_client is None or _pooled_client.config is not config:
+            client = get_client()
+            persoon_url = get_operation_url(
+                client.schema,
+                "ingeschrevenNatuurlijkPersoon",
+                pattern_only=True,
+                base_url=client.base_url,
+            )
+            _pooled_client = PooledClient(
+                config=config, client=client, persoon_url=persoon_url
+            )
+        return _pooled_client
+
+
 def call_halclient_retrieve(
     client: HalClient,
     resource: str,
@@ -92,19 +138,43 @@ def call_halclient_retrieve(
 
 
 @cache_result("natuurlijkpersoon:{url}", timeout=A_DAY)
-def fetch_natuurlijkpersoon(url: str) -> IngeschrevenNatuurlijkPersoon:
-    client = get_client()
+def fetch_natuurlijkpersoon(
+    url: str, client: Optional[HalClient] = None
+) -> IngeschrevenNatuurlijkPersoon:
+    client = client or get_pooled_client().client
     result = call_halclient_retrieve(client, "ingeschrevenNatuurlijkPersoon", url=url)
     return factory(IngeschrevenNatuurlijkPersoon, result)
 
 
+def fetch_natuurlijkpersonen(
+    urls: Iterable[str],
+) -> Dict[str, IngeschrevenNatuurlijkPersoon]:
+    """
+    Fetch the natuurlijk personen concurrently, by URL.
+
+    Every URL is fetched once. Lookups of the same URL in progress in other
+    requests are shared, see :func:`zac.utils.decorators.cache`.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+
+    client = get_pooled_client().client
+
+    def _fetch_natuurlijkpersoon(url: str) -> IngeschrevenNatuurlijkPersoon:
+        return fetch_natuurlijkpersoon(url, client=client)
+
+    with parallel(max_workers=settings.MAX_WORKERS) as executor:
+        personen = list(executor.map(_fetch_natuurlijkpersoon, urls))
+    return dict(zip(urls, personen))
+
+
 def fetch_extrainfo_np(
     request_kwargs: Optional[dict] = None,
     **path_kwargs,
 ) -> ExtraInformatieIngeschrevenNatuurlijkPersoon:
     """Function that calls:
-         get_client(),
-         zds_client.schema.get_operation_url(),
+         get_pooled_client(),
          call_halclient_retrieve().
 
     Args:
@@ -115,14 +185,10 @@ def fetch_extrainfo_np(
         ExtraInformatieIngeschrevenNatuurlijkPersoon class filled in with
         result from call_halclient_retrieve function.
     """
-    client = get_client()
+    pooled = get_pooled_client()
+    client = pooled.client
     resource = "ingeschrevenNatuurlijkPersoon"
-    url = get_operation_url(
-        client.schema,
-        resource,
-        base_url=client.base_url,
-        **path_kwargs,
-    )
+    url = pooled.persoon_url.format(**{**DEFAULT_PATH_PARAMETERS, **path_kwargs})
 
     result = call_halclient_retrieve(
         client,
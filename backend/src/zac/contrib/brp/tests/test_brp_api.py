@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.test import TestCase
 from django.urls import reverse
@@ -12,7 +13,13 @@ from zac.core.tests.utils import ClearCachesMixin
 from zac.tests import ServiceFactory
 from zac.tests.compat import mock_service_oas_get
 
-from ..api import fetch_extrainfo_np, fetch_natuurlijkpersoon, get_client
+from ..api import (
+    fetch_extrainfo_np,
+    fetch_natuurlijkpersonen,
+    fetch_natuurlijkpersoon,
+    get_client,
+    get_pooled_client,
+)
 from ..models import BRPConfig
 
 BRP_API_ROOT = "https://brp.nl/api/v1/"
@@ -84,6 +91,46 @@ class BrpApiTests(ClearCachesMixin, TestCase):
         self.assertEqual(headers["Content-Type"], "application/hal+json")
         self.assertEqual(headers["Accept"], "application/hal+json")
 
+    @requests_mock.Mocker()
+    def test_fetch_natuurlijkpersonen(self, m):
+        self._setUpMock(m)
+        other_url = f"{BRP_API_ROOT}ingeschrevenpersonen/999993112"
+        m.get(
+            other_url,
+            json={
+                "burgerservicenummer": "999993112",
+                "geslachtsaanduiding": "vrouw",
+                "leeftijd": 40,
+                "naam": {},
+                "geboorte": {},
+                "_links": {},
+            },
+        )
+
+        result = fetch_natuurlijkpersonen([PERSOON_URL, other_url, PERSOON_URL])
+
+        self.assertEqual(
+            {url: persoon.burgerservicenummer for url, persoon in result.items()},
+            {PERSOON_URL: BSN, other_url: "999993112"},
+        )
+        self.assertEqual(len(m.request_history), 2)
+
+        # cached afterwards
+        fetch_natuurlijkpersonen([PERSOON_URL, other_url])
+        self.assertEqual(len(m.request_history), 2)
+
+    def test_pooled_client(self):
+        config = BRPConfig.get_solo()
+
+        with patch("zac.contrib.brp.api.get_config", return_value=config):
+            pooled = get_pooled_client()
+            self.assertIs(get_pooled_client(), pooled)
+
+        self.assertEqual(
+            pooled.persoon_url, "/api/v1/ingeschrevenpersonen/{burgerservicenummer}"
+        )
+        self.assertIsNot(get_pooled_client(), pooled)
+
     @requests_mock.Mocker()
     def test_fetch_extrainfo_np(self, m):
         self._setUpMock(m)
@@ -1,3 +1,4 @@
+import copy
 import logging
 import time
 from typing import Dict, List, Optional, Tuple
@@ -18,6 +19,7 @@ from zgw_consumers.constants import AuthTypes
 
 from zac.accounts.models import User
 from zac.client import Client
+from zac.core.config_snapshot import get_config
 from zac.core.utils import A_DAY
 from zac.utils.decorators import cache as cache_result, optional_service
 from zgw.models.zrc import Zaak
@@ -55,9 +57,11 @@ def _regenerate_token_with_extra_claims(auth: ZGWAuth, extra_claims: dict) -> No
 
 
 def get_client(user: Optional[User] = None, force: bool = False) -> Client:
-    config = DowcConfig.get_solo()
+    config = get_config(DowcConfig)
     assert config.service, "The DoWC service must be configured first"
-    service = config.service
+    # the configured service is shared by the process, override the claims and auth
+    # on a copy
+    service = copy.copy(config.service)
 
     # override the actual logged in user in the `user_id` claim, so that Do.W.C. is
     # aware of the actual end user
@@ -1,6 +1,7 @@
 import uuid
 from unittest.mock import patch
 
+from django.test import override_settings
 from django.urls import reverse
 
 import jwt
@@ -20,6 +21,7 @@ from zac.accounts.tests.factories import (
     SuperUserFactory,
     UserFactory,
 )
+from zac.core.config_snapshot import bump_config_version, get_config
 from zac.core.permissions import zaken_download_documents
 from zac.core.tests.utils import ClearCachesMixin
 from zac.tests import ServiceFactory
@@ -166,6 +168,28 @@ class DOWCAPITests(ClearCachesMixin, APITestCase):
             client.auth_header, {"Authorization": "ApplicationToken some-token"}
         )
 
+    @override_settings(CONFIG_SNAPSHOT_TIMEOUT=60)
+    def test_client_does_not_change_shared_service(self, m):
+        bump_config_version()
+        other_user = UserFactory.create(username="other")
+        get_client(user=other_user)
+
+        client = get_client(force=True)
+        self.assertEqual(
+            client.auth_header, {"Authorization": "ApplicationToken some-token"}
+        )
+
+        client = get_client(user=self.user)
+        token = client.auth_header["Authorization"].split(" ")[1]
+        claims = jwt.decode(
+            token, algorithms=[JWT_ALG], options={"verify_signature": False}
+        )
+        self.assertEqual(claims["user_id"], self.user.username)
+
+        service = get_config(DowcConfig).service
+        self.assertEqual(service.auth_type, AuthTypes.zgw)
+        self.assertEqual(service.user_id, "zac")
+
     def test_service_faulty_configuration(self, m):
         self.service.header_value = ""
         self.service.save()
@@ -11,6 +11,8 @@ from zac.contrib.kadaster.bag import A_DAY, LocationServer
 from zac.contrib.kadaster.client import override_zds_client
 from zac.contrib.kadaster.data import AddressSearchResponse, Pand, Verblijfsobject
 from zac.contrib.kadaster.models import KadasterConfig
+from zac.contrib.kadaster.suggestions import get_suggestion_cache, is_superseded
+from zac.core.config_snapshot import get_config
 from zac.utils.decorators import cache, optional_service
 from zac.zgw_client import ZGWClient
 
@@ -20,7 +22,7 @@ def get_location_server_client() -> LocationServer:
 
 
 def get_bag_client() -> ZGWClient:
-    config = KadasterConfig.get_solo()
+    config = get_config(KadasterConfig)
     assert config.service, "A service must be configured first"
     service = config.service
     client = service.build_client()
@@ -30,8 +32,29 @@ def get_bag_client() -> ZGWClient:
     return client
 
 
+EMPTY_SUGGESTIONS = {
+    "response": {"numFound": 0, "start": 0, "maxScore": 0, "docs": []},
+    "spellcheck": {"suggestions": []},
+}
+
+
 @optional_service
-def get_address_suggestions(query: str) -> List[AddressSearchResponse]:
+def get_address_suggestions(
+    query: str, debounce_key=None
+) -> List[AddressSearchResponse]:
+    """
+    Get the address suggestions for the query from the PDOK locatieserver.
+
+    If ``debounce_key`` is given, the locatieserver is not called if a newer request
+    is made for the same key, see :func:`zac.contrib.kadaster.suggestions.is_superseded`.
+    """
+    suggestion_cache = get_suggestion_cache()
+    if (results := suggestion_cache.get(query)) is not None:
+        return factory(AddressSearchResponse, results)
+
+    if debounce_key is not None and is_superseded(debounce_key):
+        return factory(AddressSearchResponse, EMPTY_SUGGESTIONS)
+
     client = get_location_server_client()
     results = client.suggest({"q": query, "fq": "bron:bag AND type:adres"})
     # Fix ugly spellcheck results wtf
@@ -42,6 +65,7 @@ def get_address_suggestions(query: str) -> List[AddressSearchResponse]:
             {"search_term": search_term, **suggestion}
             for search_term, suggestion in zip(search_terms, suggestions)
         ]
+    suggestion_cache.set(query, results)
     return factory(AddressSearchResponse, results)
 
 
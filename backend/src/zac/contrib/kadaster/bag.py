@@ -4,6 +4,7 @@ from django.conf import settings
 
 from zgw_consumers.concurrent import parallel
 
+from zac.core.config_snapshot import get_config
 from zac.core.utils import A_DAY
 from zac.utils.decorators import cache
 from zac.utils.http import get_session
@@ -13,7 +14,7 @@ from .models import KadasterConfig
 
 class Bag:
     def __init__(self):
-        config = KadasterConfig.get_solo()
+        config = get_config(KadasterConfig)
         self.url = config.service.api_root
         self.headers = config.service.get_auth_header(self.url)
         self._session = get_session()
@@ -34,7 +35,7 @@ class Bag:
 
 class LocationServer:
     def __init__(self):
-        config = KadasterConfig.get_solo()
+        config = get_config(KadasterConfig)
         self.url = config.locatieserver
         self._session = get_session()
 
@@ -0,0 +1,179 @@
+"""
+Process-local cache of the address suggestions of the PDOK locatieserver.
+
+The address picker requests suggestions on every keystroke. The results are kept
+per normalized query, and a query is answered from the results of a shorter query
+it starts with ("domplein 2" from "domplein") if the locatieserver returned all
+results of the shorter query, by only keeping the suggestions matching every term
+of the longer query.
+
+Additionally, a request waits ``ADDRESS_SUGGESTIONS_DEBOUNCE`` seconds before it
+calls the locatieserver, and gives up if the same user made a newer request in the
+meantime - the address picker is no longer interested in its results.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+LATEST_REQUEST_KEY = "adres-suggest:latest:{key}"
+
+# queries using Solr syntax can't be answered from the results of another query
+PLAIN_QUERY = re.compile(r"^[\w\s,.'/-]+$")
+SOLR_OPERATORS = {"and", "or", "not"}
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def get_terms(value: str) -> List[str]:
+    return value.lower().replace(",", " ").split()
+
+
+def is_plain_query(query: str) -> bool:
+    return bool(PLAIN_QUERY.match(query)) and not (SOLR_OPERATORS & set(query.split()))
+
+
+def is_complete(results: Dict) -> bool:
+    response = results["response"]
+    return response["start"] == 0 and response["numFound"] <= len(response["docs"])
+
+
+def filter_results(results: Dict, query: str) -> Dict:
+    """
+    Keep the suggestions of which the name matches every term of the query.
+    """
+    terms = get_terms(query)
+
+    def matches(doc: Dict) -> bool:
+        doc_terms = get_terms(doc["weergavenaam"])
+        return all(
+            any(doc_term.startswith(term) for doc_term in doc_terms) for term in terms
+        )
+
+    docs = [doc for doc in results["response"]["docs"] if matches(doc)]
+    return {
+        "response": {
+            **results["response"],
+            "numFound": len(docs),
+            "maxScore": max((doc["score"] for doc in docs), default=0),
+            "docs": docs,
+        },
+        "highlighting": {
+            doc["id"]: results["highlighting"][doc["id"]]
+            for doc in docs
+            if doc["id"] in results.get("highlighting", {})
+        },
+        # the spellcheck suggestions belong to the other query
+        "spellcheck": {"suggestions": []},
+    }
+
+
+@dataclass(frozen=True)
+class CachedSuggestions:
+    expires_at: float
+    results: Dict
+    complete: bool
+
+
+class SuggestionCache:
+    def __init__(self, timeout: float, max_entries: int):
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedSuggestions]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_entry(self, query: str, now: float) -> Optional[CachedSuggestions]:
+        entry = self._entries.get(query)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[query]
+            return None
+        self._entries.move_to_end(query)
+        return entry
+
+    def get(self, query: str) -> Optional[Dict]:
+        query = normalize_query(query)
+        now = time.monotonic()
+        with self._lock:
+            if (entry := self._get_entry(query, now)) is not None:
+                return entry.results
+            if not is_plain_query(query):
+                return None
+
+            for end in range(len(query) - 1, 0, -1):
+                entry = self._get_entry(query[:end], now)
+                if entry is not None and entry.complete:
+                    return filter_results(entry.results, query)
+        return None
+
+    def set(self, query: str, results: Dict) -> None:
+        if self.timeout <= 0 or self.max_entries <= 0:
+            return
+
+        query = normalize_query(query)
+        entry = CachedSuggestions(
+            expires_at=time.monotonic() + self.timeout,
+            results=results,
+            complete=is_plain_query(query) and is_complete(results),
+        )
+        with self._lock:
+            self._entries[query] = entry
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_suggestion_cache = None
+_lock = threading.Lock()
+
+
+def get_suggestion_cache() -> SuggestionCache:
+    global _suggestion_cache
+
+    if _suggestion_cache is None:
+        with _lock:
+            if _suggestion_cache is None:
+                _suggestion_cache = SuggestionCache(
+                    timeout=settings.ADDRESS_SUGGESTIONS_CACHE_TIMEOUT,
+                    max_entries=settings.ADDRESS_SUGGESTIONS_CACHE_MAX_ENTRIES,
+                )
+    return _suggestion_cache
+
+
+def reset_suggestion_cache() -> None:
+    global _suggestion_cache
+
+    with _lock:
+        _suggestion_cache = None
+
+
+def is_superseded(key) -> bool:
+    """
+    Register a request for ``key`` and wait for newer requests for the same key.
+
+    Returns ``True`` if a newer request was made within the debounce delay.
+    """
+    delay = settings.ADDRESS_SUGGESTIONS_DEBOUNCE
+    if not delay:
+        return False
+
+    cache_key = LATEST_REQUEST_KEY.format(key=key)
+    # seed the counter atomically, so concurrent first requests get distinct ids
+    cache.add(cache_key, 0, timeout=60)
+    try:
+        request_id = cache.incr(cache_key)
+    except ValueError:
+        # the counter expired in the meantime, don't hold up the request
+        return False
+
+    time.sleep(delay)
+    return cache.get(cache_key) != request_id
@@ -143,6 +143,56 @@ class KadasterAPITests(ClearCachesMixin, APITransactionTestCase):
             },
         )
 
+    def test_get_address_suggestions_cached(self, m):
+        response = {
+            "response": {
+                "numFound": 2,
+                "start": 0,
+                "maxScore": 25.37018,
+                "docs": [
+                    {
+                        "type": "adres",
+                        "weergavenaam": "Some-street 11, 9999XX Some-city",
+                        "id": "adr-09asnd9as0ndas09dnas09ndsa",
+                        "score": 25.37018,
+                    },
+                    {
+                        "type": "adres",
+                        "weergavenaam": "Some-street 2, 9999XX Some-city",
+                        "id": "adr-1n2b3v4c5x6z7a8s9d0f1g2h3j",
+                        "score": 24.1,
+                    },
+                ],
+            },
+            "spellcheck": {"suggestions": [], "collations": []},
+        }
+        m.get(
+            f"{LOCATION_SERVER_ROOT}suggest?q=some-street&fq=bron:bag%20AND%20type:adres",
+            json=response,
+        )
+        url = furl(reverse("kadaster:adres-autocomplete"))
+
+        for query in ["some-street", "Some-street ", "some-street 1"]:
+            with self.subTest(query=query):
+                url.args["q"] = query
+                response = self.client.get(url.url)
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            response.json()["response"]["docs"],
+            [
+                {
+                    "type": "adres",
+                    "weergavenaam": "Some-street 11, 9999XX Some-city",
+                    "id": "adr-09asnd9as0ndas09dnas09ndsa",
+                    "score": 25.37018,
+                }
+            ],
+        )
+        self.assertEqual(
+            len([req for req in m.request_history if "suggest" in req.url]), 1
+        )
+
     def test_fail_get_address_suggestions(self, m):
         search_term = "Some-street"
 
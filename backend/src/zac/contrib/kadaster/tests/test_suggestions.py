@@ -0,0 +1,107 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from ..suggestions import LATEST_REQUEST_KEY, SuggestionCache, is_superseded
+
+
+def get_results(*names: str, num_found=None) -> dict:
+    docs = [
+        {"type": "adres", "weergavenaam": name, "id": f"adr-{i}", "score": 10 - i}
+        for i, name in enumerate(names)
+    ]
+    return {
+        "response": {
+            "numFound": len(docs) if num_found is None else num_found,
+            "start": 0,
+            "maxScore": 10,
+            "docs": docs,
+        },
+        "highlighting": {doc["id"]: {"suggest": [doc["weergavenaam"]]} for doc in docs},
+        "spellcheck": {"suggestions": []},
+    }
+
+
+class SuggestionCacheTests(SimpleTestCase):
+    def test_exact_query(self):
+        suggestion_cache = SuggestionCache(timeout=60, max_entries=10)
+        results = get_results("Domplein 21, 3512JC Utrecht", num_found=100)
+
+        suggestion_cache.set("Domplein ", results)
+
+        self.assertEqual(suggestion_cache.get("domplein"), results)
+        self.assertIsNone(suggestion_cache.get("domplein 2"))
+
+    def test_prefix_of_complete_results(self):
+        suggestion_cache = SuggestionCache(timeout=60, max_entries=10)
+        suggestion_cache.set(
+            "Domplein",
+            get_results(
+                "Domplein 1, 3512JC Utrecht",
+                "Domplein 21, 3512JC Utrecht",
+                "Domplein 3, 3512JD Utrecht",
+            ),
+        )
+
+        results = suggestion_cache.get("Domplein 2")
+
+        self.assertEqual(results["response"]["numFound"], 1)
+        self.assertEqual(
+            [doc["id"] for doc in results["response"]["docs"]],
+            ["adr-1"],
+        )
+        self.assertEqual(list(results["highlighting"]), ["adr-1"])
+        self.assertIsNone(suggestion_cache.get('Domplein AND "2"'))
+
+    def test_timeout_and_max_entries(self):
+        suggestion_cache = SuggestionCache(timeout=60, max_entries=2)
+        suggestion_cache.set("a", get_results())
+        suggestion_cache.set("b", get_results())
+        suggestion_cache.get("a")
+        suggestion_cache.set("c", get_results())
+
+        self.assertIsNotNone(suggestion_cache.get("a"))
+        self.assertIsNone(suggestion_cache.get("b"))
+
+        with patch("zac.contrib.kadaster.suggestions.time.monotonic") as monotonic:
+            monotonic.return_value = float("inf")
+            self.assertIsNone(suggestion_cache.get("a"))
+
+
+@override_settings(ADDRESS_SUGGESTIONS_DEBOUNCE=0.1)
+class DebounceTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @patch("zac.contrib.kadaster.suggestions.time.sleep")
+    def test_latest_request(self, mock_sleep):
+        self.assertFalse(is_superseded(1))
+        self.assertFalse(is_superseded(1))
+        mock_sleep.assert_called_with(0.1)
+
+    @patch("zac.contrib.kadaster.suggestions.time.sleep")
+    def test_superseded_request(self, mock_sleep):
+        key = LATEST_REQUEST_KEY.format(key=1)
+        # a newer request comes in while waiting
+        mock_sleep.side_effect = lambda delay: cache.incr(key)
+
+        self.assertTrue(is_superseded(1))
+
+    @patch("zac.contrib.kadaster.suggestions.time.sleep")
+    def test_concurrent_first_requests(self, mock_sleep):
+        key = LATEST_REQUEST_KEY.format(key=1)
+        add = cache.add
+
+        def concurrent_add(*args, **kwargs):
+            # another first request seeds and increments the counter at the same time
+            add(*args, **kwargs)
+            cache.incr(key)
+            return False
+
+        with patch.object(cache, "add", side_effect=concurrent_add):
+            self.assertFalse(is_superseded(1))
+
+        self.assertEqual(cache.get(key), 2)
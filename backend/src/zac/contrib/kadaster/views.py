@@ -55,7 +55,7 @@ class AdresSearchView(APIView):
         if not query:
             raise serializers.ValidationError(_("Missing query parameter 'q'"))
 
-        instances = get_address_suggestions(query)
+        instances = get_address_suggestions(query, debounce_key=request.user.pk)
         serializer = self.serializer_class(instance=instances)
         return Response(serializer.data)
 
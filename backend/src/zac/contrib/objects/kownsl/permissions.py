@@ -31,20 +31,7 @@ class CanReadZakenReviewRequests(CanReadZaken):
             except ObjectDoesNotExist:
                 raise Http404(f"No ZAAK is found for url: {obj.zaak}.")
 
-        permission_name = self.get_permission(request).name
-        # first check atomic permissions - this checks both atomic permissions directly attached to the user
-        # and atomic permissions defined to authorization profiles
-        if self.user_atomic_permissions_exists(
-            request, permission_name, obj_url=obj.url
-        ):
-            return True
-
-        # then check blueprint permissions
-        for permission in self.get_blueprint_permissions(request, permission_name):
-            if permission.has_access(obj, request.user, permission_name):
-                return True
-
-        return False
+        return super().has_object_permission(request, view, obj)
 
 
 class CanUpdateZakenReviewRequests(CanUpdateZaken):
@@ -58,20 +45,7 @@ class CanUpdateZakenReviewRequests(CanUpdateZaken):
             except ObjectDoesNotExist:
                 raise Http404(f"No ZAAK is found for url: {obj.zaak}.")
 
-        permission_name = self.get_permission(request).name
-        # first check atomic permissions - this checks both atomic permissions directly attached to the user
-        # and atomic permissions defined to authorization profiles
-        if self.user_atomic_permissions_exists(
-            request, permission_name, obj_url=obj.url
-        ):
-            return True
-
-        # then check blueprint permissions
-        for permission in self.get_blueprint_permissions(request, permission_name):
-            if permission.has_access(obj, request.user, permission_name):
-                return True
-
-        return False
+        return super().has_object_permission(request, view, obj)
 
 
 class CanReadOrUpdateReviews(BaseConditionalPermission):
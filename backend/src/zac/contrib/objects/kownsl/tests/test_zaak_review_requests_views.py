@@ -414,6 +414,7 @@ class ZaakReviewRequestsResponseTests(ClearCachesMixin, APITestCase):
                             "omschrijving": self.informatieobjecttype["omschrijving"],
                         },
                         "lastEditedDate": None,
+                        "lastEditedBy": None,
                         "locked": self.document["locked"],
                         "lockedBy": "",
                         "readUrl": "",
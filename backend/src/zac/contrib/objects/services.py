@@ -9,6 +9,7 @@ from django.utils.translation import gettext_lazy as _
 
 from djangorestframework_camel_case.settings import api_settings
 from djangorestframework_camel_case.util import camelize, underscoreize
+from elasticsearch_dsl import Search
 from zgw_consumers.api_models.base import factory
 from zgw_consumers.api_models.catalogi import ZaakType
 from zgw_consumers.api_models.zaken import ZaakObject
@@ -17,6 +18,7 @@ from zgw_consumers.concurrent import parallel
 from zac.accounts.models import User
 from zac.contrib.objects.checklists.data import Checklist, ChecklistType
 from zac.core.camunda.start_process.data import StartCamundaProcessForm
+from zac.core.config_snapshot import get_config
 from zac.core.models import MetaObjectTypesConfig
 from zac.core.services import (
     create_object,
@@ -27,7 +29,8 @@ from zac.core.services import (
     search_objects,
     update_object_record_data,
 )
-from zac.core.utils import A_DAY
+from zac.core.utils import A_DAY, fetch_next_url_pagination
+from zac.elasticsearch.searches import iter_search_chunks, search_meta_objects
 from zac.utils.decorators import cache
 from zgw.models import Zaak
 
@@ -49,7 +52,7 @@ def _search_meta_objects(
     page_size: int = 100,
 ) -> Union[List[dict], Tuple[Dict, Dict]]:
 
-    config = MetaObjectTypesConfig.get_solo()
+    config = get_config(MetaObjectTypesConfig)
     ot_url = getattr(config, objecttype_name, None)
     if not ot_url:
         logger.warning(
@@ -114,7 +117,7 @@ def create_meta_object_and_relate_to_zaak(
 ) -> Dict:
     # Get URL-reference to objecttype
     objecttype_url = getattr(
-        MetaObjectTypesConfig.get_solo(), f"{objecttype_str}_objecttype"
+        get_config(MetaObjectTypesConfig), f"{objecttype_str}_objecttype"
     )
     objecttype = fetch_objecttype(objecttype_url)
 
@@ -309,64 +312,47 @@ def fetch_checklist(
     return None
 
 
-def fetch_all_unanswered_checklists_for_user(user: User) -> List[dict]:
-    data_attrs = [f"answers__icontains__{user.username}", "locked__icontains__false"]
-    if objs := _search_meta_objects("checklist_objecttype", data_attrs=data_attrs):
-        checklists = [
-            underscoreize(
-                obj["record"]["data"],
-                **api_settings.JSON_UNDERSCOREIZE,
+def _search_meta_object_documents(objecttype_name: str, **kwargs) -> Optional[Search]:
+    config = get_config(MetaObjectTypesConfig)
+    ot_url = getattr(config, objecttype_name, None)
+    if not ot_url:
+        logger.warning(
+            "`{objecttype_name}` objecttype is not configured in core configuration or does not exist in the configured objecttype service.".format(
+                objecttype_name=objecttype_name
             )
-            for obj in objs
-        ]
-        filtered = []
-        for checklist in checklists:
-            if any(
-                [
-                    answer
-                    for answer in checklist["answers"]
-                    if user.username == answer.get("user_assignee")
-                    and not answer["answer"]
-                ]
-            ):
-                filtered.append(checklist)
-        return filtered
-    return []
+        )
+        return None
+    return search_meta_objects(ot_url, **kwargs)
+
+
+def _get_meta_object_records(search: Search) -> List[dict]:
+    return [
+        underscoreize(hit.record_data.to_dict(), **api_settings.JSON_UNDERSCOREIZE)
+        for hits in iter_search_chunks(search.source(["record_data"]))
+        for hit in hits
+    ]
+
+
+def fetch_all_unanswered_checklists_for_user(user: User) -> List[dict]:
+    search = _search_meta_object_documents(
+        "checklist_objecttype", open_user_assignees=user.username, locked=False
+    )
+    if search is None:
+        return []
+    return _get_meta_object_records(search)
 
 
 def fetch_all_checklists_for_user_groups(user: User) -> List[dict]:
-    groupnames = user.groups.all().values_list("name", flat=True)
-    data_attrs_list = [[f"answers__icontains__{group}"] for group in groupnames]
-
-    def _search_checklists_objects(data_attrs: List[str]) -> List[dict]:
-        if objs := _search_meta_objects("checklist_objecttype", data_attrs=data_attrs):
-            return [
-                underscoreize(
-                    obj["record"]["data"],
-                    **api_settings.JSON_UNDERSCOREIZE,
-                )
-                for obj in objs
-            ]
+    groupnames = list(user.groups.all().values_list("name", flat=True))
+    if not groupnames:
         return []
 
-    with parallel(max_workers=settings.MAX_WORKERS) as executor:
-        results = executor.map(_search_checklists_objects, data_attrs_list)
-    final_results = []
-    for result in results:
-        if result:
-            filtered = []
-            for checklist in result:
-                if any(
-                    [
-                        answer
-                        for answer in checklist["answers"]
-                        if answer.get("group_assignee") in groupnames
-                        and not answer["answer"]
-                    ]
-                ):
-                    filtered.append(checklist)
-            final_results += filtered
-    return final_results
+    search = _search_meta_object_documents(
+        "checklist_objecttype", open_group_assignees=groupnames
+    )
+    if search is None:
+        return []
+    return _get_meta_object_records(search)
 
 
 def fetch_checklist_zaakobject(
@@ -538,43 +524,51 @@ def get_review_requests_paginated(
     zaak: Optional[Zaak] = None,
     requester: Optional[User] = None,
     not_locked: Optional[bool] = False,
-    latest_version: Optional[bool] = True,
     page_size: int = 100,
-) -> Tuple[List[Dict], Dict]:
+) -> Tuple[Dict, Dict]:
+    """
+    Return a page of the review requests, newest first.
 
-    data_attrs = []
+    The response and the returned query parameters follow the paginated search in the
+    Objects API.
+    """
+    query_params = {"pageSize": page_size, "page": 1, **(query_params or {})}
+    page_size = int(query_params["pageSize"])
+    page = int(query_params["page"])
 
-    if zaak:
-        data_attrs += [f"zaak__exact__{zaak.url}"]
-    if requester:
-        data_attrs += [f"requester__username__exact__{requester.username}"]
-    if not_locked:
-        data_attrs += [f"locked__icontains__false"]
-    if latest_version:
-        future_date = datetime.date.today() + datetime.timedelta(
-            days=100 * 365
-        )  # 100 years lawl
-
-    response, query_params = _search_meta_objects(
+    response = {"count": 0, "next": None, "previous": None, "results": []}
+    search = _search_meta_object_documents(
         "review_request_objecttype",
-        data_attrs=data_attrs,
-        extra_kwargs={"date": future_date.isoformat()} if latest_version else None,
-        paginated=True,
-        page_size=page_size,
-        query_params=query_params,
+        ordering=("-created",),
+        zaak=zaak.url if zaak else None,
+        requester=requester.username if requester else None,
+        locked=False if not_locked else None,
+    )
+    if search is None:
+        return response, fetch_next_url_pagination(response, query_params)
+
+    search = search.source(["record_data"]).extra(
+        from_=(page - 1) * page_size, size=page_size, track_total_hits=True
     )
-    review_requests = [
-        factory_review_request(rr["record"]["data"]) for rr in response["results"]
+    results = search.execute()
+    response["count"] = results.hits.total.value
+    if page * page_size < response["count"]:
+        response["next"] = f"?page={page + 1}&pageSize={page_size}"
+    if page > 1:
+        response["previous"] = f"?page={page - 1}&pageSize={page_size}"
+    response["results"] = [
+        factory_review_request(hit.record_data.to_dict()) for hit in results
     ]
-    response["results"] = review_requests
-    return response, query_params
+    return response, fetch_next_url_pagination(response, query_params)
 
 
 def count_review_requests_by_user(requester: User) -> Optional[int]:
-    response, query_params = get_review_requests_paginated(
-        requester=requester, page_size=1, not_locked=True
+    search = _search_meta_object_documents(
+        "review_request_objecttype", requester=requester.username, locked=False
     )
-    return response.get("count", None)
+    if search is None:
+        return None
+    return search.count()
 
 
 ###################################################
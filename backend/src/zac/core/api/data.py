@@ -29,6 +29,7 @@ class AuditTrailData(Model):
     aanmaakdatum: datetime
     wijzigingen: AuditTrailWijzigingenData
     resource_url: str
+    gebruikers_weergave: str = ""
 
     @property
     def was_bumped(self) -> bool:
@@ -41,3 +42,7 @@ class AuditTrailData(Model):
         if modified := self.wijzigingen.nieuw.modified:
             return modified
         return self.aanmaakdatum
+
+    @property
+    def last_edited_by(self) -> Optional[str]:
+        return self.wijzigingen.nieuw.author or self.gebruikers_weergave or None
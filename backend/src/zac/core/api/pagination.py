@@ -1,6 +1,7 @@
 from collections import OrderedDict
 
 from furl import furl
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination, _positive_int
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -37,6 +38,20 @@ class BffPagination(PageNumberPagination):
 
         return self.page_size
 
+    def get_page_number_or_404(self, request) -> int:
+        """
+        Return the requested page number, for views that paginate by themselves.
+        """
+        page_number = request.query_params.get(self.page_query_param, 1)
+        try:
+            return _positive_int(page_number, strict=True)
+        except (TypeError, ValueError):
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message="Not a positive integer."
+                )
+            )
+
 
 class ProxyPagination(BffPagination):
     """
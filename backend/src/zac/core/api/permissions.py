@@ -53,20 +53,10 @@ class CanForceEditClosedZaak(ZaakDefinitionPermission):
         if request.user.is_superuser:
             return True
 
-        atomic_permission_for_obj = self.user_atomic_permissions_exists(
-            request, zaken_geforceerd_bijwerken.name, obj_url=obj.url
-        )
-        atomic_permission_for_obj_type = self.user_atomic_permissions_exists(
-            request, zaken_geforceerd_bijwerken.name
-        )
-        blueprint_permission = self.get_blueprint_permissions(
-            request, zaken_geforceerd_bijwerken.name
-        ).exists()
-        return (
-            atomic_permission_for_obj
-            or atomic_permission_for_obj_type
-            or blueprint_permission
-        )
+        snapshot = self.get_permission_snapshot(request)
+        return snapshot.has_atomic(
+            zaken_geforceerd_bijwerken.name, obj.url
+        ) or snapshot.has_any(self.object_type, zaken_geforceerd_bijwerken.name)
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         if request.method in permissions.SAFE_METHODS:
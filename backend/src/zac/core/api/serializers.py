@@ -56,6 +56,7 @@ from zac.contrib.dowc.constants import DocFileTypes
 from zac.contrib.dowc.fields import DowcUrlField
 from zac.contrib.objects.services import fetch_start_camunda_process_form_for_zaaktype
 from zac.core.camunda.utils import resolve_assignee
+from zac.core.config_snapshot import get_config
 from zac.core.fields import DownloadDocumentURLField
 from zac.core.models import MetaObjectTypesConfig
 from zac.core.rollen import Rol
@@ -1633,9 +1634,8 @@ class ObjectFilterProxySerializer(ProxySerializer):
         if ot not in [ot["url"] for ot in ots]:
             raise serializers.ValidationError("OBJECTTYPE %s not found." % ot)
 
-        meta_config = MetaObjectTypesConfig.get_solo()
-        meta_config.meta_objecttype_urls
-        if ot in list(MetaObjectTypesConfig.get_solo().meta_objecttype_urls.values()):
+        meta_config = get_config(MetaObjectTypesConfig)
+        if ot in meta_config.meta_objecttype_urls.values():
             raise serializers.ValidationError(
                 "OBJECTTYPE %s is a `meta`-objecttype." % ot
             )
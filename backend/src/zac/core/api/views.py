@@ -1,9 +1,8 @@
-import base64
 import logging
 from copy import deepcopy
 from datetime import date, datetime
 from itertools import groupby
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
@@ -51,6 +50,7 @@ from zac.contrib.objects.services import (
 )
 from zac.core.camunda.start_process.serializers import CreatedProcessInstanceSerializer
 from zac.core.camunda.utils import resolve_assignee
+from zac.core.config_snapshot import get_config
 from zac.core.models import MetaObjectTypesConfig
 from zac.core.services import (
     fetch_objecttype_version,
@@ -60,11 +60,13 @@ from zac.core.services import (
     update_zaak_eigenschap,
 )
 from zac.elasticsearch.api import update_informatieobject_document
+from zac.elasticsearch.writer import read_your_writes
 from zac.utils.exceptions import PermissionDeniedSerializer
 from zac.utils.filters import ApiFilterBackend
 from zgw.models.zrc import Zaak
 
 from ..cache import invalidate_zaak_cache, invalidate_zaakobjecten_cache
+from ..rollen import resolve_natuurlijkpersonen
 from ..services import (
     create_document,
     create_rol,
@@ -709,7 +711,7 @@ class ZaakRolesView(GetZaakMixin, views.APIView):
     )
     def get(self, request, *args, **kwargs):
         zaak = self.get_object()
-        rollen = get_rollen(zaak)
+        rollen = resolve_natuurlijkpersonen(get_rollen(zaak))
         serializer = self.get_serializer(instance=rollen, many=True)
         return Response(serializer.data)
 
@@ -905,16 +907,12 @@ class ZaakDocumentView(views.APIView):
 
         uploaded_file = validated_data.pop("file", None)
         if uploaded_file:
-            with uploaded_file.open("rb") as content:
-                inhoud = base64.b64encode(content.read())
-
             document_data.update(
                 {
                     "bestandsnaam": uploaded_file.name,
                     "formaat": uploaded_file.content_type,
-                    "inhoud": inhoud.decode(
-                        "ascii"
-                    ),  # it's base64, so ascii compatible
+                    # encoded to base64 when it's sent to the DRC
+                    "inhoud": uploaded_file,
                     "titel": uploaded_file.name,
                     "bestandsomvang": uploaded_file.size,
                 }
@@ -984,8 +982,9 @@ class ZaakDocumentView(views.APIView):
             document.informatieobjecttype
         )
 
-        # update elasticsearch index
-        update_informatieobject_document(document)
+        # update elasticsearch index, the documents of the zaak are reloaded right after
+        with read_your_writes():
+            update_informatieobject_document(document)
 
         serializer = self.get_response_serializer(document)
         return Response(serializer.data)
@@ -1020,8 +1019,9 @@ class ZaakDocumentView(views.APIView):
             document.informatieobjecttype
         )
 
-        # add to elasticsearch index
-        update_informatieobject_document(document)
+        # add to elasticsearch index, the documents of the zaak are reloaded right after
+        with read_your_writes():
+            update_informatieobject_document(document)
 
         serializer = self.get_response_serializer(document)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -1328,7 +1328,7 @@ class ObjecttypeListView(views.APIView):
             raise exceptions.ValidationError(filterset.errors)
 
         meta_ot_urls = list(
-            MetaObjectTypesConfig.get_solo().meta_objecttype_urls.values()
+            get_config(MetaObjectTypesConfig).meta_objecttype_urls.values()
         )
 
         objecttypes = [
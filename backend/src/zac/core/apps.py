@@ -9,11 +9,12 @@ class CoreConfig(AppConfig):
     verbose_name = _("zaakafhandelcomponent")
 
     def ready(self):
-        from . import blueprints  # noqa
+        from . import blueprints, checks, signals  # noqa
         from .camunda.select_documents import context  # noqa
         from .camunda.zet_resultaat import context  # noqa
 
         request_finished.connect(clear_request_cache)
+        signals.connect_config_signals()
 
         # Patch zgw-consumers Service model for backward compatibility with 1.x
         from zgw_consumers.client import build_client as _build_client
@@ -32,6 +33,13 @@ class CoreConfig(AppConfig):
 
         Service.build_client = build_client
 
+        # Run the work handed to zgw-consumers' parallel in the caller's context
+        import zgw_consumers.concurrent
+
+        from zac.utils.concurrent import wrap_fn
+
+        zgw_consumers.concurrent.wrap_fn = wrap_fn
+
         # Patch zgw-consumers Document model for zgw-consumers 1.x compatibility
         # Fix broken get_vertrouwelijkheidaanduiding_display method
         from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
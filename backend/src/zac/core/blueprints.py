@@ -1,10 +1,11 @@
 import operator
+from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from django.utils.translation import gettext_lazy as _
 
-from elasticsearch_dsl.query import Query, Range, Term
+from elasticsearch_dsl.query import Bool, Query, Range, Term, Terms
 from rest_framework import serializers
 from zgw_consumers.api_models.constants import (
     RolOmschrijving,
@@ -19,6 +20,7 @@ from zac.accounts.permissions import Blueprint, PermissionObjectType
 from zac.core.services import fetch_catalogus
 from zgw.models.zrc import Zaak
 
+from .informatieobjecttypen import get_informatieobjecttype_registry
 from .permissions import zaken_handle_access
 
 
@@ -55,31 +57,42 @@ class ZaakTypeBlueprint(Blueprint):
         ]
         return bool(user_rollen)
 
-    def has_access(self, zaak: Zaak, permission: str = None):
-        # special case for zaken_handle_access permission:
-        if permission == zaken_handle_access.name:
-            user = self.context.get("user")
-
-            if not user or not self.is_zaak_behandelaar(user, zaak):
-                return False
+    @classmethod
+    def get_policy_key(cls, policy: dict) -> Tuple[str, str]:
+        return policy["catalogus"], policy["zaaktype_omschrijving"]
 
+    @classmethod
+    def get_object_key(cls, zaak: Zaak) -> Tuple[str, str]:
         zaaktype = zaak.zaaktype
         if isinstance(zaaktype, str):
             from .services import fetch_zaaktype
 
             zaaktype = fetch_zaaktype(zaaktype)
 
-        if isinstance(zaaktype.catalogus, str):
-            from .services import fetch_catalogus
+        catalogus = zaaktype.catalogus
+        if isinstance(catalogus, str):
+            catalogus = fetch_catalogus(catalogus)
 
-            catalogus = fetch_catalogus(zaaktype.catalogus)
+        return catalogus.domein, zaaktype.omschrijving
 
+    @classmethod
+    def check_requester(cls, zaak: Zaak, permission: str = None, user=None) -> bool:
+        # special case for zaken_handle_access permission:
+        if permission == zaken_handle_access.name:
+            return bool(user) and cls.is_zaak_behandelaar(user, zaak)
+        return True
+
+    def has_access(self, zaak: Zaak, permission: str = None):
+        if not self.check_requester(zaak, permission, user=self.context.get("user")):
+            return False
+
+        catalogus, omschrijving = self.get_object_key(zaak)
         current_va_order = VA_ORDER[zaak.vertrouwelijkheidaanduiding]
         max_va_order = VA_ORDER[self.data["max_va"]]
 
         return (
-            catalogus.domein == self.data["catalogus"]
-            and zaaktype.omschrijving == self.data["zaaktype_omschrijving"]
+            catalogus == self.data["catalogus"]
+            and omschrijving == self.data["zaaktype_omschrijving"]
             and current_va_order <= max_va_order
         )
 
@@ -99,6 +112,30 @@ class ZaakTypeBlueprint(Blueprint):
         ]
         return query if on_nested_field else reduce(operator.and_, query)
 
+    @classmethod
+    def search_query_for_policies(
+        cls, policies: Dict[Tuple[str, str], int], on_nested_field: Optional[str] = ""
+    ) -> List[Query]:
+        # group the policies per catalogus and VA - this keeps the number of
+        # clauses small, regardless of the number of zaaktypen
+        groups = defaultdict(list)
+        for (catalogus, omschrijving), max_va_order in policies.items():
+            groups[(catalogus, max_va_order)].append(omschrijving)
+
+        prefix = f"{on_nested_field}__" if on_nested_field else ""
+        return [
+            Bool(
+                filter=[
+                    Term(**{f"{prefix}zaaktype__catalogus_domein": catalogus}),
+                    Terms(
+                        **{f"{prefix}zaaktype__omschrijving": sorted(omschrijvingen)}
+                    ),
+                    Range(**{f"{prefix}va_order": {"lte": max_va_order}}),
+                ]
+            )
+            for (catalogus, max_va_order), omschrijvingen in sorted(groups.items())
+        ]
+
     def short_display(self):
         return f"{self.data['zaaktype_omschrijving']} ({self.data['max_va']})"
 
@@ -126,24 +163,23 @@ class InformatieObjectTypeBlueprint(Blueprint):
         help_text=_("Maximum vertrouwelijkheidaanduiding of the INFORMATIEOBJECT"),
     )
 
-    def has_access(self, document: Document, permission: str = None):
-        iotype = document.informatieobjecttype
-        if isinstance(iotype, str):
-            from .services import get_informatieobjecttype
+    @classmethod
+    def get_policy_key(cls, policy: dict) -> Tuple[str, str]:
+        return policy["catalogus"], policy["iotype_omschrijving"]
 
-            iotype = get_informatieobjecttype(iotype)
-
-        if isinstance(iotype.catalogus, str):
-            from .services import fetch_catalogus
-
-            catalogus = fetch_catalogus(iotype.catalogus)
+    @classmethod
+    def get_object_key(cls, document: Document) -> Tuple[str, str]:
+        registry = get_informatieobjecttype_registry()
+        return registry.get_key(document.informatieobjecttype)
 
+    def has_access(self, document: Document, permission: str = None):
+        catalogus, omschrijving = self.get_object_key(document)
         current_va_order = VA_ORDER[document.vertrouwelijkheidaanduiding]
         max_va_order = VA_ORDER[self.data["max_va"]]
 
         return (
-            catalogus.domein == self.data["catalogus"]
-            and iotype.omschrijving == self.data["iotype_omschrijving"]
+            catalogus == self.data["catalogus"]
+            and omschrijving == self.data["iotype_omschrijving"]
             and current_va_order <= max_va_order
         )
 
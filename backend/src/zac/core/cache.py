@@ -16,6 +16,11 @@ from zac.accounts.models import User
 from zac.client import Client
 from zgw.models.zrc import Zaak
 
+from .informatieobjecttypen import (
+    bump_registry_version as bump_informatieobjecttype_registry_version,
+)
+from .objecttypes import bump_registry_version
+
 logger = logging.getLogger(__name__)
 
 # All VA values sorted by order (from least to most confidential)
@@ -31,8 +36,9 @@ def is_redis_cache():
 
 
 def invalidate_zaaktypen_cache(catalogus: str = ""):
-    key = f"zaaktypen:{catalogus}"
-    cache.delete(key)
+    cache.delete_many(
+        [f"zaaktypen:{catalogus}", f"zaaktypen:omschrijvingen:{catalogus}"]
+    )
 
 
 def invalidate_fetch_zaaktype_cache(url: str):
@@ -40,10 +46,12 @@ def invalidate_fetch_zaaktype_cache(url: str):
     cache.delete(key)
 
 
-def invalidate_informatieobjecttypen_cache(catalogus: str = ""):
-    key = f"informatieobjecttypen:{catalogus}"
-    cache.delete(key)
-    cache.delete("get_all_informatieobjecttypen")
+def invalidate_informatieobjecttypen_cache(catalogus: str = "", url: str = ""):
+    keys = [f"informatieobjecttypen:{catalogus}", "get_all_informatieobjecttypen"]
+    if url:
+        keys.append(f"informatieobjecttype:{url}")
+    cache.delete_many(keys)
+    bump_informatieobjecttype_registry_version()
 
 
 def invalidate_zaak_cache(zaak: Zaak):
@@ -165,6 +173,11 @@ def invalidate_fetch_object_cache(object_url: str):
         cache.delete_pattern(f"*{object_url}*")
 
 
+def invalidate_objecttypes_cache():
+    cache.delete("objecttype:all")
+    bump_registry_version()
+
+
 def cache_document(
     url: str,
     response: Response,
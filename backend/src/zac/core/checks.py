@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+
+@register()
+def check_document_download_accel_redirect(app_configs, **kwargs):
+    """
+    Refuse to hand off document downloads to a proxy that doesn't authenticate.
+    """
+    location = settings.DOCUMENT_DOWNLOAD_ACCEL_REDIRECT
+    if not location:
+        return []
+
+    errors = []
+    if not settings.DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED:
+        errors.append(
+            Error(
+                "DOCUMENT_DOWNLOAD_ACCEL_REDIRECT is set, but the internal location "
+                "is not confirmed to authenticate with the DRC.",
+                hint=(
+                    "Configure the DRC credentials in the internal location of the "
+                    "reverse proxy and set DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED, "
+                    "or unset DOCUMENT_DOWNLOAD_ACCEL_REDIRECT. Until then, documents "
+                    "are streamed through ZAC."
+                ),
+                id="zac.core.E001",
+            )
+        )
+    if not (location.startswith("/") and location.endswith("/")):
+        errors.append(
+            Error(
+                "DOCUMENT_DOWNLOAD_ACCEL_REDIRECT must be the path of an internal "
+                "location, starting and ending with a slash.",
+                id="zac.core.E002",
+            )
+        )
+    return errors
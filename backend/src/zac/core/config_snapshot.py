@@ -0,0 +1,109 @@
+"""
+Process-local snapshot of the singleton configuration models.
+
+The configuration (``CoreConfig``, ``MetaObjectTypesConfig``, ``BRPConfig``...) is
+read on most requests, which used to be a database query for every
+``get_solo()``. :func:`get_config` reads it from a :class:`ConfigSnapshot` instead,
+which holds all singleton configurations of this process together with the
+services they refer to.
+
+Saving any configuration or service bumps the shared version (see
+:mod:`zac.core.signals`), after which every process rebuilds its snapshot on the
+next read. Snapshots are rebuilt after ``CONFIG_SNAPSHOT_TIMEOUT`` seconds as well.
+
+The configuration instances and their services are shared by all threads of the
+process, so they must be treated as read-only: use ``get_solo()`` to change the
+configuration, and copy a service before overriding its attributes for a single
+client (see :func:`zac.contrib.dowc.api.get_client`).
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Type, TypeVar
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+
+from solo.models import SingletonModel
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "config_snapshot:version"
+
+Config = TypeVar("Config", bound=SingletonModel)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    version: int = -1
+    built_at: float = 0
+    configs: Dict[Type[SingletonModel], SingletonModel] = field(default_factory=dict)
+
+    def is_valid(self, version: int) -> bool:
+        return (
+            self.version == version
+            and time.monotonic() - self.built_at < settings.CONFIG_SNAPSHOT_TIMEOUT
+        )
+
+
+def get_singleton_models() -> List[Type[SingletonModel]]:
+    return [model for model in apps.get_models() if issubclass(model, SingletonModel)]
+
+
+def load_config(model: Type[Config]) -> Config:
+    # load the services (and other relations) the configuration refers to as well
+    related = [field.name for field in model._meta.concrete_fields if field.many_to_one]
+    config, _ = model.objects.select_related(*related).get_or_create(
+        pk=model.singleton_instance_id
+    )
+    return config
+
+
+def build_snapshot(version: int = 0) -> ConfigSnapshot:
+    configs = {model: load_config(model) for model in get_singleton_models()}
+    logger.debug("Built configuration snapshot version %d", version)
+    return ConfigSnapshot(version=version, built_at=time.monotonic(), configs=configs)
+
+
+_snapshot = ConfigSnapshot()
+_lock = threading.Lock()
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    global _snapshot
+
+    version = cache.get(VERSION_KEY) or 0
+    if _snapshot.is_valid(version):
+        return _snapshot
+
+    with _lock:
+        # another thread may have rebuilt the snapshot in the meantime
+        if not _snapshot.is_valid(version):
+            _snapshot = build_snapshot(version=version)
+        return _snapshot
+
+
+def get_config(model: Type[Config]) -> Config:
+    """
+    Return the configuration of the singleton model, for reading.
+    """
+    if not settings.CONFIG_SNAPSHOT_TIMEOUT:
+        return load_config(model)
+    return get_config_snapshot().configs[model]
+
+
+def bump_config_version() -> None:
+    """
+    Rebuild the configuration snapshots of all processes on their next read.
+    """
+    global _snapshot
+
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+    # don't wait for the shared cache in this process
+    _snapshot = ConfigSnapshot()
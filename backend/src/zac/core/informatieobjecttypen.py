@@ -0,0 +1,154 @@
+"""
+Process-local registry of the informatieobjecttypen.
+
+Document listings and the :class:`zac.core.blueprints.InformatieObjectTypeBlueprint`
+permission checks look up the informatieobjecttype of every document, and the
+domein of its catalogus. The :class:`InformatieObjectTypeRegistry` keeps the
+informatieobjecttypen by URL, together with their permission key
+``(catalogus domein, omschrijving)``, so a list of documents is resolved in one go.
+
+The registry is filled on demand: resolving several unknown informatieobjecttypen
+loads all of them at once (see :func:`zac.core.services.get_all_informatieobjecttypen`),
+a single unknown one is fetched by itself. It is rebuilt when the
+informatieobjecttypen are invalidated (see
+:func:`zac.core.cache.invalidate_informatieobjecttypen_cache`), which bumps the
+shared version, or when it is older than ``REGISTRY_TIMEOUT``.
+
+Lookups only go from URL to permission key. There is no reverse index from
+``(catalogus domein, omschrijving)`` to the informatieobjecttypen, as nothing needs
+one yet: the blueprint permission checks start from a document, and document searches
+filter on the omschrijving stored in the search index. Such an index would need the
+complete registry, and with it the domein of every catalogus.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Tuple, Union
+
+from django.conf import settings
+from django.core.cache import cache
+
+from zgw_consumers.api_models.catalogi import InformatieObjectType
+from zgw_consumers.concurrent import parallel
+
+VERSION_KEY = "informatieobjecttype_registry:version"
+# the informatieobjecttypen themselves are cached for a day
+REGISTRY_TIMEOUT = 60 * 60
+
+PermissionKey = Tuple[str, str]
+
+
+class InformatieObjectTypeRegistry:
+    def __init__(self, version: int = 0):
+        self.version = version
+        self.built_at = time.monotonic()
+        self._informatieobjecttypen: Dict[str, InformatieObjectType] = {}
+        self._keys: Dict[str, PermissionKey] = {}
+        self._domeinen: Dict[str, str] = {}
+        self._complete = False
+        self._lock = threading.Lock()
+
+    def is_valid(self, version: int) -> bool:
+        return (
+            self.version == version
+            and time.monotonic() - self.built_at < REGISTRY_TIMEOUT
+        )
+
+    def _load_all(self) -> None:
+        from .services import get_all_informatieobjecttypen
+
+        informatieobjecttypen = get_all_informatieobjecttypen()
+        with self._lock:
+            self._informatieobjecttypen.update(informatieobjecttypen)
+            self._complete = True
+
+    def resolve(self, urls: Iterable[str]) -> Dict[str, InformatieObjectType]:
+        """
+        Return the informatieobjecttypen by URL.
+        """
+        from .services import get_informatieobjecttype
+
+        urls = set(urls)
+        missing = urls - self._informatieobjecttypen.keys()
+        if len(missing) > 1 and not self._complete:
+            self._load_all()
+            missing = urls - self._informatieobjecttypen.keys()
+
+        missing = list(missing)
+        if len(missing) > 1:
+            with parallel(max_workers=settings.MAX_WORKERS) as executor:
+                fetched = list(executor.map(get_informatieobjecttype, missing))
+        else:
+            fetched = [get_informatieobjecttype(url) for url in missing]
+        with self._lock:
+            self._informatieobjecttypen.update(zip(missing, fetched))
+
+        informatieobjecttypen = self._informatieobjecttypen
+        return {url: informatieobjecttypen[url] for url in urls}
+
+    def get_catalogus_domein(self, catalogus: str) -> str:
+        if (domein := self._domeinen.get(catalogus)) is None:
+            from .services import fetch_catalogus
+
+            domein = self._domeinen[catalogus] = fetch_catalogus(catalogus).domein
+        return domein
+
+    def get_key(
+        self, informatieobjecttype: Union[str, InformatieObjectType]
+    ) -> PermissionKey:
+        """
+        Return the catalogus domein and omschrijving of the informatieobjecttype.
+        """
+        if isinstance(informatieobjecttype, str):
+            if (key := self._keys.get(informatieobjecttype)) is not None:
+                return key
+            informatieobjecttype = self.resolve([informatieobjecttype])[
+                informatieobjecttype
+            ]
+
+        catalogus = informatieobjecttype.catalogus
+        domein = (
+            self.get_catalogus_domein(catalogus)
+            if isinstance(catalogus, str)
+            else catalogus.domein
+        )
+        key = self._keys[informatieobjecttype.url] = (
+            domein,
+            informatieobjecttype.omschrijving,
+        )
+        return key
+
+
+_registry = InformatieObjectTypeRegistry(version=-1)
+_lock = threading.Lock()
+
+
+def get_informatieobjecttype_registry() -> InformatieObjectTypeRegistry:
+    global _registry
+
+    version = cache.get(VERSION_KEY) or 0
+    if _registry.is_valid(version):
+        return _registry
+
+    with _lock:
+        # another thread may have replaced the registry in the meantime
+        if not _registry.is_valid(version):
+            _registry = InformatieObjectTypeRegistry(version=version)
+        return _registry
+
+
+def bump_registry_version() -> None:
+    """
+    Empty the informatieobjecttype registries of all processes on their next use.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+
+
+def reset_registry() -> None:
+    global _registry
+
+    with _lock:
+        _registry = InformatieObjectTypeRegistry(version=-1)
@@ -0,0 +1,196 @@
+import pickle
+import timeit
+import zlib
+
+from django.core.management import BaseCommand
+
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import ZaakType
+from zgw_consumers.api_models.documenten import Document
+from zgw_consumers.api_models.zaken import Rol
+
+from zac.utils.cache_serializers import CompactSerializer
+from zgw.models.zrc import Zaak
+
+ZTC_ROOT = "https://open-zaak.nl/catalogi/api/v1"
+ZRC_ROOT = "https://open-zaak.nl/zaken/api/v1"
+DRC_ROOT = "https://open-zaak.nl/documenten/api/v1"
+
+
+def get_zaaktype() -> ZaakType:
+    return factory(
+        ZaakType,
+        {
+            "url": f"{ZTC_ROOT}/zaaktypen/d66790b7-8b01-4005-a4ba-8fcf2a60f21d",
+            "catalogus": f"{ZTC_ROOT}/catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd",
+            "identificatie": "ZT1",
+            "omschrijving": "Melding openbare ruimte",
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "doel": "Meldingen afhandelen",
+            "aanleiding": "Een melding",
+            "indicatieInternOfExtern": "extern",
+            "handelingInitiator": "Melden",
+            "onderwerp": "Openbare ruimte",
+            "handelingBehandelaar": "Behandelen",
+            "doorlooptijd": "P30D",
+            "opschortingEnAanhoudingMogelijk": False,
+            "verlengingMogelijk": True,
+            "verlengingstermijn": "P14D",
+            "publicatieIndicatie": False,
+            "productenOfDiensten": [],
+            "besluittypen": [],
+            "beginGeldigheid": "2021-01-01",
+            "versiedatum": "2021-01-01",
+            "statustypen": [f"{ZTC_ROOT}/statustypen/{index}" for index in range(5)],
+            "informatieobjecttypen": [
+                f"{ZTC_ROOT}/informatieobjecttypen/{index}" for index in range(10)
+            ],
+            "eigenschappen": [
+                f"{ZTC_ROOT}/eigenschappen/{index}" for index in range(10)
+            ],
+            "roltypen": [f"{ZTC_ROOT}/roltypen/{index}" for index in range(5)],
+        },
+    )
+
+
+def get_zaak() -> Zaak:
+    zaak = factory(
+        Zaak,
+        {
+            "url": f"{ZRC_ROOT}/zaken/e3f5c6d2-0e49-4293-8428-26139f630950",
+            "bronorganisatie": "002220647",
+            "zaaktype": get_zaaktype().url,
+            "identificatie": "ZAAK-2021-0000000001",
+            "registratiedatum": "2021-01-01",
+            "verantwoordelijkeOrganisatie": "002220647",
+            "startdatum": "2021-01-01",
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "omschrijving": "Losliggende stoeptegel",
+            "toelichting": "",
+            "einddatum": None,
+            "einddatumGepland": "2021-02-01",
+            "uiterlijkeEinddatumAfdoening": None,
+            "publicatiedatum": None,
+            "status": f"{ZRC_ROOT}/statussen/1",
+            "resultaat": None,
+            "relevanteAndereZaken": [],
+            "zaakgeometrie": {"type": "Point", "coordinates": [5.12, 52.09]},
+        },
+    )
+    zaak.zaaktype = get_zaaktype()
+    return zaak
+
+
+def get_rollen(count: int):
+    return factory(
+        Rol,
+        [
+            {
+                "url": f"{ZRC_ROOT}/rollen/{index}",
+                "zaak": f"{ZRC_ROOT}/zaken/e3f5c6d2-0e49-4293-8428-26139f630950",
+                "betrokkeneType": "medewerker",
+                "roltype": f"{ZTC_ROOT}/roltypen/1",
+                "roltoelichting": "behandelaar",
+                "betrokkene": "",
+                "omschrijving": "Behandelaar",
+                "omschrijvingGeneriek": "behandelaar",
+                "registratiedatum": "2021-01-01T12:00:00Z",
+                "indicatieMachtiging": "",
+                "betrokkeneIdentificatie": {
+                    "identificatie": f"user:user-{index}",
+                    "achternaam": "Jansen",
+                    "voorletters": "J.",
+                    "voorvoegselAchternaam": "",
+                },
+            }
+            for index in range(count)
+        ],
+    )
+
+
+def get_documents(count: int):
+    return factory(
+        Document,
+        [
+            {
+                "url": f"{DRC_ROOT}/enkelvoudiginformatieobjecten/{index}",
+                "identificatie": f"DOCUMENT-2021-{index:010}",
+                "bronorganisatie": "002220647",
+                "creatiedatum": "2021-01-01",
+                "titel": f"document-{index}.pdf",
+                "vertrouwelijkheidaanduiding": "openbaar",
+                "auteur": "Jansen",
+                "taal": "nld",
+                "informatieobjecttype": f"{ZTC_ROOT}/informatieobjecttypen/1",
+                "beschrijving": "",
+                "bestandsnaam": f"document-{index}.pdf",
+                "bestandsomvang": 1024,
+                "formaat": "application/pdf",
+                "indicatieGebruiksrecht": None,
+                "inhoud": f"{DRC_ROOT}/enkelvoudiginformatieobjecten/{index}/download",
+                "integriteit": {"algoritme": "", "waarde": "", "datum": None},
+                "link": "",
+                "ondertekening": {"soort": "", "datum": None},
+                "ontvangstdatum": None,
+                "status": "definitief",
+                "versie": 1,
+                "verzenddatum": None,
+                "locked": False,
+            }
+            for index in range(count)
+        ],
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare size and (de)serialization time of the compact cache serializer "
+        "with (compressed) pickle for typical cached values"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=1000,
+            help="Number of times to (de)serialize each value.",
+        )
+
+    def handle(self, **options):
+        number = options["number"]
+        serializer = CompactSerializer({})
+        values = {
+            "zaaktype": get_zaaktype(),
+            "zaak": get_zaak(),
+            "rollen (20)": get_rollen(20),
+            "documenten (100)": get_documents(100),
+        }
+
+        self.stdout.write(
+            f"{'value':<20}{'serializer':<14}{'bytes':>10}{'dumps (µs)':>14}"
+            f"{'loads (µs)':>14}"
+        )
+        for name, value in values.items():
+            for serializer_name, dumps, loads in [
+                (
+                    "pickle",
+                    lambda value: pickle.dumps(value, pickle.DEFAULT_PROTOCOL),
+                    pickle.loads,
+                ),
+                (
+                    "pickle+zlib",
+                    lambda value: zlib.compress(
+                        pickle.dumps(value, pickle.DEFAULT_PROTOCOL)
+                    ),
+                    lambda data: pickle.loads(zlib.decompress(data)),
+                ),
+                ("compact", serializer.dumps, serializer.loads),
+            ]:
+                data = dumps(value)
+                dumps_time = timeit.timeit(lambda: dumps(value), number=number)
+                loads_time = timeit.timeit(lambda: loads(data), number=number)
+                self.stdout.write(
+                    f"{name:<20}{serializer_name:<14}{len(data):>10}"
+                    f"{dumps_time / number * 1e6:>14.1f}"
+                    f"{loads_time / number * 1e6:>14.1f}"
+                )
@@ -0,0 +1,149 @@
+"""
+Process-local registry of the objecttypes.
+
+Every object fetched from the Objects API gets a ``stringRepresentation`` built from
+the ``stringRepresentation`` labels of its objecttype. Instead of loading the list of
+objecttypes from the cache and parsing the labels for every (page of) object(s), the
+:class:`ObjecttypeRegistry` keeps the objecttypes by URL with their labels compiled
+to render functions.
+
+The registry is rebuilt when the objecttypes are invalidated (see
+:func:`zac.core.cache.invalidate_objecttypes_cache`), which bumps the shared
+version, or when it is older than ``REGISTRY_TIMEOUT``.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+
+VERSION_KEY = "objecttype_registry:version"
+# the objecttypes themselves are cached for an hour, see ``fetch_objecttypes``
+REGISTRY_TIMEOUT = 5 * 60
+
+NO_STRING_REPRESENTATION = "Objectnaam niet beschikbaar."
+
+Renderer = Callable[[Dict], str]
+
+
+@lru_cache(maxsize=1024)
+def compile_string_representation(labels: Tuple[str, ...]) -> Renderer:
+    """
+    Compile the ``stringRepresentation`` labels of an objecttype.
+
+    Labels containing ``field__`` refer to a field of the record data, all other
+    labels are used as is. Empty values are left out.
+    """
+    parts = tuple(
+        (True, label[7:]) if "field__" in label else (False, label)
+        for label in labels
+        if label
+    )
+    if all(not is_field for is_field, _ in parts):
+        constant = "".join(value for _, value in parts)
+        return lambda data: constant
+
+    def render(data: Dict) -> str:
+        values = [
+            data.get(value, "") if is_field else value for is_field, value in parts
+        ]
+        return "".join([value for value in values if value])
+
+    return render
+
+
+def get_renderer(objecttype: Optional[Dict]) -> Optional[Renderer]:
+    labels = ((objecttype or {}).get("labels") or {}).get("stringRepresentation")
+    if not labels:
+        return None
+    return compile_string_representation(tuple(labels))
+
+
+@dataclass(frozen=True)
+class ObjecttypeRegistry:
+    version: int = 0
+    built_at: float = 0
+    objecttypes: Dict[str, Dict] = field(default_factory=dict)
+    renderers: Dict[str, Renderer] = field(default_factory=dict)
+
+    def is_valid(self, version: int) -> bool:
+        return (
+            self.version == version
+            and time.monotonic() - self.built_at < REGISTRY_TIMEOUT
+        )
+
+    def add_string_representations(self, objs: List[Dict]) -> List[Dict]:
+        """
+        Set the ``stringRepresentation`` of the objects, in place.
+
+        Objects refer to their objecttype by URL or contain the objecttype itself.
+        """
+        renderers = self.renderers
+        for obj in objs:
+            objecttype = obj["type"]
+            if isinstance(objecttype, str):
+                renderer = renderers.get(objecttype)
+            else:
+                renderer = get_renderer(objecttype)
+
+            data = (obj.get("record") or {}).get("data")
+            obj["stringRepresentation"] = (
+                renderer(data) if renderer and data else NO_STRING_REPRESENTATION
+            )
+        return objs
+
+
+def build_registry(version: int = 0) -> ObjecttypeRegistry:
+    # the services import this module
+    from .services import fetch_objecttypes
+
+    objecttypes = {ot["url"]: ot for ot in fetch_objecttypes()}
+    renderers = {}
+    for url, objecttype in objecttypes.items():
+        if (renderer := get_renderer(objecttype)) is not None:
+            renderers[url] = renderer
+
+    return ObjecttypeRegistry(
+        version=version,
+        built_at=time.monotonic(),
+        objecttypes=objecttypes,
+        renderers=renderers,
+    )
+
+
+_registry = ObjecttypeRegistry(version=-1)
+_lock = threading.Lock()
+
+
+def get_objecttype_registry() -> ObjecttypeRegistry:
+    global _registry
+
+    version = cache.get(VERSION_KEY) or 0
+    if _registry.is_valid(version):
+        return _registry
+
+    with _lock:
+        # another thread may have rebuilt the registry in the meantime
+        if not _registry.is_valid(version):
+            _registry = build_registry(version=version)
+        return _registry
+
+
+def bump_registry_version() -> None:
+    """
+    Rebuild the objecttype registries of all processes on their next use.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+
+
+def reset_registry() -> None:
+    global _registry
+
+    with _lock:
+        _registry = ObjecttypeRegistry(version=-1)
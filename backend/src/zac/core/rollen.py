@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from django.utils.translation import gettext_lazy as _
 
@@ -7,7 +7,7 @@ from zgw_consumers.api_models.constants import RolTypes
 from zgw_consumers.api_models.zaken import Rol as _Rol
 
 from zac.accounts.models import Group, User
-from zac.contrib.brp.api import fetch_natuurlijkpersoon
+from zac.contrib.brp.api import fetch_natuurlijkpersonen, fetch_natuurlijkpersoon
 from zac.contrib.brp.data import IngeschrevenNatuurlijkPersoon
 from zac.contrib.organisatieonderdelen.models import OrganisatieOnderdeel
 
@@ -45,6 +45,23 @@ class Rol(_Rol):
         return roltype.omschrijving
 
 
+def resolve_natuurlijkpersonen(rollen: List[Rol]) -> List[Rol]:
+    """
+    Fetch the natuurlijk personen the rollen refer to in one go.
+    """
+    rollen_to_resolve = [
+        rol
+        for rol in rollen
+        if rol.betrokkene_type == RolTypes.natuurlijk_persoon
+        and rol.betrokkene
+        and not rol._natuurlijkpersoon
+    ]
+    personen = fetch_natuurlijkpersonen(rol.betrokkene for rol in rollen_to_resolve)
+    for rol in rollen_to_resolve:
+        rol._natuurlijkpersoon = personen[rol.betrokkene]
+    return rollen
+
+
 def get_bsn(rol: Rol) -> str:
     if rol.betrokkene:
         if not rol.natuurlijkpersoon:
@@ -1,3 +1,4 @@
+import base64
 import logging
 import warnings
 from functools import wraps
@@ -9,10 +10,12 @@ from django.conf import settings
 from django.contrib.auth.models import Group
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.files import File
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 import requests
+from elasticsearch.exceptions import TransportError
 from furl import furl
 from requests.models import Response
 from zds_client import ClientError
@@ -48,7 +51,7 @@ from zac.core.models import ApiSchemaConfig
 from zac.elasticsearch.searches import search_informatieobjects, search_zaken
 from zac.utils.decorators import cache as cache_result
 from zac.utils.exceptions import ServiceConfigError
-from zac.utils.http import get_session as _get_http_session
+from zac.utils.http import Base64JSONBody, get_session as _get_http_session
 from zac.zgw_client import ZGWClient, get_paginated_results
 from zgw.models import Zaak
 from zgw.models.zrc import ZaakInformatieObject
@@ -61,7 +64,10 @@ from .cache import (
     invalidate_document_url_cache,
     invalidate_zaak_cache,
 )
+from .config_snapshot import get_config
+from .informatieobjecttypen import get_informatieobjecttype_registry
 from .models import CoreConfig
+from .objecttypes import get_objecttype_registry
 from .rollen import Rol
 from .utils import A_DAY, AN_HOUR, fetch_next_url_pagination
 
@@ -125,7 +131,7 @@ def _get_from_catalogus(resource: str, catalogus: str = "", **extra_query) -> Li
     return result
 
 
-@cache_result("zaaktypen:{catalogus}", timeout=A_DAY)
+@cache_result("zaaktypen:{catalogus}", timeout=A_DAY, hot=True)
 def _get_zaaktypen(catalogus: str = "") -> List[ZaakType]:
     """
     Retrieve all the zaaktypen from all catalogi in the configured APIs.
@@ -193,6 +199,26 @@ def get_zaaktypen(
     ]
 
 
+@cache_result("zaaktypen:omschrijvingen:{catalogus}", timeout=A_DAY)
+def get_zaaktype_omschrijvingen(catalogus: str = "") -> Dict[str, Dict[str, str]]:
+    """
+    Map the identificatie of the zaaktypen per catalogus to the omschrijving of
+    their most recent version.
+    """
+    latest = {}
+    for zaaktype in _get_zaaktypen(catalogus=catalogus):
+        key = (zaaktype.catalogus, zaaktype.identificatie)
+        if key not in latest or zaaktype.versiedatum >= latest[key].versiedatum:
+            latest[key] = zaaktype
+
+    omschrijvingen = {}
+    for (zaaktype_catalogus, identificatie), zaaktype in latest.items():
+        omschrijvingen.setdefault(zaaktype_catalogus, {})[
+            identificatie
+        ] = zaaktype.omschrijving
+    return omschrijvingen
+
+
 @cache_result("zaaktype:{url}", timeout=A_DAY)
 def fetch_zaaktype(url: str) -> ZaakType:
     client = client_from_url(url)
@@ -365,7 +391,7 @@ def get_informatieobjecttypen_for_zaaktype(
     """
     Retrieve all informatieobjecttypen relevant for a given zaaktype.
     """
-    oz_ztiot_schema_key = ApiSchemaConfig.get_solo().client_ztiot_operation_id
+    oz_ztiot_schema_key = get_config(ApiSchemaConfig).client_ztiot_operation_id
     client = _client_from_object(zaaktype)
     results = get_paginated_results(
         client,
@@ -554,7 +580,7 @@ def search_zaken_for_object(object_url: str) -> List[Zaak]:
 
 
 def search_zaken_for_bsn(bsn: str) -> List[Zaak]:
-    brp_config = BRPConfig.get_solo()
+    brp_config = get_config(BRPConfig)
     service = brp_config.service
 
     queries = [
@@ -827,6 +853,46 @@ def get_related_zaken(zaak: Zaak) -> List[Tuple[str, Zaak]]:
     return results
 
 
+def resolve_zaken(zaak_urls: List[str]) -> Dict[str, Any]:
+    """
+    Resolve a batch of zaak URLs in one go.
+
+    The zaken are looked up in the search index with a single query. Only the
+    zaken missing from the index are retrieved from the ZRC(s), in parallel - all
+    of them if the index is unavailable. The values are either :class:`ZaakDocument` or :class:`Zaak` instances, so
+    only the attributes they share should be relied upon.
+    """
+    zaak_urls = list(dict.fromkeys(url for url in zaak_urls if url))
+    if not zaak_urls:
+        return {}
+
+    try:
+        results = search_zaken(
+            size=len(zaak_urls), urls=zaak_urls, only_allowed=False, ordering=None
+        )
+    except TransportError:
+        # the ZRC is the source of truth - don't fail when the index is unavailable
+        logger.warning("Could not look up zaken in the search index", exc_info=True)
+        results = []
+    zaken = {zaak.url: zaak for zaak in results}
+
+    def _fetch_zaak(zaak_url: str) -> Optional[Zaak]:
+        try:
+            return get_zaak(zaak_url=zaak_url)
+        except (ClientError, ObjectDoesNotExist):
+            logger.warning("Could not resolve zaak %s", zaak_url, exc_info=True)
+            return None
+
+    missing = [url for url in zaak_urls if url not in zaken]
+    if missing:
+        with parallel(max_workers=settings.MAX_WORKERS) as executor:
+            for url, zaak in zip(missing, executor.map(_fetch_zaak, missing)):
+                if zaak is not None:
+                    zaken[url] = zaak
+
+    return zaken
+
+
 @cache_result("zaak_objecten:{zaak.url}", timeout=AN_HOUR)
 def get_zaakobjecten(zaak: Zaak) -> List[ZaakObject]:
     client = client_from_url(zaak.url)
@@ -1087,7 +1153,7 @@ def fetch_documents(zios: List[str]) -> Tuple[List[Document], List[str]]:
     return factory(Document, documenten), gone
 
 
-@cache_result("get_all_informatieobjecttypen", timeout=A_DAY)
+@cache_result("get_all_informatieobjecttypen", timeout=A_DAY, hot=True)
 def get_all_informatieobjecttypen() -> Dict[str, InformatieObjectType]:
     logger.debug("Retrieving ZTC configuration for informatieobjecttypen")
     ztcs = Service.objects.filter(api_type=APITypes.ztc)
@@ -1117,7 +1183,7 @@ def resolve_documenten_informatieobjecttypen(
     if not unresolved:
         return documents
 
-    informatieobjecttypen = get_all_informatieobjecttypen()
+    informatieobjecttypen = get_informatieobjecttype_registry().resolve(unresolved)
 
     # resolve relations
     for document in documents:
@@ -1236,13 +1302,102 @@ def download_document(document: Document) -> Tuple[Document, bytes]:
     return document, response.content
 
 
+def get_document_download_headers(document: Document) -> Dict[str, str]:
+    client = _client_from_object(document)
+    return client.auth.credentials()
+
+
+def stream_document(document: Document, byte_range: str = "") -> Response:
+    """
+    Open the download of the document content without reading it into memory.
+
+    The caller is responsible for closing the response. ``byte_range`` is passed
+    on as Range header, the DRC may or may not honour it. An unsatisfiable range
+    is returned as is, so it can be passed on to the client.
+    """
+    headers = {**get_document_download_headers(document)}
+    if byte_range:
+        headers["Range"] = byte_range
+
+    response = _get_http_session().get(
+        document.inhoud,
+        headers=headers,
+        stream=True,
+        timeout=settings.REQUESTS_DEFAULT_TIMEOUT,
+    )
+    if response.status_code == 416:
+        return response
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return response
+
+
+def _split_document_content(document_data: Dict) -> Tuple[Dict, Optional[File]]:
+    """
+    Prepare the ``inhoud`` of the document data for sending.
+
+    ``inhoud`` is either already base64 encoded or a file. Small files are
+    encoded in memory, large files are split off to be streamed.
+    """
+    content = document_data.get("inhoud")
+    if not isinstance(content, File):
+        return document_data, None
+
+    if content.size > settings.DOCUMENT_UPLOAD_STREAM_THRESHOLD:
+        data = {key: value for key, value in document_data.items() if key != "inhoud"}
+        return data, content
+
+    with content.open("rb") as f:
+        inhoud = base64.b64encode(f.read()).decode("ascii")
+    return {**document_data, "inhoud": inhoud}, None
+
+
+def _send_document_content(
+    client, method: str, url: str, data: Dict, content: File, headers=None
+) -> Dict:
+    body = Base64JSONBody(
+        data,
+        "inhoud",
+        content,
+        size=content.size,
+        chunk_size=settings.DOCUMENT_UPLOAD_CHUNK_SIZE,
+    )
+    response = client.request(
+        method,
+        url,
+        data=body,
+        headers={**(headers or {}), "Content-Type": "application/json"},
+    )
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        try:
+            detail = response.json() if response.content else None
+        except ValueError:
+            detail = {"detail": response.text}
+        raise ClientError(detail) from exc
+    return response.json()
+
+
 def create_document(document_data: Dict) -> Document:
-    core_config = CoreConfig.get_solo()
+    core_config = get_config(CoreConfig)
     service = core_config.primary_drc
     if not service:
         raise RuntimeError("No DRC configured!")
     drc_client = service.build_client()
-    document = drc_client.create("enkelvoudiginformatieobject", document_data)
+
+    document_data, content = _split_document_content(document_data)
+    if content is None:
+        document = drc_client.create("enkelvoudiginformatieobject", document_data)
+    else:
+        path, _ = drc_client._get_operation_url("enkelvoudiginformatieobject_create")
+        document = _send_document_content(
+            drc_client, "POST", path, document_data, content
+        )
     return factory(Document, document)
 
 
@@ -1256,12 +1411,23 @@ def update_document(url: str, data: dict, audit_line: str) -> Document:
     lock = lock_result["lock"]
 
     data["lock"] = lock
-    response = client.partial_update(
-        "enkelvoudiginformatieobject",
-        data=data,
-        url=url,
-        request_kwargs={"headers": {"X-Audit-Toelichting": audit_line}},
-    )
+    data, content = _split_document_content(data)
+    if content is None:
+        response = client.partial_update(
+            "enkelvoudiginformatieobject",
+            data=data,
+            url=url,
+            request_kwargs={"headers": {"X-Audit-Toelichting": audit_line}},
+        )
+    else:
+        response = _send_document_content(
+            client,
+            "PATCH",
+            url,
+            data,
+            content,
+            headers={"X-Audit-Toelichting": audit_line},
+        )
 
     document = factory(Document, response)
 
@@ -1374,7 +1540,7 @@ def create_zaakbesluit(zaak: Zaak, data: Dict[str, Any]) -> Besluit:
     if not data.get("zaak"):
         data["zaak"] = zaak.url
 
-    config = CoreConfig.get_solo()
+    config = get_config(CoreConfig)
     brc = config.primary_brc or Service.objects.filter(api_type=APITypes.brc).first()
     if not brc:
         raise RuntimeError("No BRC service configured")
@@ -1407,57 +1573,24 @@ def add_string_representation(func):
     use this function to add stringRepresentation based on labels
     of objecttypes.
 
+    The labels are compiled once per objecttype, see
+    :class:`zac.core.objecttypes.ObjecttypeRegistry`.
     """
 
-    def _add_string_representation_field(obj: Dict, objecttypes: Dict) -> Dict:
-        ot = (
-            objecttypes.get(obj["type"])
-            if isinstance(obj["type"], str)
-            else obj["type"]
-        )
-        if (
-            ot
-            and (labels := ot["labels"].get("stringRepresentation", []))
-            and (obj.get("record", {}).get("data", {}).keys())
-        ):
-            # get the values of the original fields from the object
-            values = [
-                (
-                    obj["record"]["data"].get(label[7:], "")
-                    if "field__" in label
-                    else label
-                )
-                for label in labels
-                if label
-            ]
-            obj["stringRepresentation"] = "".join([val for val in values if val])
-        else:
-            obj["stringRepresentation"] = "Objectnaam niet beschikbaar."
-        return obj
-
-    def _fetch_object_types() -> Dict[str, Dict]:
-        return {ot["url"]: ot for ot in fetch_objecttypes()}
-
-    def if_list(objs: List[Dict]) -> List[Dict]:
-        ots = _fetch_object_types()
-        return [_add_string_representation_field(obj, ots) for obj in objs]
-
     def if_dict(objs: Dict) -> Dict:
         if "results" in objs and objs["results"]:
-            ots = _fetch_object_types()
-            objs["results"] = [
-                _add_string_representation_field(obj, ots) for obj in objs["results"]
-            ]
-            return objs
+            get_objecttype_registry().add_string_representations(objs["results"])
         elif "results" not in objs:
-            return _add_string_representation_field(objs, _fetch_object_types())
+            get_objecttype_registry().add_string_representations([objs])
         return objs
 
     @wraps(func)
     def wrapper(*args, **kwds):
         objs = func(*args, **kwds)
         mapping = {
-            list: lambda objects: if_list(objects),
+            list: lambda objects: get_objecttype_registry().add_string_representations(
+                objects
+            ),
             dict: lambda objects: if_dict(objects),
         }
         return mapping[type(objs)](objs)
@@ -1466,7 +1599,7 @@ def add_string_representation(func):
 
 
 def get_objects_client() -> Client:
-    config = CoreConfig.get_solo()
+    config = get_config(CoreConfig)
     object_api = config.primary_objects_api
     if not object_api:
         raise RuntimeError("No objects API has been configured yet.")
@@ -1475,7 +1608,7 @@ def get_objects_client() -> Client:
 
 
 def get_objecttypes_client() -> Client:
-    config = CoreConfig.get_solo()
+    config = get_config(CoreConfig)
     objecttypes_api = config.primary_objecttypes_api
     if not objecttypes_api:
         raise RuntimeError("No objecttypes API has been configured yet.")
@@ -1543,7 +1676,7 @@ def fetch_objecttype(url: str, client: Optional[Client] = None) -> dict:
     return object_type
 
 
-@cache_result("objecttype:all", timeout=AN_HOUR)
+@cache_result("objecttype:all", timeout=AN_HOUR, hot=True)
 def fetch_objecttypes() -> List[dict]:
     client = get_objecttypes_client()
     objecttypes_data = get_paginated_results(client, "objecttype")
@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from zgw_consumers.models import Service
+
+from .config_snapshot import bump_config_version, get_singleton_models
+
+
+def invalidate_config_snapshots(sender, created: bool = False, **kwargs):
+    # new singletons hold the defaults, and new services aren't referenced yet
+    if created:
+        return
+    # other processes must not rebuild a snapshot from the uncommitted state
+    transaction.on_commit(bump_config_version)
+
+
+def connect_config_signals() -> None:
+    for model in [*get_singleton_models(), Service]:
+        post_save.connect(invalidate_config_snapshots, sender=model)
+        post_delete.connect(invalidate_config_snapshots, sender=model)
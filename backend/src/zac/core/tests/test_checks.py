@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase, override_settings
+
+from ..checks import check_document_download_accel_redirect
+
+
+class DocumentDownloadAccelRedirectCheckTests(SimpleTestCase):
+    def _error_ids(self):
+        return [error.id for error in check_document_download_accel_redirect(None)]
+
+    def test_disabled(self):
+        self.assertEqual(self._error_ids(), [])
+
+    @override_settings(
+        DOCUMENT_DOWNLOAD_ACCEL_REDIRECT="/_documents/",
+        DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED=True,
+    )
+    def test_authenticated_location(self):
+        self.assertEqual(self._error_ids(), [])
+
+    @override_settings(DOCUMENT_DOWNLOAD_ACCEL_REDIRECT="/_documents/")
+    def test_not_authenticated(self):
+        self.assertEqual(self._error_ids(), ["zac.core.E001"])
+
+    @override_settings(
+        DOCUMENT_DOWNLOAD_ACCEL_REDIRECT="_documents",
+        DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED=True,
+    )
+    def test_invalid_location(self):
+        self.assertEqual(self._error_ids(), ["zac.core.E002"])
@@ -0,0 +1,69 @@
+from django.test import TestCase, override_settings
+
+from zgw_consumers.constants import APITypes
+
+from zac.contrib.kadaster.models import KadasterConfig
+from zac.core.config_snapshot import bump_config_version, get_config
+from zac.core.models import CoreConfig
+from zac.core.tests.utils import ClearCachesMixin
+from zac.tests import ServiceFactory
+
+
+@override_settings(CONFIG_SNAPSHOT_TIMEOUT=60)
+class ConfigSnapshotTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.service = ServiceFactory.create(
+            api_type=APITypes.orc, api_root="https://objects.nl/api/v1/"
+        )
+        config = CoreConfig.get_solo()
+        config.primary_objects_api = cls.service
+        config.save()
+
+    def setUp(self):
+        super().setUp()
+        bump_config_version()
+
+    def test_read_from_snapshot(self):
+        config = get_config(CoreConfig)
+        get_config(KadasterConfig)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_config(CoreConfig), config)
+            self.assertEqual(config.primary_objects_api, self.service)
+
+    def test_rebuilt_after_config_change(self):
+        config = get_config(CoreConfig)
+
+        core_config = CoreConfig.get_solo()
+        core_config.app_id = "https://bptl.nl/applicaties/1"
+        with self.captureOnCommitCallbacks(execute=True):
+            core_config.save()
+
+        new_config = get_config(CoreConfig)
+        self.assertIsNot(new_config, config)
+        self.assertEqual(new_config.app_id, "https://bptl.nl/applicaties/1")
+
+    def test_not_rebuilt_before_commit(self):
+        config = get_config(CoreConfig)
+
+        core_config = CoreConfig.get_solo()
+        core_config.app_id = "https://bptl.nl/applicaties/1"
+        with self.captureOnCommitCallbacks() as callbacks:
+            core_config.save()
+            self.assertIs(get_config(CoreConfig), config)
+
+        self.assertEqual(len(callbacks), 1)
+
+    def test_rebuilt_after_service_change(self):
+        get_config(CoreConfig)
+
+        self.service.api_root = "https://other-objects.nl/api/v1/"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.save()
+
+        self.assertEqual(
+            get_config(CoreConfig).primary_objects_api.api_root,
+            "https://other-objects.nl/api/v1/",
+        )
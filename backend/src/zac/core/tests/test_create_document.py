@@ -0,0 +1,71 @@
+import base64
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+import requests_mock
+from zgw_consumers.constants import APITypes
+
+from zac.tests import ServiceFactory
+from zac.tests.compat import generate_oas_component, mock_service_oas_get
+
+from ..models import CoreConfig
+from ..services import create_document
+from .utils import ClearCachesMixin
+
+DOCUMENTS_ROOT = "https://api.documenten.nl/api/v1/"
+
+
+@requests_mock.Mocker()
+class CreateDocumentTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        drc = ServiceFactory.create(api_type=APITypes.drc, api_root=DOCUMENTS_ROOT)
+        config = CoreConfig.get_solo()
+        config.primary_drc = drc
+        config.save()
+
+        cls.document = generate_oas_component(
+            "drc",
+            "schemas/EnkelvoudigInformatieObject",
+            url=f"{DOCUMENTS_ROOT}enkelvoudiginformatieobjecten/0c47fe5e-4fe1-4781-8583-168e0730c9b6",
+        )
+
+    def _setUpMocks(self, m):
+        mock_service_oas_get(m, DOCUMENTS_ROOT, "drc")
+        m.post(
+            f"{DOCUMENTS_ROOT}enkelvoudiginformatieobjecten",
+            json=self.document,
+            status_code=201,
+        )
+
+    def test_create_document_small_file(self, m):
+        self._setUpMocks(m)
+        file = SimpleUploadedFile("some-file.txt", b"foobar")
+
+        create_document({"titel": "some-file.txt", "inhoud": file})
+
+        self.assertEqual(
+            m.last_request.json(), {"titel": "some-file.txt", "inhoud": "Zm9vYmFy"}
+        )
+
+    @override_settings(DOCUMENT_UPLOAD_STREAM_THRESHOLD=0, DOCUMENT_UPLOAD_CHUNK_SIZE=4)
+    def test_create_document_streams_large_file(self, m):
+        self._setUpMocks(m)
+        content = b"some content that doesn't fit in one chunk"
+        file = SimpleUploadedFile("some-file.txt", content)
+
+        document = create_document({"titel": "some-file.txt", "inhoud": file})
+
+        self.assertEqual(document.url, self.document["url"])
+        body = b"".join(m.last_request.body)
+        self.assertEqual(
+            json.loads(body),
+            {
+                "titel": "some-file.txt",
+                "inhoud": base64.b64encode(content).decode("ascii"),
+            },
+        )
+        self.assertEqual(m.last_request.headers["Content-Length"], str(len(body)))
+        self.assertEqual(m.last_request.headers["Content-Type"], "application/json")
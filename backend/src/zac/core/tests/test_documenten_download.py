@@ -2,6 +2,7 @@ from unittest import skip
 from unittest.mock import patch
 
 from django.conf import settings
+from django.test import override_settings
 from django.urls import reverse_lazy
 
 import requests_mock
@@ -180,6 +181,81 @@ class DocumentenDownloadViewTests(ClearCachesMixin, WebTest):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, self.inhoud_1)
 
+    def _give_full_permission(self, user):
+        BlueprintPermissionFactory.create(
+            object_type=PermissionObjectTypeChoices.document,
+            role__permissions=[zaken_download_documents.name],
+            for_user=user,
+            policy={
+                "catalogus": self.catalogus["domein"],
+                "iotype_omschrijving": "Test Omschrijving 1",
+                "max_va": VertrouwelijkheidsAanduidingen.zeer_geheim,
+            },
+        )
+
+    def test_download_range(self, m):
+        self._set_up_mocks(m)
+        m.get(
+            self.document_1["inhoud"],
+            content=self.inhoud_1[:4],
+            status_code=206,
+            headers={
+                "Content-Length": "4",
+                "Content-Range": f"bytes 0-3/{len(self.inhoud_1)}",
+            },
+        )
+        user = UserFactory.create()
+        self._give_full_permission(user)
+
+        response = self.app.get(
+            self.download_url, user=user, headers={"Range": "bytes=0-3"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.content, b"Test")
+        self.assertEqual(response.headers["Content-Length"], "4")
+        self.assertEqual(
+            response.headers["Content-Range"], f"bytes 0-3/{len(self.inhoud_1)}"
+        )
+        self.assertEqual(m.last_request.headers["Range"], "bytes=0-3")
+        self.assertTrue(m.last_request.stream)
+
+    @override_settings(
+        DOCUMENT_DOWNLOAD_ACCEL_REDIRECT="/_documents/",
+        DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED=True,
+    )
+    def test_download_accel_redirect(self, m):
+        self._set_up_mocks(m)
+        user = UserFactory.create()
+        self._give_full_permission(user)
+
+        response = self.app.get(self.download_url, user=user)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(
+            response.headers["X-Accel-Redirect"],
+            f"/_documents/{self.document_1['inhoud']}",
+        )
+        # the proxy authenticates with the DRC, no credentials leave ZAC
+        self.assertNotIn("X-Accel-Authorization", response.headers)
+        self.assertNotIn("Authorization", response.headers)
+        self.assertFalse(
+            any(req.url == self.document_1["inhoud"] for req in m.request_history)
+        )
+
+    @override_settings(DOCUMENT_DOWNLOAD_ACCEL_REDIRECT="/_documents/")
+    def test_download_accel_redirect_not_authenticated(self, m):
+        self._set_up_mocks(m)
+        user = UserFactory.create()
+        self._give_full_permission(user)
+
+        response = self.app.get(self.download_url, user=user)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Accel-Redirect", response.headers)
+        self.assertEqual(response.content, self.inhoud_1)
+
     def test_full_permission_blueprint_permission_with_zaak_objecttype(self, m):
         """
         Regression test to make sure BlueprintPermissions with different
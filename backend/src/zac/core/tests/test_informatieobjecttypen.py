@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import Catalogus, InformatieObjectType
+
+from zac.core.cache import invalidate_informatieobjecttypen_cache
+from zac.core.informatieobjecttypen import get_informatieobjecttype_registry
+from zac.core.tests.utils import ClearCachesMixin
+from zac.tests.compat import generate_oas_component
+
+CATALOGI_ROOT = "https://open-zaak.nl/catalogi/api/v1/"
+CATALOGUS_URL = f"{CATALOGI_ROOT}catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
+
+
+def get_iot(uuid: str, omschrijving: str) -> InformatieObjectType:
+    return factory(
+        InformatieObjectType,
+        generate_oas_component(
+            "ztc",
+            "schemas/InformatieObjectType",
+            url=f"{CATALOGI_ROOT}informatieobjecttypen/{uuid}",
+            catalogus=CATALOGUS_URL,
+            omschrijving=omschrijving,
+        ),
+    )
+
+
+IOT_1 = get_iot("1", "bijlage")
+IOT_2 = get_iot("2", "advies")
+IOT_3 = get_iot("3", "besluit")
+CATALOGUS = factory(
+    Catalogus,
+    generate_oas_component(
+        "ztc", "schemas/Catalogus", url=CATALOGUS_URL, domein="DOME"
+    ),
+)
+
+
+@patch("zac.core.services.fetch_catalogus", return_value=CATALOGUS)
+@patch("zac.core.services.get_informatieobjecttype", return_value=IOT_3)
+@patch(
+    "zac.core.services.get_all_informatieobjecttypen",
+    return_value={IOT_1.url: IOT_1, IOT_2.url: IOT_2},
+)
+class InformatieObjectTypeRegistryTests(ClearCachesMixin, SimpleTestCase):
+    def test_resolve_many(self, mock_get_all, mock_get_iot, mock_fetch_catalogus):
+        registry = get_informatieobjecttype_registry()
+
+        result = registry.resolve([IOT_1.url, IOT_2.url, IOT_3.url])
+
+        self.assertEqual(result, {IOT_1.url: IOT_1, IOT_2.url: IOT_2, IOT_3.url: IOT_3})
+        mock_get_all.assert_called_once_with()
+        mock_get_iot.assert_called_once_with(IOT_3.url)
+
+        # resolved from the registry afterwards
+        self.assertEqual(registry.resolve([IOT_1.url, IOT_3.url])[IOT_3.url], IOT_3)
+        self.assertEqual(mock_get_all.call_count, 1)
+        self.assertEqual(mock_get_iot.call_count, 1)
+
+    def test_resolve_one(self, mock_get_all, mock_get_iot, mock_fetch_catalogus):
+        registry = get_informatieobjecttype_registry()
+
+        result = registry.resolve([IOT_3.url])
+
+        self.assertEqual(result, {IOT_3.url: IOT_3})
+        mock_get_all.assert_not_called()
+
+    def test_get_key(self, mock_get_all, mock_get_iot, mock_fetch_catalogus):
+        registry = get_informatieobjecttype_registry()
+
+        self.assertEqual(registry.get_key(IOT_3.url), ("DOME", "besluit"))
+        self.assertEqual(registry.get_key(IOT_3.url), ("DOME", "besluit"))
+        self.assertEqual(registry.get_key(IOT_1), ("DOME", "bijlage"))
+        mock_get_iot.assert_called_once_with(IOT_3.url)
+        mock_fetch_catalogus.assert_called_once_with(CATALOGUS_URL)
+
+    def test_registry_emptied_after_invalidation(
+        self, mock_get_all, mock_get_iot, mock_fetch_catalogus
+    ):
+        registry = get_informatieobjecttype_registry()
+        registry.resolve([IOT_3.url])
+
+        invalidate_informatieobjecttypen_cache(url=IOT_3.url)
+
+        self.assertIsNot(get_informatieobjecttype_registry(), registry)
+        get_informatieobjecttype_registry().resolve([IOT_3.url])
+        self.assertEqual(mock_get_iot.call_count, 2)
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from zac.core.cache import invalidate_objecttypes_cache
+from zac.core.objecttypes import (
+    NO_STRING_REPRESENTATION,
+    compile_string_representation,
+    get_objecttype_registry,
+)
+from zac.core.tests.utils import ClearCachesMixin
+
+OBJECTTYPE = {
+    "url": "https://objecttypes.nl/api/v1/objecttypes/1",
+    "name": "Laadpaal",
+    "labels": {
+        "stringRepresentation": [
+            "field__type",
+            ", ",
+            "field__adres",
+            "",
+            " - ",
+            "field__status",
+        ]
+    },
+}
+OTHER_OBJECTTYPE = {
+    "url": "https://objecttypes.nl/api/v1/objecttypes/2",
+    "name": "Boom",
+    "labels": {},
+}
+
+
+def get_object(objecttype, **data) -> dict:
+    return {"type": objecttype, "record": {"data": data}}
+
+
+class CompileStringRepresentationTests(SimpleTestCase):
+    def test_render(self):
+        render = compile_string_representation(
+            tuple(OBJECTTYPE["labels"]["stringRepresentation"])
+        )
+
+        self.assertEqual(
+            render({"type": "Laadpaal", "adres": "Utrechtsestraat 41", "status": "Af"}),
+            "Laadpaal, Utrechtsestraat 41 - Af",
+        )
+        self.assertEqual(render({"type": "Laadpaal", "status": ""}), "Laadpaal,  - ")
+
+    def test_constant(self):
+        render = compile_string_representation(("Boom", "", " 1"))
+
+        self.assertEqual(render({}), "Boom 1")
+
+
+@patch(
+    "zac.core.services.fetch_objecttypes", return_value=[OBJECTTYPE, OTHER_OBJECTTYPE]
+)
+class ObjecttypeRegistryTests(ClearCachesMixin, SimpleTestCase):
+    def test_add_string_representations(self, mock_fetch_objecttypes):
+        objs = [
+            get_object(OBJECTTYPE["url"], type="Laadpaal", adres="Straat 1"),
+            get_object(OBJECTTYPE, type="Laadpaal", status="Af"),
+            get_object(OTHER_OBJECTTYPE["url"], naam="Eik"),
+            get_object(OBJECTTYPE["url"]),
+            get_object("https://objecttypes.nl/api/v1/objecttypes/unknown", a="b"),
+        ]
+
+        get_objecttype_registry().add_string_representations(objs)
+
+        self.assertEqual(
+            [obj["stringRepresentation"] for obj in objs],
+            [
+                "Laadpaal, Straat 1 - ",
+                "Laadpaal,  - Af",
+                NO_STRING_REPRESENTATION,
+                NO_STRING_REPRESENTATION,
+                NO_STRING_REPRESENTATION,
+            ],
+        )
+
+    def test_registry_reused(self, mock_fetch_objecttypes):
+        registry = get_objecttype_registry()
+
+        self.assertIs(get_objecttype_registry(), registry)
+        mock_fetch_objecttypes.assert_called_once_with()
+
+    def test_registry_rebuilt_after_invalidation(self, mock_fetch_objecttypes):
+        registry = get_objecttype_registry()
+
+        invalidate_objecttypes_cache()
+
+        self.assertIsNot(get_objecttype_registry(), registry)
+        self.assertEqual(mock_fetch_objecttypes.call_count, 2)
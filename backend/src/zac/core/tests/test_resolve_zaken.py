@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from elasticsearch.exceptions import ConnectionError as ESConnectionError
+from zgw_consumers.api_models.base import factory
+
+from zac.elasticsearch.documents import ZaakDocument
+from zac.tests.compat import generate_oas_component
+from zgw.models.zrc import Zaak
+
+from ..services import resolve_zaken
+
+ZAKEN_ROOT = "https://api.zaken.nl/api/v1/"
+ZAAK_URL_1 = f"{ZAKEN_ROOT}zaken/482de5b2-4779-4b29-b84f-add888352182"
+ZAAK_URL_2 = f"{ZAKEN_ROOT}zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+
+
+def get_zaak(zaak_url: str) -> Zaak:
+    return factory(Zaak, generate_oas_component("zrc", "schemas/Zaak", url=zaak_url))
+
+
+@patch("zac.core.services.get_zaak", side_effect=get_zaak)
+class ResolveZakenTests(SimpleTestCase):
+    def test_missing_zaken_retrieved_from_zrc(self, m_get_zaak):
+        indexed = ZaakDocument(url=ZAAK_URL_1, identificatie="ZAAK-001")
+
+        with patch(
+            "zac.core.services.search_zaken", return_value=[indexed]
+        ) as m_search:
+            zaken = resolve_zaken([ZAAK_URL_1, ZAAK_URL_2, ZAAK_URL_1])
+
+        self.assertEqual(m_search.call_args.kwargs["urls"], [ZAAK_URL_1, ZAAK_URL_2])
+        m_get_zaak.assert_called_once_with(zaak_url=ZAAK_URL_2)
+        self.assertIs(zaken[ZAAK_URL_1], indexed)
+        self.assertIsInstance(zaken[ZAAK_URL_2], Zaak)
+
+    def test_index_unavailable(self, m_get_zaak):
+        with patch(
+            "zac.core.services.search_zaken",
+            side_effect=ESConnectionError("N/A", "Connection refused", None),
+        ):
+            zaken = resolve_zaken([ZAAK_URL_1, ZAAK_URL_2])
+
+        self.assertEqual(m_get_zaak.call_count, 2)
+        self.assertEqual(list(zaken), [ZAAK_URL_1, ZAAK_URL_2])
@@ -3,6 +3,13 @@ from django.core.cache import cache, caches
 from zds_client.oas import schema_fetcher
 from zgw_consumers.concurrent import parallel
 
+from zac.contrib.kadaster.suggestions import reset_suggestion_cache
+from zac.core.informatieobjecttypen import (
+    reset_registry as reset_informatieobjecttype_registry,
+)
+from zac.core.objecttypes import reset_registry
+from zac.utils.decorators import reset_circuits
+
 
 class mock_parallel(parallel):
     def map(self, fn, *iterables, timeout=None, chunksize=1):
@@ -18,3 +25,11 @@ class ClearCachesMixin:
             self.addCleanup(_cache.clear)
         cache.clear()
         schema_fetcher.cache._local_cache = {}
+        reset_circuits()
+        self.addCleanup(reset_circuits)
+        reset_registry()
+        self.addCleanup(reset_registry)
+        reset_informatieobjecttype_registry()
+        self.addCleanup(reset_informatieobjecttype_registry)
+        reset_suggestion_cache()
+        self.addCleanup(reset_suggestion_cache)
@@ -1,14 +1,23 @@
 import mimetypes
 from typing import Any, Optional
 
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views import View
 
+from requests.models import Response
 from zgw_consumers.api_models.documenten import Document
 
 from ..permissions import zaken_download_documents
-from ..services import download_document, find_document, get_informatieobjecttype
+from ..services import (
+    find_document,
+    get_informatieobjecttype,
+    stream_document,
+)
+
+# headers of the DRC download response that are passed on to the client
+PASSTHROUGH_HEADERS = ("Accept-Ranges", "Content-Range", "Last-Modified", "ETag")
 
 
 def _cast(value: Optional[Any], type_: type) -> Any:
@@ -17,6 +26,25 @@ def _cast(value: Optional[Any], type_: type) -> Any:
     return type_(value)
 
 
+class StreamedContent:
+    """
+    Iterate over the content of a streamed response in chunks.
+
+    Django closes the iterable when the response is finished, which releases the
+    connection to the DRC.
+    """
+
+    def __init__(self, response: Response, chunk_size: int):
+        self.response = response
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return self.response.iter_content(chunk_size=self.chunk_size)
+
+    def close(self):
+        self.response.close()
+
+
 class DownloadDocumentView(LoginRequiredMixin, PermissionRequiredMixin, View):
     permission_required = zaken_download_documents.name
 
@@ -45,9 +73,49 @@ class DownloadDocumentView(LoginRequiredMixin, PermissionRequiredMixin, View):
             self.document.formaat or mimetypes.guess_type(self.document.bestandsnaam)[0]
         )
 
-        document, content = download_document(self.document)
-        response = HttpResponse(content, content_type=content_type)
+        if (
+            settings.DOCUMENT_DOWNLOAD_ACCEL_REDIRECT
+            and settings.DOCUMENT_DOWNLOAD_ACCEL_REDIRECT_AUTHENTICATED
+        ):
+            response = self.get_accel_redirect_response(content_type)
+        else:
+            response = self.get_streaming_response(content_type)
+
         response["Content-Disposition"] = (
-            f'attachment; filename="{document.bestandsnaam}"'
+            f'attachment; filename="{self.document.bestandsnaam}"'
+        )
+        return response
+
+    def get_accel_redirect_response(self, content_type: str) -> HttpResponse:
+        """
+        Let the reverse proxy download and serve the document content.
+
+        The response holds no credentials, the internal location of the proxy
+        authenticates with the DRC itself.
+        """
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = (
+            f"{settings.DOCUMENT_DOWNLOAD_ACCEL_REDIRECT}{self.document.inhoud}"
+        )
+        return response
+
+    def get_streaming_response(self, content_type: str) -> StreamingHttpResponse:
+        upstream = stream_document(
+            self.document, byte_range=self.request.headers.get("Range", "")
+        )
+        response = StreamingHttpResponse(
+            StreamedContent(upstream, settings.DOCUMENT_DOWNLOAD_CHUNK_SIZE),
+            status=upstream.status_code,
+            content_type=content_type,
         )
+        for header in PASSTHROUGH_HEADERS:
+            if header in upstream.headers:
+                response[header] = upstream.headers[header]
+        # the content is decoded while streaming, so the length is only known
+        # when the DRC doesn't encode it
+        if (
+            "Content-Length" in upstream.headers
+            and "Content-Encoding" not in upstream.headers
+        ):
+            response["Content-Length"] = upstream.headers["Content-Length"]
         return response
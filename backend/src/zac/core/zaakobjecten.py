@@ -6,6 +6,7 @@ from django.conf import settings
 from requests import Response
 from zgw_consumers.api_models.zaken import ZaakObject
 
+from zac.core.config_snapshot import get_config
 from zac.core.models import CoreConfig, MetaObjectTypesConfig
 from zac.core.services import fetch_objects
 from zac.utils.http import get_session
@@ -41,7 +42,7 @@ class ZaakObjectGroup:
         ]
 
         # Resolve if some of the related objects are in the objects API
-        config = CoreConfig.get_solo()
+        config = get_config(CoreConfig)
         object_api = config.primary_objects_api
         if not object_api:
             raise RuntimeError("No objects API has been configured yet.")
@@ -58,7 +59,7 @@ class ZaakObjectGroup:
 
         # Do not show retrieved meta objects unless explicitly requested
         meta_objecttype_urls = list(
-            MetaObjectTypesConfig.get_solo().meta_objecttype_urls.values()
+            get_config(MetaObjectTypesConfig).meta_objecttype_urls.values()
         )
         for zaakobject_url, item in object_items:
             retrieved_item = object_url_mapping.get(item, item)
@@ -9,7 +9,6 @@ from elasticsearch_dsl.query import Bool, Nested, Term
 from zgw_consumers.api_models.catalogi import InformatieObjectType, StatusType, ZaakType
 from zgw_consumers.api_models.documenten import Document
 from zgw_consumers.api_models.zaken import Status, ZaakEigenschap, ZaakObject
-from zgw_consumers.concurrent import parallel
 
 from zac.accounts.datastructures import VA_ORDER
 from zac.core.rollen import Rol
@@ -22,17 +21,18 @@ from zac.core.services import (
     get_rollen,
     get_status,
     get_statustype,
-    get_zaak,
     get_zaakeigenschappen,
     get_zaakinformatieobjecten_related_to_informatieobject,
     get_zaakobjecten_related_to_object,
     get_zaaktypen,
+    resolve_zaken,
 )
 from zgw.models.zrc import Zaak, ZaakInformatieObject
 
 from .documents import (
     InformatieObjectDocument,
     InformatieObjectTypeDocument,
+    MetaObjectDocument,
     ObjectDocument,
     ObjectTypeDocument,
     RelatedZaakDocument,
@@ -43,6 +43,7 @@ from .documents import (
     ZaakObjectDocument,
     ZaakTypeDocument,
 )
+from .writer import writer
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +90,7 @@ def _get_zaak_document(
             return
         else:
             zaak_document = create_zaak_document(create_zaak)
-            zaak_document.save(refresh="wait_for")
+            zaak_document.save()
 
     return zaak_document
 
@@ -105,34 +106,27 @@ def update_zaak_document(zaak: Zaak) -> ZaakDocument:
     # Don't include zaaktype and identificatie since they are immutable.
     # Don't include status or objecten as those are handled through a
     # different handler in the notifications api.
-    body = {
-        "doc": {
-            "bronorganisatie": zaak.bronorganisatie,
-            "vertrouwelijkheidaanduiding": zaak.vertrouwelijkheidaanduiding,
-            "va_order": VA_ORDER[zaak.vertrouwelijkheidaanduiding],
-            "startdatum": zaak.startdatum,
-            "einddatum": zaak.einddatum,
-            "registratiedatum": zaak.registratiedatum,
-            "deadline": zaak.deadline,
-            "toelichting": zaak.toelichting,
-            "zaakgeometrie": zaak.zaakgeometrie,
-            "omschrijving": zaak.omschrijving,
-            "identificatie_suggest": zaak.identificatie,
-        }
+    doc = {
+        "bronorganisatie": zaak.bronorganisatie,
+        "vertrouwelijkheidaanduiding": zaak.vertrouwelijkheidaanduiding,
+        "va_order": VA_ORDER[zaak.vertrouwelijkheidaanduiding],
+        "startdatum": zaak.startdatum,
+        "einddatum": zaak.einddatum,
+        "registratiedatum": zaak.registratiedatum,
+        "deadline": zaak.deadline,
+        "toelichting": zaak.toelichting,
+        "zaakgeometrie": zaak.zaakgeometrie,
+        "omschrijving": zaak.omschrijving,
+        "identificatie_suggest": zaak.identificatie,
     }
-    zaak_document._get_connection().update(
-        zaak_document.Index().name,
-        zaak_document.meta.id,
-        body,
-        refresh="wait_for",
-        retry_on_conflict=settings.ES_RETRY_ON_CONFLICT,
-    )
+    writer.update(zaak_document.Index().name, zaak_document.meta.id, doc)
     return zaak_document
 
 
 def delete_zaak_document(zaak_url: str) -> None:
     zaak_document = get_zaak_document(zaak_url)
     if zaak_document:
+        writer.discard(zaak_document.Index().name, zaak_document.meta.id)
         zaak_document.delete()
 
     return
@@ -175,12 +169,14 @@ def update_status_in_zaak_document(zaak: Zaak) -> None:
         zaak.status = get_status(zaak) if isinstance(zaak.status, str) else zaak.status
         status_document = create_status_document(zaak.status)
         zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-        zaak_document.status = status_document
-        if zaak.status.statustype.is_eindstatus:
-            zaak_document.has_eindstatus = True
-        else:
-            zaak_document.has_eindstatus = False
-        zaak_document.save(refresh="wait_for")
+        writer.update(
+            zaak_document.Index().name,
+            zaak_document.meta.id,
+            {
+                "status": status_document,
+                "has_eindstatus": bool(zaak.status.statustype.is_eindstatus),
+            },
+        )
 
     return
 
@@ -199,8 +195,9 @@ def create_rol_document(rol: Rol) -> RolDocument:
 def update_rollen_in_zaak_document(zaak: Zaak) -> None:
     rol_documents = [create_rol_document(rol) for rol in get_rollen(zaak)]
     zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-    zaak_document.rollen = rol_documents
-    zaak_document.save(refresh="wait_for")
+    writer.update(
+        zaak_document.Index().name, zaak_document.meta.id, {"rollen": rol_documents}
+    )
     return
 
 
@@ -222,8 +219,11 @@ def update_eigenschappen_in_zaak_document(zaak: Zaak) -> None:
     eigenschappen_doc = create_eigenschappen_document(zaak.eigenschappen)
 
     zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-    zaak_document.eigenschappen = eigenschappen_doc
-    zaak_document.save(refresh="wait_for")
+    writer.update(
+        zaak_document.Index().name,
+        zaak_document.meta.id,
+        {"eigenschappen": eigenschappen_doc},
+    )
     return
 
 
@@ -243,7 +243,7 @@ def _get_zo_document(
             return
         else:
             zo_document = create_zaakobject_document(create_zo)
-            zo_document.save(refresh="wait_for")
+            zo_document.save()
 
     return zo_document
 
@@ -280,7 +280,7 @@ def _get_zio_document(
             return
         else:
             zio_document = create_zaakinformatieobject_document(create_zio)
-            zio_document.save(refresh="wait_for")
+            zio_document.save()
 
     return zio_document
 
@@ -298,19 +298,11 @@ def update_zaakinformatieobject_document(
     # Don't include zaaktype and identificatie since they are immutable.
     # Don't include status or objecten as those are handled through a
     # different handler in the notifications api.
-    body = {
-        "doc": {
-            "informatieobject": zio.informatieobject,
-            "zaak": zio.zaak,
-        }
+    doc = {
+        "informatieobject": zio.informatieobject,
+        "zaak": zio.zaak,
     }
-    ziod._get_connection().update(
-        ziod.Index().name,
-        ziod.meta.id,
-        body,
-        refresh="wait_for",
-        retry_on_conflict=settings.ES_RETRY_ON_CONFLICT,
-    )
+    writer.update(ziod.Index().name, ziod.meta.id, doc)
     return ziod
 
 
@@ -339,7 +331,7 @@ def _get_object_document(
         logger.warning("object %s hasn't been indexed in ES", object_url)
         if create_object:
             object_document = create_object_document(create_object)
-            object_document.save(refresh="wait_for")
+            object_document.save()
         else:
             return
 
@@ -365,24 +357,17 @@ def update_object_document(object: Dict) -> ObjectDocument:
     object_document = _get_object_document(
         object["uuid"], object["url"], create_object=object
     )
-    body = {
-        "doc": {
-            "record_data": object["record"]["data"],
-            "string_representation": object["stringRepresentation"],
-        }
+    doc = {
+        "record_data": object["record"]["data"],
+        "string_representation": object["stringRepresentation"],
     }
-    object_document._get_connection().update(
-        object_document.Index().name,
-        object_document.meta.id,
-        body,
-        refresh="wait_for",
-        retry_on_conflict=settings.ES_RETRY_ON_CONFLICT,
-    )
+    writer.update(object_document.Index().name, object_document.meta.id, doc)
     return object_document
 
 
 def delete_object_document(object_url: str) -> None:
     object_document = _get_object_document(_get_uuid_from_url(object_url), object_url)
+    writer.discard(object_document.Index().name, object_document.meta.id)
     object_document.delete()
 
 
@@ -402,21 +387,92 @@ def create_related_zaak_document(
     )
 
 
-def update_related_zaken_in_object_document(object_url: str) -> None:
-    # Get zaken information from zaken index
-    zaakobjecten = get_zaakobjecten_related_to_object(object_url)
+def _resolve_related_zaken(zaak_urls: List[str]) -> List[Union[ZaakDocument, Zaak]]:
+    zaken = list(resolve_zaken(zaak_urls).values())
 
-    def _get_zaak(url: str) -> Zaak:
-        return get_zaak(zaak_url=url)
+    # resolve zaaktypen of the zaken that weren't found in the zaken index
+    if any(isinstance(zaak.zaaktype, str) for zaak in zaken):
+        zaaktypen = {zt.url: zt for zt in get_zaaktypen()}
+        for zaak in zaken:
+            if isinstance(zaak.zaaktype, str):
+                zaak.zaaktype = zaaktypen[zaak.zaaktype]
 
-    with parallel(max_workers=settings.MAX_WORKERS) as executor:
-        zaken = list(executor.map(_get_zaak, [zo.zaak for zo in zaakobjecten]))
+    return zaken
 
-    # resolve zaaktypen
-    zaaktypen = {zt.url: zt for zt in get_zaaktypen()}
 
-    for zaak in zaken:
-        zaak.zaaktype = zaaktypen[zaak.zaaktype]
+# Replaces the related zaak, unless the fields shown in the search results are
+# unchanged - those documents are left alone.
+UPDATE_RELATED_ZAAK_SCRIPT = """
+def related_zaak = params.related_zaak;
+boolean changed = true;
+for (def rz : ctx._source.related_zaken) {
+    if (rz.url == related_zaak.url
+        && rz.omschrijving == related_zaak.omschrijving
+        && rz.va_order == related_zaak.va_order) {
+        changed = false;
+    }
+}
+if (changed) {
+    ctx._source.related_zaken.removeIf(rz -> rz.url == related_zaak.url);
+    ctx._source.related_zaken.add(related_zaak);
+} else {
+    ctx.op = 'noop';
+}
+"""
+
+
+def _update_related_zaak_in_documents(
+    document_class: type, related_zaak: RelatedZaakDocument
+) -> None:
+    """
+    Update the related zaak in all documents of the index that refer to it.
+
+    This is a single update by query request. Documents that were modified while
+    it ran are skipped by ES, so the request is repeated until there are no
+    more version conflicts. The changes become visible on the next index refresh.
+    """
+    update = (
+        document_class._index.updateByQuery()
+        .query(
+            Nested(
+                path="related_zaken",
+                query=Bool(filter=[Term(related_zaken__url=related_zaak.url)]),
+            )
+        )
+        .script(
+            source=UPDATE_RELATED_ZAAK_SCRIPT,
+            lang="painless",
+            params={"related_zaak": related_zaak.to_dict()},
+        )
+        .params(
+            conflicts="proceed",
+            slices="auto",
+            requests_per_second=settings.ES_UPDATE_BY_QUERY_REQUESTS_PER_SECOND,
+        )
+    )
+
+    for _ in range(settings.ES_RETRY_ON_CONFLICT):
+        response = update.execute()
+        if not response.version_conflicts:
+            return
+        logger.info(
+            "%d version conflicts updating related zaak %s in %s, retrying.",
+            response.version_conflicts,
+            related_zaak.url,
+            document_class._index._name,
+        )
+
+    logger.warning(
+        "Could not update related zaak %s in all documents of %s.",
+        related_zaak.url,
+        document_class._index._name,
+    )
+
+
+def update_related_zaken_in_object_document(object_url: str) -> None:
+    # Get zaken information from zaken index
+    zaakobjecten = get_zaakobjecten_related_to_object(object_url)
+    zaken = _resolve_related_zaken([zo.zaak for zo in zaakobjecten])
 
     # Fetch object document to be updated
     object = fetch_object(object_url)
@@ -426,55 +482,61 @@ def update_related_zaken_in_object_document(object_url: str) -> None:
 
     # Create related_zaak documenten and update object document
     related_zaken = [create_related_zaak_document(zaak) for zaak in zaken]
-    object_document.related_zaken = related_zaken
-    object_document.save(refresh="wait_for")
+    writer.update(
+        object_document.Index().name,
+        object_document.meta.id,
+        {"related_zaken": related_zaken},
+    )
     return
 
 
 def update_related_zaak_in_object_documents(zaak: Zaak) -> None:
-    # check if related_zaak really changed before indexing bunch of documents
     related_zaak = create_related_zaak_document(zaak)
+    _update_related_zaak_in_documents(ObjectDocument, related_zaak)
 
-    object = (
-        ObjectDocument.search()
-        .query(
-            Nested(
-                path="related_zaken",
-                query=Bool(filter=[Term(related_zaken__url=zaak.url)]),
-            )
-        )
-        .extra(size=1)
-        .execute()
+
+###################################################
+#                  META OBJECTEN                  #
+###################################################
+
+
+def _get_open_assignees(answers: List[Dict], key: str) -> List[str]:
+    return sorted(
+        {
+            answer[key]
+            for answer in answers
+            if answer.get(key) and not answer.get("answer")
+        }
     )
-    changed = False
-    if object and related_zaak.url in [z.url for z in object[0].related_zaken]:
-        old_rz = [rz for rz in object[0].related_zaken if rz.url == related_zaak.url][0]
-        if any(
-            [
-                old_rz.omschrijving != related_zaak.omschrijving,
-                old_rz.va_order != related_zaak.va_order,
-            ]
-        ):
-            changed = True
-
-    if changed:
-        objects = (
-            ObjectDocument.search()
-            .query(
-                Nested(
-                    path="related_zaken",
-                    query=Bool(filter=[Term(related_zaken__url=zaak.url)]),
-                )
-            )
-            .execute()
-        )
-        for obj in objects:
-            related_zaken = [rz for rz in obj.related_zaken if rz.url != zaak.url]
-            related_zaken.append(related_zaak)
-            object_document = ObjectDocument.get(id=obj.meta.id)
-            object_document.related_zaken = related_zaken
-            object_document.save(refresh="wait_for")
-    return
+
+
+def create_meta_object_document(object: Dict) -> MetaObjectDocument:
+    data = object["record"]["data"]
+    objecttype = object["type"]
+    answers = data.get("answers") or []
+    return MetaObjectDocument(
+        meta={"id": object["uuid"]},
+        url=object["url"],
+        objecttype=objecttype["url"] if isinstance(objecttype, dict) else objecttype,
+        zaak=data.get("zaak"),
+        locked=bool(data.get("locked")),
+        created=data.get("created"),
+        requester=(data.get("requester") or {}).get("username"),
+        open_user_assignees=_get_open_assignees(answers, "userAssignee"),
+        open_group_assignees=_get_open_assignees(answers, "groupAssignee"),
+        record_data=data,
+    )
+
+
+def update_meta_object_document(object: Dict) -> MetaObjectDocument:
+    # meta objects are small, the document is replaced as a whole
+    meta_object_document = create_meta_object_document(object)
+    meta_object_document.save()
+    return meta_object_document
+
+
+def delete_meta_object_document(object_url: str) -> None:
+    MetaObjectDocument(meta={"id": _get_uuid_from_url(object_url)}).delete(ignore=404)
 
 
 ###################################################
@@ -522,7 +584,7 @@ def _get_informatieobject_document(
             informatieobject_document = create_informatieobject_document(
                 create_informatieobject
             )
-            informatieobject_document.save(refresh="wait_for")
+            informatieobject_document.save()
             created = True
         else:
             return created, None
@@ -537,6 +599,7 @@ def create_informatieobject_document(
     if not hasattr(document, "last_edited_date"):
         at = fetch_latest_audit_trail_data_document(document.url)
         document.last_edited_date = at.last_edited_date if at else None
+        document.last_edited_by = at.last_edited_by if at else None
 
     iod = InformatieObjectDocument(
         meta={"id": document.uuid},
@@ -553,6 +616,7 @@ def create_informatieobject_document(
         inhoud=document.inhoud,
         integriteit=document.integriteit,
         last_edited_date=document.last_edited_date,
+        last_edited_by=getattr(document, "last_edited_by", None),
         link=document.link,
         locked=document.locked,
         ondertekening=document.ondertekening,
@@ -560,6 +624,7 @@ def create_informatieobject_document(
         status=document.status,
         taal=document.taal,
         titel=document.titel,
+        titel_suggest=document.titel,
         url=document.url,
         versie=document.versie,
         vertrouwelijkheidaanduiding=document.vertrouwelijkheidaanduiding,
@@ -577,46 +642,47 @@ def update_informatieobject_document(document: Document) -> InformatieObjectDocu
     if not created:
         # get latest edit date
         at = fetch_latest_audit_trail_data_document(document.url)
-        body = {
-            "doc": {
-                "auteur": document.auteur,
-                "beschrijving": document.beschrijving,
-                "bestandsnaam": document.bestandsnaam,
-                "bestandsomvang": document.bestandsomvang,
-                "bronorganisatie": document.bronorganisatie,
-                "creatiedatum": document.creatiedatum,
-                "formaat": document.formaat,
-                "identificatie": document.identificatie,
-                "indicatie_gebruiksrecht": document.indicatie_gebruiksrecht,
-                "informatieobjecttype": resolve_iot_for_document(document).to_dict(),
-                "inhoud": document.inhoud,
-                "integriteit": document.integriteit,
-                "last_edited_date": at.last_edited_date if at else None,
-                "link": document.link,
-                "locked": document.locked,
-                "ondertekening": document.ondertekening,
-                "ontvangstdatum": document.ontvangstdatum,
-                "status": document.status,
-                "taal": document.taal,
-                "titel": document.titel,
-                "url": document.url,
-                "versie": document.versie,
-                "vertrouwelijkheidaanduiding": document.vertrouwelijkheidaanduiding,
-                "verzenddatum": document.verzenddatum,
-            }
+        doc = {
+            "auteur": document.auteur,
+            "beschrijving": document.beschrijving,
+            "bestandsnaam": document.bestandsnaam,
+            "bestandsomvang": document.bestandsomvang,
+            "bronorganisatie": document.bronorganisatie,
+            "creatiedatum": document.creatiedatum,
+            "formaat": document.formaat,
+            "identificatie": document.identificatie,
+            "indicatie_gebruiksrecht": document.indicatie_gebruiksrecht,
+            "informatieobjecttype": resolve_iot_for_document(document).to_dict(),
+            "inhoud": document.inhoud,
+            "integriteit": document.integriteit,
+            "last_edited_date": at.last_edited_date if at else None,
+            "last_edited_by": at.last_edited_by if at else None,
+            "link": document.link,
+            "locked": document.locked,
+            "ondertekening": document.ondertekening,
+            "ontvangstdatum": document.ontvangstdatum,
+            "status": document.status,
+            "taal": document.taal,
+            "titel": document.titel,
+            "titel_suggest": document.titel,
+            "url": document.url,
+            "versie": document.versie,
+            "vertrouwelijkheidaanduiding": document.vertrouwelijkheidaanduiding,
+            "verzenddatum": document.verzenddatum,
         }
-        informatieobject_document._get_connection().update(
+        writer.update(
             informatieobject_document.Index().name,
             informatieobject_document.meta.id,
-            body,
-            refresh="wait_for",
-            retry_on_conflict=settings.ES_RETRY_ON_CONFLICT,
+            doc,
         )
     return informatieobject_document
 
 
 def delete_informatieobject_document(document_url: str) -> None:
     created, informatieobject_document = _get_informatieobject_document(document_url)
+    writer.discard(
+        informatieobject_document.Index().name, informatieobject_document.meta.id
+    )
     informatieobject_document.delete()
 
 
@@ -625,18 +691,7 @@ def update_related_zaken_in_informatieobject_document(
 ) -> None:
     # Get zaken information from zaken index
     zios = get_zaakinformatieobjecten_related_to_informatieobject(informatieobject_url)
-
-    def _get_zaak(url: str) -> Zaak:
-        return get_zaak(zaak_url=url)
-
-    with parallel(max_workers=settings.MAX_WORKERS) as executor:
-        zaken = list(executor.map(_get_zaak, list({zio.zaak for zio in zios})))
-
-    # resolve zaaktypen
-    zaaktypen = {zt.url: zt for zt in get_zaaktypen()}
-
-    for zaak in zaken:
-        zaak.zaaktype = zaaktypen[zaak.zaaktype]
+    zaken = _resolve_related_zaken([zio.zaak for zio in zios])
 
     # Fetch object document to be updated
     informatieobject = get_document(informatieobject_url)
@@ -646,54 +701,14 @@ def update_related_zaken_in_informatieobject_document(
 
     # Create related_zaak documenten and update object document
     related_zaken = [create_related_zaak_document(zaak) for zaak in zaken]
-    informatieobject_document.related_zaken = related_zaken
-    informatieobject_document.save(refresh="wait_for")
+    writer.update(
+        informatieobject_document.Index().name,
+        informatieobject_document.meta.id,
+        {"related_zaken": related_zaken},
+    )
     return
 
 
 def update_related_zaak_in_informatieobject_documents(zaak: Zaak) -> None:
-    # Check if related_zaak really changed before indexing all relevant
-    # documents
     related_zaak = create_related_zaak_document(zaak)
-    io = (
-        InformatieObjectDocument.search()
-        .query(
-            Nested(
-                path="related_zaken",
-                query=Bool(filter=[Term(related_zaken__url=zaak.url)]),
-            )
-        )
-        .extra(size=1)
-        .execute()
-    )
-
-    changed = False
-    if io and related_zaak.url in [z.url for z in io[0].related_zaken]:
-        old_rz = [rz for rz in io[0].related_zaken if rz.url == related_zaak.url][0]
-        if any(
-            [
-                old_rz.omschrijving != related_zaak.omschrijving,
-                old_rz.va_order != related_zaak.va_order,
-            ]
-        ):
-            changed = True
-
-    ios = (
-        InformatieObjectDocument.search()
-        .query(
-            Nested(
-                path="related_zaken",
-                query=Bool(filter=[Term(related_zaken__url=zaak.url)]),
-            )
-        )
-        .execute()
-    )
-    if changed:
-        for io in ios:
-            related_zaken = [rz for rz in io.related_zaken if rz.url != zaak.url]
-            related_zaken.append(related_zaak)
-            object_document = InformatieObjectDocument.get(id=io.meta.id)
-            object_document.related_zaken = related_zaken
-            object_document.save(refresh="wait_for")
-
-    return
+    _update_related_zaak_in_documents(InformatieObjectDocument, related_zaak)
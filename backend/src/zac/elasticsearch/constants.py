@@ -0,0 +1,17 @@
+from django.utils.translation import gettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
+
+
+class EigenschapFormaten(DjangoChoices):
+    tekst = ChoiceItem("tekst", _("Text"))
+    getal = ChoiceItem("getal", _("Number"))
+    datum = ChoiceItem("datum", _("Date"))
+    datum_tijd = ChoiceItem("datum_tijd", _("Date and time"))
+
+
+class EigenschapOperators(DjangoChoices):
+    exact = ChoiceItem("exact", _("Equals the value"))
+    prefix = ChoiceItem("prefix", _("Starts with the value"))
+    contains = ChoiceItem("contains", _("Contains the value"))
+    range = ChoiceItem("range", _("Lies within the bounds"))
@@ -39,6 +39,11 @@ strip_leading_zeros_in_zaakidentificatie_analyzer = analyzer(
     filter=["lowercase"],
     char_filter=[strip_leading_zeros_in_zaakidentificatie_filter],
 )
+lowercase_keyword_analyzer = analyzer(
+    "lowercase_keyword",
+    tokenizer="keyword",
+    filter=["lowercase"],
+)
 standard_dutch_analyzer = analyzer(
     "standard",
     tokenizer="standard",
@@ -109,6 +114,9 @@ class ZaakDocument(Document):
         fields={"keyword": field.Keyword()},
         analyzer=strip_leading_zeros_in_zaakidentificatie_analyzer,
     )
+    identificatie_suggest = field.SearchAsYouType(
+        analyzer=strip_leading_zeros_in_zaakidentificatie_analyzer
+    )
     bronorganisatie = field.Keyword()
     omschrijving = field.Text(
         fields={"keyword": field.Keyword()},
@@ -139,21 +147,36 @@ class ZaakDocument(Document):
             ngram_analyzer,
             standard_dutch_analyzer,
             strip_leading_zeros_in_zaakidentificatie_analyzer,
+            lowercase_keyword_analyzer,
         ]
 
     class Meta:
         dynamic_templates = MetaField(
             [
                 {
+                    # `normalized` serves the case insensitive exact and prefix
+                    # searches, `ngram` the contains searches.
                     "eigenschap_string": {
                         "path_match": "eigenschappen.tekst.*",
-                        "mapping": {"type": "keyword"},
+                        "mapping": {
+                            "type": "keyword",
+                            "fields": {
+                                "normalized": {
+                                    "type": "text",
+                                    "analyzer": lowercase_keyword_analyzer,
+                                },
+                                "ngram": {
+                                    "type": "text",
+                                    "analyzer": ngram_analyzer,
+                                },
+                            },
+                        },
                     }
                 },
                 {
                     "eigenschap_number": {
                         "path_match": "eigenschappen.getal.*",
-                        "mapping": {"type": "integer"},
+                        "mapping": {"type": "double"},
                     }
                 },
                 {
@@ -230,6 +253,29 @@ class ObjectDocument(Document):
         )
 
 
+class MetaObjectDocument(Document):
+    """
+    Checklist and review request meta-objects, with the fields the werkvoorraad
+    filters on.
+    """
+
+    url = field.Keyword()
+    objecttype = field.Keyword()
+    zaak = field.Keyword()
+    locked = field.Boolean()
+    created = field.Date()
+    # username of the requester of a review request
+    requester = field.Keyword()
+    # users and groups with unanswered questions in a checklist
+    open_user_assignees = field.Keyword()
+    open_group_assignees = field.Keyword()
+    record_data = field.Object(enabled=False)
+
+    class Index:
+        name = settings.ES_INDEX_META_OBJECTEN
+        settings = {"index.mapping.ignore_malformed": True}
+
+
 class InformatieObjectTypeDocument(InnerDoc):
     url = field.Keyword()
     begin_geldigheid = field.Date()
@@ -271,6 +317,7 @@ class InformatieObjectDocument(Document):
         analyzer=ngram_analyzer,
         search_analyzer=standard_dutch_analyzer,
     )
+    titel_suggest = field.SearchAsYouType()
     url = field.Keyword()
     versie = field.Integer()
     verzenddatum = field.Date()
@@ -278,6 +325,7 @@ class InformatieObjectDocument(Document):
     informatieobjecttype = field.Object(InformatieObjectTypeDocument)
     related_zaken = Nested(RelatedZaakDocument)
     last_edited_date = field.Date()
+    last_edited_by = field.Keyword()
     vertrouwelijkheidaanduiding = field.Keyword()
 
     class Index:
@@ -286,3 +334,15 @@ class InformatieObjectDocument(Document):
             "index.mapping.ignore_malformed": True,
             "max_ngram_diff": settings.MAX_GRAM - settings.MIN_GRAM,
         }
+
+
+class PermissionLookupDocument(Document):
+    """
+    The atomic permission URLs of a requester, used in terms lookups.
+    """
+
+    urls = field.Keyword(index=False)
+    version = field.Integer(index=False)
+
+    class Index:
+        name = settings.ES_INDEX_PERMISSIONS
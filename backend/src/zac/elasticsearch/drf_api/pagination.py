@@ -1,16 +1,98 @@
 from typing import List, Optional
 
+from django.core import signing
+from django.utils.translation import gettext_lazy as _
+
+from elasticsearch_dsl import Search
+from furl import furl
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from zac.core.api.pagination import BffPagination
 
+from ..searches import close_point_in_time, execute_search_after
 from .utils import get_document_fields, get_document_properties
 
 
 class ESPagination(BffPagination):
+    """
+    Paginate ES searches by page number, or by cursor if the ``cursor`` query
+    parameter is given.
+
+    Cursor pagination uses ``search_after`` on the sort values of the last result,
+    so deep pages are as cheap as the first one and aren't limited by the
+    ``max_result_window`` of the index. The results are tie-broken on ``url`` to
+    keep the order stable. Start with an empty cursor and follow the ``next`` links.
+    If ``ES_PAGINATION_KEEP_ALIVE`` is set, the pages are read from a point in time,
+    so documents changing in between pages don't shift the results.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_salt = "zac.elasticsearch.pagination.cursor"
+    invalid_cursor_message = _("Invalid cursor.")
+
     def __init__(self, view: Optional[APIView] = None):
         self.view = view
+        self.cursor_mode = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.cursor_mode = True
+        self.request = request
+        return self.paginate_search_after(queryset, request)
+
+    def decode_cursor(self, request) -> dict:
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return {}
+        try:
+            return signing.loads(encoded, salt=self.cursor_salt)
+        except signing.BadSignature:
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cursor: dict) -> str:
+        return signing.dumps(cursor, salt=self.cursor_salt, compress=True)
+
+    def paginate_search_after(self, search: Search, request) -> list:
+        cursor = self.decode_cursor(request)
+        page_size = self.get_page_size(request)
+
+        response, pit_id = execute_search_after(
+            search.extra(track_total_hits=True),
+            page_size + 1,
+            search_after=cursor.get("search_after"),
+            pit_id=cursor.get("pit"),
+        )
+        hits = list(response)
+        self.count = response.hits.total.value
+
+        if len(hits) > page_size:
+            hits = hits[:page_size]
+            self.next_cursor = {"search_after": list(hits[-1].meta.sort)}
+            if pit_id:
+                self.next_cursor["pit"] = pit_id
+        else:
+            self.next_cursor = None
+            close_point_in_time(search, pit_id)
+        return hits
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        url = furl(self.request.build_absolute_uri())
+        url.args[self.cursor_query_param] = self.encode_cursor(self.next_cursor)
+        return url.url
+
+    def get_previous_link(self):
+        # cursors only go forward
+        if self.cursor_mode:
+            return None
+        return super().get_previous_link()
 
     def get_paginated_response(self, data, fields: List[str]):
         return Response(
@@ -18,7 +100,7 @@ class ESPagination(BffPagination):
                 "fields": fields,
                 "next": self.get_next_link(),
                 "previous": self.get_previous_link(),
-                "count": self.page.paginator.count,
+                "count": self.count if self.cursor_mode else self.page.paginator.count,
                 "results": data,
             }
         )
@@ -0,0 +1,79 @@
+import csv
+import io
+from typing import Any, Dict, Iterable, Iterator
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize
+from rest_framework.renderers import BaseRenderer
+
+
+class StreamingJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Render a JSON array item by item.
+    """
+
+    def render_stream(self, items: Iterable[Any]) -> Iterator[bytes]:
+        yield b"["
+        for index, item in enumerate(items):
+            if index:
+                yield b","
+            yield self.render(item)
+        yield b"]"
+
+
+class NDJSONRenderer(StreamingJSONRenderer):
+    """
+    Render newline delimited JSON, one line per item.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, list):
+            return b"".join(self.render_stream(data))
+        return super().render(data, accepted_media_type, renderer_context)
+
+    def render_stream(self, items: Iterable[Any]) -> Iterator[bytes]:
+        for item in items:
+            yield super().render(item) + b"\n"
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Render flat CSV rows, with the keys of the first item as header.
+
+    Lists are joined with "; ", nested objects with ", ".
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b"".join(self.render_stream(data if isinstance(data, list) else [data]))
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        if isinstance(value, dict):
+            return ", ".join(str(item) for item in value.values() if item)
+        if isinstance(value, (list, tuple)):
+            return "; ".join(CSVRenderer._format_value(item) for item in value)
+        return "" if value is None else str(value)
+
+    def render_stream(self, items: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = None
+        for item in items:
+            item = camelize(item, **self.json_underscoreize)
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(item))
+                writer.writeheader()
+            writer.writerow(
+                {key: self._format_value(value) for key, value in item.items()}
+            )
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
@@ -15,6 +15,7 @@ from zac.contrib.dowc.fields import DowcUrlField
 from zac.core.camunda.utils import resolve_assignee
 from zac.core.fields import DownloadDocumentURLField
 
+from ..constants import EigenschapFormaten, EigenschapOperators
 from ..documents import InformatieObjectDocument, ZaakDocument
 from ..models import SearchReport
 from .fields import OrderedMultipleChoiceField
@@ -55,6 +56,91 @@ class SearchZaaktypeSerializer(serializers.Serializer):
     catalogus = serializers.URLField(help_text=_("URL-reference of related CATALOGUS."))
 
 
+class EigenschapSearchSerializer(serializers.Serializer):
+    formaat = serializers.ChoiceField(
+        choices=EigenschapFormaten.choices,
+        default=EigenschapFormaten.tekst,
+        help_text=_("Format of the EIGENSCHAP."),
+    )
+    operator = serializers.ChoiceField(
+        choices=EigenschapOperators.choices,
+        required=False,
+        help_text=_(
+            "How the EIGENSCHAP is compared. Defaults to `contains` for `tekst` and "
+            "to `exact` for the other formats. `prefix` and `contains` are only "
+            "supported for `tekst`, `range` only for the other formats."
+        ),
+    )
+    value = serializers.CharField(
+        required=False, help_text=_("Value of the EIGENSCHAP.")
+    )
+    gt = serializers.CharField(required=False, help_text=_("Lower bound, exclusive."))
+    gte = serializers.CharField(required=False, help_text=_("Lower bound."))
+    lt = serializers.CharField(required=False, help_text=_("Upper bound, exclusive."))
+    lte = serializers.CharField(required=False, help_text=_("Upper bound."))
+
+    value_fields = {
+        EigenschapFormaten.tekst: serializers.CharField,
+        EigenschapFormaten.getal: serializers.FloatField,
+        EigenschapFormaten.datum: serializers.DateField,
+        EigenschapFormaten.datum_tijd: serializers.DateTimeField,
+    }
+    bounds = ("gt", "gte", "lt", "lte")
+
+    def validate(self, attrs):
+        formaat = attrs["formaat"]
+        operator = attrs.setdefault(
+            "operator",
+            (
+                EigenschapOperators.contains
+                if formaat == EigenschapFormaten.tekst
+                else EigenschapOperators.exact
+            ),
+        )
+        if formaat == EigenschapFormaten.tekst:
+            allowed = [
+                EigenschapOperators.exact,
+                EigenschapOperators.prefix,
+                EigenschapOperators.contains,
+            ]
+        else:
+            allowed = [EigenschapOperators.exact, EigenschapOperators.range]
+        if operator not in allowed:
+            raise serializers.ValidationError(
+                {
+                    "operator": _(
+                        "Operator `{operator}` is not supported for `{formaat}`."
+                    ).format(operator=operator, formaat=formaat)
+                }
+            )
+
+        if operator == EigenschapOperators.range:
+            fields = [bound for bound in self.bounds if bound in attrs]
+            if not fields:
+                raise serializers.ValidationError(
+                    _("A range requires at least one of: {bounds}.").format(
+                        bounds=", ".join(self.bounds)
+                    )
+                )
+        else:
+            fields = ["value"]
+            if "value" not in attrs:
+                raise serializers.ValidationError(
+                    {"value": _("This field is required.")}
+                )
+
+        # Keep the values JSON serializable, search reports store them.
+        value_field = self.value_fields[formaat]()
+        validated = {"formaat": formaat, "operator": operator}
+        for name in fields:
+            try:
+                internal = value_field.to_internal_value(attrs[name])
+            except serializers.ValidationError as exc:
+                raise serializers.ValidationError({name: exc.detail})
+            validated[name] = value_field.to_representation(internal)
+        return validated
+
+
 class SearchSerializer(serializers.Serializer):
     behandelaar = serializers.CharField(
         required=False, help_text=_("`username` of behandelaar.")
@@ -62,7 +148,10 @@ class SearchSerializer(serializers.Serializer):
     eigenschappen = serializers.JSONField(
         required=False,
         help_text=_(
-            "ZAAK-EIGENSCHAPs in format `<property name>:{'value': <property value>}`."
+            "ZAAK-EIGENSCHAPs in format `<property name>:{'value': <property value>}`. "
+            "Optionally include the `formaat` of the EIGENSCHAP and an `operator`: "
+            "`exact`, `prefix`, `contains` or `range` with the bounds `gt`, `gte`, "
+            "`lt` and/or `lte` instead of the `value`."
         ),
     )
     fields = OrderedMultipleChoiceField(
@@ -109,11 +198,10 @@ class SearchSerializer(serializers.Serializer):
                 raise serializers.ValidationError(
                     "'Eigenschappen' field values should be JSON objects"
                 )
-            if "value" not in value:
-                raise serializers.ValidationError(
-                    "'Eigenschappen' fields should include 'value' attribute"
-                )
-            validated_data[name] = re.escape(value["value"])
+            serializer = EigenschapSearchSerializer(data=value)
+            if not serializer.is_valid():
+                raise serializers.ValidationError({name: serializer.errors})
+            validated_data[name] = serializer.validated_data
         return validated_data
 
 
@@ -126,6 +214,15 @@ class QuickSearchSerializer(serializers.Serializer):
     )
 
 
+class SuggestSerializer(serializers.Serializer):
+    search = serializers.CharField(
+        required=True,
+        help_text=_(
+            "The (partial) ZAAK identification or INFORMATIEOBJECT title typed so far."
+        ),
+    )
+
+
 class SearchReportSerializer(serializers.ModelSerializer):
     query = SearchSerializer()
 
@@ -365,6 +462,15 @@ class QuickSearchResultSerializer(serializers.Serializer):
     )
 
 
+class SuggestResultSerializer(serializers.Serializer):
+    zaken = QSZaakDocumentSerializer(
+        many=True, help_text=_("ZAAKs with an identification matching the search.")
+    )
+    documenten = QSInformatieObjectDocumentSerializer(
+        many=True, help_text=_("INFORMATIEOBJECTs with a title matching the search.")
+    )
+
+
 class SearchInformatieObjectSerializer(serializers.Serializer):
     fields = OrderedMultipleChoiceField(
         required=False,
@@ -378,6 +484,7 @@ class SearchInformatieObjectSerializer(serializers.Serializer):
             "write_url",
             "current_user_is_editing",
             "last_edited_date",
+            "last_edited_by",
         ],
         default=[
             "auteur",
@@ -390,6 +497,7 @@ class SearchInformatieObjectSerializer(serializers.Serializer):
             "identificatie",
             "informatieobjecttype",
             "last_edited_date",
+            "last_edited_by",
             "locked",
             "read_url",
             "titel",
@@ -432,6 +540,9 @@ class ESListZaakDocumentSerializer(serializers.Serializer):
     last_edited_date = serializers.DateTimeField(
         help_text=_("Shows last edited datetime."), allow_null=True
     )
+    last_edited_by = serializers.CharField(
+        help_text=_("Shows who last edited the INFORMATIEOBJECT."), allow_null=True
+    )
     locked = serializers.BooleanField()
     locked_by = serializers.SerializerMethodField(
         help_text=_("Email of user that locked document.")
@@ -9,6 +9,7 @@ from .views import (
     QuickSearchView,
     SearchReportViewSet,
     SearchView,
+    SuggestView,
     VGUReportInformatieObjectenView,
     VGUReportZakenView,
 )
@@ -22,6 +23,7 @@ urlpatterns = [
     path("zaken/autocomplete", GetZakenView.as_view(), name="zaken-search"),
     path("zaken", SearchView.as_view(), name="search"),
     path("quick-search", QuickSearchView.as_view(), name="quick-search"),
+    path("suggest", SuggestView.as_view(), name="suggest"),
     path(
         "cases/<str:bronorganisatie>/<str:identificatie>/documents",
         ListZaakDocumentsESView.as_view(),
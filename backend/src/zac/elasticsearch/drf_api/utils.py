@@ -25,6 +25,10 @@ def get_document_fields(
                 for nested_field_name, nested_field_value in list(nested_fields):
                     yield (f"{field_name}.{nested_field_name}", nested_field_value)
 
+        elif field_type == field.SearchAsYouType.name:
+            # These only duplicate another field to serve autocomplete queries.
+            continue
+
         else:
             if sortable and field_type == field.Text.name:
                 try:
@@ -1,6 +1,7 @@
-from typing import Any, Callable, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
 from django.core.exceptions import ImproperlyConfigured
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
@@ -28,12 +29,14 @@ from ..searches import (
     quick_search,
     search_informatieobjects,
     search_zaken,
+    suggest,
     usage_report_informatieobjecten,
     usage_report_zaken,
 )
 from .filters import ESOrderingFilter
 from .pagination import ESPagination
 from .parsers import IgnoreCamelCaseJSONParser
+from .renderers import CSVRenderer, NDJSONRenderer, StreamingJSONRenderer
 from .serializers import (
     ESListZaakDocumentSerializer,
     QuickSearchResultSerializer,
@@ -41,6 +44,8 @@ from .serializers import (
     SearchInformatieObjectSerializer,
     SearchReportSerializer,
     SearchSerializer,
+    SuggestResultSerializer,
+    SuggestSerializer,
     VGUReportInputSerializer,
     VGUReportIOSerializer,
     VGUReportZakenSerializer,
@@ -51,6 +56,17 @@ from .utils import es_document_to_ordering_parameters
 
 # ---------- Helpers / Mixins ----------
 
+CURSOR_PARAMETER = OpenApiParameter(
+    name="cursor",
+    type=str,
+    location=OpenApiParameter.QUERY,
+    required=False,
+    description=_(
+        "Paginate by cursor instead of page number. Leave empty for the first page, "
+        "the `next` link holds the cursor of the next page."
+    ),
+)
+
 
 class PerformSearchMixin:
     def perform_search(self, search_query):
@@ -176,6 +192,7 @@ class SearchView(PerformSearchMixin, PaginatedSearchMixin, views.APIView):
                 required=False,
                 description=_("Page of paginated response."),
             ),
+            CURSOR_PARAMETER,
         ],
         responses=ZaakDocumentSerializer(many=True),
     )
@@ -230,6 +247,30 @@ class QuickSearchView(views.APIView):
         return Response(QuickSearchResultSerializer(results).data)
 
 
+class SuggestView(views.APIView):
+    authentication_classes = [
+        ApplicationTokenAuthentication
+    ] + api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = (HasTokenAuth | IsAuthenticated,)
+
+    @extend_schema(
+        summary=_("Suggest ZAAKs and INFORMATIEOBJECTs as the user types."),
+        parameters=input_serializer_to_parameters(SuggestSerializer),
+        responses=SuggestResultSerializer,
+    )
+    def get(self, request: Request) -> Response:
+        """
+        Retrieve zaken by (partial) identificatie and documenten by (partial) titel.
+        Only returns data the user is allowed to see.
+        Results are capped to 10 per type.
+        """
+        serializer = SuggestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        results = suggest(serializer.validated_data["search"], request=request)
+        return Response(SuggestResultSerializer(results).data)
+
+
 @extend_schema_view(
     create=extend_schema(summary=_("Create search report.")),
     destroy=extend_schema(summary=_("Destroy search report.")),
@@ -249,6 +290,7 @@ class QuickSearchView(views.APIView):
                 required=False,
                 description=_("Page of paginated response."),
             ),
+            CURSOR_PARAMETER,
         ],
         responses=ZaakDocumentSerializer(many=True),
     ),
@@ -329,12 +371,26 @@ class ListZaakDocumentsESView(GetZaakMixin, PaginatedSearchMixin, views.APIView)
         )
         page = list(self.paginate_results(search))
 
-        open_documenten = check_document_status(documents=[doc.url for doc in page])
+        # documents opened from the ZAAK are known by the ZAAK, locked documents
+        # could have been opened from another ZAAK.
+        open_documenten = {
+            dowc.document: dowc for dowc in check_document_status(zaak=zaak.url)
+        }
+        if locked := [
+            doc.url for doc in page if doc.locked and doc.url not in open_documenten
+        ]:
+            open_documenten.update(
+                {
+                    dowc.document: dowc
+                    for dowc in check_document_status(documents=locked)
+                }
+            )
+
         serializer = ESListZaakDocumentSerializer(
             page,
             many=True,
             context={
-                "open_documenten": {dowc.document: dowc for dowc in open_documenten},
+                "open_documenten": open_documenten,
                 "zaak_is_closed": bool(zaak.einddatum),
                 "request": request,
             },
@@ -348,8 +404,16 @@ class ListZaakDocumentsESView(GetZaakMixin, PaginatedSearchMixin, views.APIView)
 
 
 class VGUBaseView(views.APIView):
+    """
+    Stream the rows of a report as a JSON array, as NDJSON or as CSV.
+
+    The output format follows the ``Accept`` header or the ``format`` query
+    parameter.
+    """
+
     authentication_classes = [ApplicationTokenAuthentication]
     permission_classes = (HasTokenAuth,)
+    renderer_classes = (StreamingJSONRenderer, NDJSONRenderer, CSVRenderer)
     serializer_class = VGUReportInputSerializer
     report_fn: Callable[..., Iterable[Dict[str, Any]]] = None
     response_serializer_class = None
@@ -359,12 +423,13 @@ class VGUBaseView(views.APIView):
             raise NotImplementedError("Subclasses must set `report_fn`.")
         return self.report_fn(start_period=start_period, end_period=end_period)
 
-    def serialize_response(self, results_iterable):
+    def serialize_rows(self, results_iterable) -> Iterator[Dict[str, Any]]:
         if self.response_serializer_class is None:
             raise NotImplementedError(
                 "Subclasses must set `response_serializer_class`."
             )
-        return self.response_serializer_class(results_iterable, many=True)
+        for row in results_iterable:
+            yield self.response_serializer_class(row).data
 
     def post(self, request: Request, *args, **kwargs):
         input_serializer = self.serializer_class(data=request.data)
@@ -374,8 +439,11 @@ class VGUBaseView(views.APIView):
         end_period = input_serializer.validated_data["end_period"]
 
         results = self.run_report(start_period, end_period)
-        serializer = self.serialize_response(results)
-        return Response(serializer.data)
+        renderer = request.accepted_renderer
+        return StreamingHttpResponse(
+            renderer.render_stream(self.serialize_rows(results)),
+            content_type=f"{renderer.media_type}; charset=utf-8",
+        )
 
 
 class VGUReportZakenView(VGUBaseView):
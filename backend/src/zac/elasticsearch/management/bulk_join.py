@@ -0,0 +1,92 @@
+import json
+import os
+import sqlite3
+import tempfile
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+from zac.core.utils import fetch_next_url_pagination
+from zac.zgw_client import ZGWClient
+
+# SQLite limits the number of variables in a single query
+MAX_QUERY_VARIABLES = 900
+
+
+def iter_paginated_results(
+    client: ZGWClient, resource: str, query_params: Dict = None
+) -> Iterator[dict]:
+    """
+    Yield all results of a paginated list endpoint, one page at a time.
+    """
+    query_params = query_params or {}
+    while True:
+        response = client.list(resource, query_params=query_params)
+        yield from response["results"]
+        query_params = fetch_next_url_pagination(response, query_params=query_params)
+        if not query_params["page"]:
+            break
+
+
+class RelatedObjectStore:
+    """
+    Temporary on-disk store of API objects, looked up by one of their attributes.
+
+    Used to index all ZAAKen: instead of retrieving the related objects per ZAAK,
+    they're streamed once from the global list endpoints into this store and then
+    joined onto every page of ZAAKen.
+    """
+
+    def __init__(self, directory: str = None):
+        self._tempdir = tempfile.TemporaryDirectory(dir=directory)
+        self.connection = sqlite3.connect(
+            os.path.join(self._tempdir.name, "objects.sqlite3")
+        )
+        self.connection.execute("CREATE TABLE objects (kind TEXT, key TEXT, data TEXT)")
+        self.connection.execute("CREATE INDEX objects_key ON objects (kind, key)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+        self._tempdir.cleanup()
+
+    def add(
+        self, kind: str, key_field: str, objects: Iterable[dict], batch_size=1000
+    ) -> int:
+        """
+        Store the objects under the value of their ``key_field``.
+
+        Returns the number of stored objects.
+        """
+        count = 0
+        iterator = iter(objects)
+        while batch := list(islice(iterator, batch_size)):
+            self.connection.executemany(
+                "INSERT INTO objects (kind, key, data) VALUES (?, ?, ?)",
+                [
+                    (kind, obj[key_field], json.dumps(obj, separators=(",", ":")))
+                    for obj in batch
+                ],
+            )
+            count += len(batch)
+        self.connection.commit()
+        return count
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> Dict[str, List[dict]]:
+        keys = list(set(keys))
+        results = defaultdict(list)
+        for start in range(0, len(keys), MAX_QUERY_VARIABLES):
+            chunk = keys[start : start + MAX_QUERY_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT key, data FROM objects WHERE kind = ? AND key IN ({placeholders})",
+                [kind, *chunk],
+            )
+            for key, data in rows:
+                results[key].append(json.loads(data))
+        return results
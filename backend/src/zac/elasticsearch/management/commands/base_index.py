@@ -16,6 +16,7 @@ from zac.core.cache import (
 )
 from zac.core.services import get_zaak
 from zac.elasticsearch.documents import ZaakDocument
+from zac.utils.decorators import bulk_cache
 from zgw.models import Zaak
 
 from ...utils import check_if_index_exists
@@ -124,10 +125,12 @@ class IndexCommand(ABC):
                 f"Can only index last {self.reindex_last} ZAAKen or ZAAK: {self.reindex_zaak}."
             )
 
-        if self.reindex_last or self.reindex_zaak:
-            self.handle_reindexing()
-        else:
-            self.handle_indexing()
+        # don't evict the cached API objects of interactive users
+        with bulk_cache(alias="bulk"):
+            if self.reindex_last or self.reindex_zaak:
+                self.handle_reindexing()
+            else:
+                self.handle_indexing()
 
     def get_chunks(self, iterable):
         iterator = iter(iterable)
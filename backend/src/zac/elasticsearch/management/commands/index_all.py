@@ -3,11 +3,12 @@ from django.core.management import BaseCommand, call_command
 from django.core.management.base import CommandParser
 
 from ..constants import IndexTypes
+from ..permissions import init_permission_lookup_index
 from ..utils import ProgressOutputWrapper
 
 
 class Command(BaseCommand):
-    help = "Indexes ZAAKs, ZAAKINFORMATIEOBJECTen, ZAAKOBJECTen, INFORMATIEOBJECTen and OBJECTen."
+    help = "Indexes ZAAKs, ZAAKINFORMATIEOBJECTen, ZAAKOBJECTen, INFORMATIEOBJECTen, OBJECTen and meta-OBJECTen."
 
     def add_arguments(self, parser: CommandParser) -> None:
         super().add_arguments(parser)
@@ -76,10 +77,12 @@ class Command(BaseCommand):
             IndexTypes.index_zaken,
             IndexTypes.index_zaakobjecten,
             IndexTypes.index_objecten,
+            IndexTypes.index_meta_objecten,
             IndexTypes.index_zaakinformatieobjecten,
             IndexTypes.index_documenten,
         ]
 
+        init_permission_lookup_index()
         for index_this in index_these:
             self.stdout.write(f"Calling {index_this} {' '.join(args)}.")
             call_command(index_this, *args)
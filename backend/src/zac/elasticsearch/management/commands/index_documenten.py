@@ -236,13 +236,13 @@ class Command(IndexCommand, BaseCommand):
                     [doc.url for doc in documenten],
                 )
             )
-            last_edited_dates = {
-                at.resource_url: at.last_edited_date for at in audittrails if at
-            }
+            latest_audittrails = {at.resource_url: at for at in audittrails if at}
 
         # Bulk resolve audittrails.
         for doc in documenten:
-            doc.last_edited_date = last_edited_dates.get(doc.url, None)
+            at = latest_audittrails.get(doc.url)
+            doc.last_edited_date = at.last_edited_date if at else None
+            doc.last_edited_by = at.last_edited_by if at else None
 
         return documenten
 
@@ -0,0 +1,62 @@
+import logging
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from zac.core.models import MetaObjectTypesConfig
+from zac.core.services import search_objects
+
+from ...api import create_meta_object_document
+from ...documents import MetaObjectDocument
+from .base_index import IndexCommand
+
+perf_logger = logging.getLogger("performance")
+
+
+class Command(IndexCommand, BaseCommand):
+    help = "Create documents in ES by indexing the checklist and review request meta-OBJECTen from OBJECTS API."
+    _index = settings.ES_INDEX_META_OBJECTEN
+    _type = "meta_object"
+    _document = MetaObjectDocument
+    _verbose_name_plural = "meta-OBJECTen"
+
+    @property
+    def objecttype_urls(self) -> List[str]:
+        meta_config = MetaObjectTypesConfig.get_solo()
+        return [
+            url
+            for url in [
+                meta_config.checklist_objecttype,
+                meta_config.review_request_objecttype,
+            ]
+            if url
+        ]
+
+    def batch_index(self) -> Iterator[Dict]:
+        super().batch_index()
+        zaken = self.get_zaken()
+        for objecttype_url in self.objecttype_urls:
+            if not zaken:
+                yield from self.meta_objecten_generator(objecttype_url)
+            else:
+                for zaak in zaken:
+                    yield from self.meta_objecten_generator(
+                        objecttype_url, zaak_url=zaak.url
+                    )
+
+    def meta_objecten_generator(
+        self, objecttype_url: str, zaak_url: Optional[str] = None
+    ) -> Iterator[Dict]:
+        filters = {"type": objecttype_url}
+        if zaak_url:
+            filters["data_attrs"] = f"zaak__exact__{zaak_url}"
+
+        query_params = {"pageSize": 100}
+        get_more = True
+        while get_more:
+            response, query_params = search_objects(filters, query_params=query_params)
+            perf_logger.info("Fetched %d meta-OBJECTen.", len(response["results"]))
+            get_more = query_params.get("page", None)
+            for obj in response["results"]:
+                yield create_meta_object_document(obj).to_dict(True)
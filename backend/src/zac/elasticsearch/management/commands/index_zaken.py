@@ -3,11 +3,15 @@ from typing import Dict, Iterator, List
 
 from django.conf import settings
 from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
 
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.zaken import Status
 from zgw_consumers.concurrent import parallel
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
+from zac.core.rollen import Rol
 from zac.core.services import (
     fetch_zaaktype,
     get_rollen,
@@ -32,6 +36,7 @@ from ...documents import (
     ZaakDocument,
     ZaakTypeDocument,
 )
+from ..bulk_join import RelatedObjectStore, iter_paginated_results
 from ..utils import get_memory_usage
 from .base_index import IndexCommand
 
@@ -44,6 +49,64 @@ class Command(IndexCommand, BaseCommand):
     _type = "zaak"
     _document = ZaakDocument
     _verbose_name_plural = "ZAAKen"
+    store = None
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--bulk-join",
+            action="store_true",
+            help=(
+                "Retrieve all ROLlen and STATUSsen from the global list endpoints "
+                "upfront instead of per ZAAK. Only used when indexing all ZAAKen."
+            ),
+        )
+        parser.add_argument(
+            "--bulk-join-dir",
+            type=str,
+            help="Directory to store the ROLlen and STATUSsen in while indexing.",
+        )
+
+    def handle(self, **options):
+        self.bulk_join = options["bulk_join"]
+        self.bulk_join_dir = options["bulk_join_dir"]
+        if self.bulk_join and (options["reindex_last"] or options["reindex_zaak"]):
+            raise RuntimeError("Bulk join can only be used to index all ZAAKen.")
+        try:
+            super().handle(**options)
+        finally:
+            # also when indexing failed halfway
+            self.close_store()
+
+    def close_store(self) -> None:
+        if self.store:
+            self.store.close()
+            self.store = None
+
+    def load_related_objects(self, clients: list) -> RelatedObjectStore:
+        """
+        Stream all ROLlen and STATUSsen of the ZRCs into an on-disk store.
+
+        This takes one request per page rather than one request per ZAAK.
+        """
+        store = RelatedObjectStore(directory=self.bulk_join_dir)
+        try:
+            for client in clients:
+                client.refresh_auth()
+                num_rollen = store.add(
+                    "rol", "zaak", iter_paginated_results(client, "rol")
+                )
+                client.refresh_auth()
+                num_statussen = store.add(
+                    "status", "url", iter_paginated_results(client, "status")
+                )
+                self.stdout.write(
+                    f"Stored {num_rollen} ROLlen and {num_statussen} STATUSsen of {client.base_url}."
+                )
+        except BaseException:
+            store.close()
+            raise
+        return store
 
     def batch_index(self) -> Iterator[ZaakDocument]:
         super().batch_index()
@@ -79,6 +142,10 @@ class Command(IndexCommand, BaseCommand):
                 total_expected_zaken = min(total_expected_zaken, self.reindex_last)
                 self.reindexed = 0
 
+            if self.bulk_join:
+                self.stdout.write("Retrieving all ROLlen and STATUSsen...")
+                self.store = self.load_related_objects(clients)
+
             self.stdout.write("Now the real work starts, hold on!")
 
             self.stdout.start_progress()
@@ -115,6 +182,7 @@ class Command(IndexCommand, BaseCommand):
                     perf_logger.info("Exited ES documents generator.")
 
             self.stdout.end_progress()
+            self.close_store()
 
     def documenten_generator(self, zaken: List[Zaak]) -> Iterator[ZaakDocument]:
         perf_logger.info("  In ES documents generator.")
@@ -169,9 +237,31 @@ class Command(IndexCommand, BaseCommand):
         }
         return zaaktype_documenten
 
+    def get_statussen(self, zaken: List[Zaak]) -> List[Status]:
+        if not self.store:
+            with parallel(max_workers=self.max_workers) as executor:
+                return list(executor.map(get_status, zaken))
+
+        # only the current STATUS of each ZAAK is indexed
+        statussen = self.store.get_many(
+            "status", [zaak.status for zaak in zaken if zaak.status]
+        )
+        return [
+            factory(Status, statussen[zaak.status][0])
+            for zaak in zaken
+            if zaak.status in statussen
+        ]
+
+    def get_rollen(self, zaken: List[Zaak]) -> List[List[Rol]]:
+        if not self.store:
+            with parallel(max_workers=self.max_workers) as executor:
+                return list(executor.map(get_rollen, zaken))
+
+        rollen = self.store.get_many("rol", [zaak.url for zaak in zaken])
+        return [factory(Rol, rollen[zaak.url]) for zaak in zaken]
+
     def create_status_documenten(self, zaken: List[Zaak]) -> Dict[str, StatusDocument]:
-        with parallel(max_workers=self.max_workers) as executor:
-            results = executor.map(get_status, zaken)
+        results = self.get_statussen(zaken)
         status_documenten = {
             status.zaak: create_status_document(status)
             for status in list(results)
@@ -183,8 +273,7 @@ class Command(IndexCommand, BaseCommand):
         return status_documenten
 
     def create_rollen_documenten(self, zaken: List[Zaak]) -> Dict[str, RolDocument]:
-        with parallel(max_workers=self.max_workers) as executor:
-            results = list(executor.map(get_rollen, zaken))
+        results = self.get_rollen(zaken)
 
         list_of_rollen = [rollen for rollen in results if rollen]
 
@@ -4,6 +4,7 @@ from djchoices import ChoiceItem, DjangoChoices
 class IndexTypes(DjangoChoices):
     index_all = ChoiceItem("index_all", "index_all")
     index_documenten = ChoiceItem("index_documenten", "index_documenten")
+    index_meta_objecten = ChoiceItem("index_meta_objecten", "index_meta_objecten")
     index_objecten = ChoiceItem("index_objecten", "index_objecten")
     index_zaakinformatieobjecten = ChoiceItem(
         "index_zaakinformatieobjecten", "index_zaakinformatieobjecten"
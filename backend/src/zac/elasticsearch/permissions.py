@@ -0,0 +1,159 @@
+"""
+Compile the permissions of a requester into an ES filter.
+
+The filter is built from the permission snapshot of the requester (see
+:mod:`zac.accounts.snapshot`), so blueprint permissions are already collapsed to
+the highest VA per (catalogus, omschrijving). The compiled query is cached per
+requester and snapshot version. Large sets of atomic permission URLs are not
+inlined - they are stored in a :class:`PermissionLookupDocument` and referenced
+through a terms lookup instead.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from elasticsearch_dsl import Index, Q
+from elasticsearch_dsl.query import Bool, Nested, Query, Terms
+
+from zac.accounts.permissions import object_type_registry
+from zac.accounts.snapshot import PermissionSnapshot, get_requester_key
+
+from .documents import PermissionLookupDocument
+
+logger = logging.getLogger(__name__)
+
+_lookup_index_ready = False
+_lock = threading.Lock()
+
+
+def init_permission_lookup_index() -> None:
+    """
+    Create the index of the permission lookup documents if it doesn't exist yet.
+
+    The index is created by ``index_all``. Every process checks it once more
+    before it stores its first lookup document, in case ``index_all`` wasn't run.
+    """
+    global _lookup_index_ready
+
+    with _lock:
+        if not _lookup_index_ready:
+            if not Index(settings.ES_INDEX_PERMISSIONS).exists():
+                PermissionLookupDocument.init()
+            _lookup_index_ready = True
+
+
+def get_terms_lookup(
+    document_id: str, urls: List[str], version: int, path: str = "urls"
+) -> dict:
+    """
+    Store the URLs in a lookup document and return the terms lookup referring to it.
+    """
+    if not _lookup_index_ready:
+        init_permission_lookup_index()
+
+    PermissionLookupDocument(
+        meta={"id": document_id}, urls=urls, version=version
+    ).save()
+    return {
+        "index": settings.ES_INDEX_PERMISSIONS,
+        "id": document_id,
+        "path": path,
+    }
+
+
+def compile_allowed_query(
+    snapshot: PermissionSnapshot,
+    requester_key: str,
+    object_type: str,
+    permission: str,
+    on_nested_field: Optional[str] = "",
+) -> Query:
+    allowed = []
+
+    # atomic permissions
+    if object_urls := sorted(snapshot.get_atomic_urls(object_type, permission)):
+        url_field = f"{on_nested_field}__url" if on_nested_field else "url"
+        if len(object_urls) > settings.ES_PERMISSIONS_TERMS_LOOKUP_THRESHOLD:
+            terms = get_terms_lookup(
+                f"{requester_key}:{object_type}:{permission}",
+                object_urls,
+                snapshot.version,
+            )
+        else:
+            terms = object_urls
+        allowed.append(Terms(**{url_field: terms}))
+
+    # blueprint permissions
+    if policies := snapshot.get_policies(object_type, permission):
+        blueprint_class = object_type_registry[object_type].blueprint_class
+        allowed += blueprint_class.search_query_for_policies(
+            policies, on_nested_field=on_nested_field
+        )
+
+    if not allowed:
+        return Q("match_none")
+
+    query = Bool(should=allowed, minimum_should_match=1)
+    if on_nested_field:
+        return Nested(path=on_nested_field, query=query)
+    return query
+
+
+def get_allowed_queries(
+    request,
+    snapshot: PermissionSnapshot,
+    object_type: str,
+    permission: str,
+    nested_fields: Iterable[str] = ("",),
+) -> Dict[str, Query]:
+    """
+    Return the allowed query for each of the nested fields in one cache round trip.
+
+    An empty nested field means the query on the document itself.
+    """
+    nested_fields = list(dict.fromkeys(nested_fields))
+    requester_key = get_requester_key(request)
+    if requester_key is None:
+        return {field: Q("match_none") for field in nested_fields}
+
+    cache_keys = {
+        field: (
+            f"permission_query:{requester_key}:{snapshot.version}:"
+            f"{object_type}:{permission}:{field}"
+        )
+        for field in nested_fields
+    }
+    cached = cache.get_many(cache_keys.values())
+
+    query_dicts, missing = {}, {}
+    for field, cache_key in cache_keys.items():
+        if (query_dict := cached.get(cache_key)) is None:
+            query_dict = compile_allowed_query(
+                snapshot, requester_key, object_type, permission, field
+            ).to_dict()
+            missing[cache_key] = query_dict
+        query_dicts[field] = query_dict
+
+    if missing:
+        timeout = (snapshot.valid_until - timezone.now()).total_seconds()
+        cache.set_many(missing, timeout=max(int(timeout), 1))
+
+    return {field: Q(query_dict) for field, query_dict in query_dicts.items()}
+
+
+def get_allowed_query(
+    request,
+    snapshot: PermissionSnapshot,
+    object_type: str,
+    permission: str,
+    on_nested_field: Optional[str] = "",
+) -> Query:
+    on_nested_field = on_nested_field or ""
+    return get_allowed_queries(
+        request, snapshot, object_type, permission, nested_fields=[on_nested_field]
+    )[on_nested_field]
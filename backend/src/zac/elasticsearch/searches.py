@@ -1,13 +1,15 @@
-import operator
+import hashlib
+import re
 from collections import defaultdict
 from datetime import datetime
-from functools import reduce
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.request import Request
 
 from django.conf import settings
+from django.core.cache import cache
 
-from elasticsearch_dsl import Q, Search
+from elasticsearch_dsl import MultiSearch, Q, Search
+from elasticsearch_dsl.connections import connections
 from elasticsearch_dsl.query import (
     Bool,
     Exists,
@@ -15,28 +17,35 @@ from elasticsearch_dsl.query import (
     MatchNone,
     MultiMatch,
     Nested,
+    Prefix,
     Query,
-    QueryString,
+    Range,
     Term,
     Terms,
+    Wildcard,
 )
+from elasticsearch_dsl.response import Response
 from zgw_consumers.api_models.base import factory
 from zgw_consumers.api_models.constants import RolOmschrijving
 
 from zac.accounts.constants import PermissionObjectTypeChoices
-from zac.accounts.models import BlueprintPermission, UserAtomicPermission
+from zac.accounts.snapshot import get_permission_snapshot, get_requester_key
 from zac.camunda.constants import AssigneeTypeChoices
+from zac.core.config_snapshot import get_config
 from zac.core.models import MetaObjectTypesConfig
 from zac.core.permissions import zaken_inzien
 
+from .constants import EigenschapFormaten, EigenschapOperators
 from .data import ParentAggregation
 from .documents import (
     InformatieObjectDocument,
+    MetaObjectDocument,
     ObjectDocument,
     ZaakDocument,
     ZaakInformatieObjectDocument,
     ZaakObjectDocument,
 )
+from .permissions import get_allowed_queries
 
 
 def query_allowed_for_requester(
@@ -47,56 +56,33 @@ def query_allowed_for_requester(
 ) -> Query:
     """
     construct query part to display only allowed zaken
+
+    The query is compiled from the permission snapshot of the requester and cached.
     """
-    allowed = []
-    if user := request.user:
-        if user.is_superuser:
-            return Q("match_all")
-
-        # atomic permissions
-        object_urls = (
-            UserAtomicPermission.objects.filter(
-                user=user,
-                atomic_permission__object_type=object_type,
-                atomic_permission__permission=permission,
-            )
-            .actual()
-            .values_list("atomic_permission__object_url", flat=True)
-        )
-        if object_urls.count():
-            if on_nested_field:
-                terms = {f"{on_nested_field}__url": list(object_urls)}
-                allowed.append(
-                    Nested(path=on_nested_field, query=Bool(filter=(Terms(**terms))))
-                )
-            else:
-                allowed.append(Terms(url=list(object_urls)))
-
-    if getattr(request.auth, "has_all_reading_rights", False):
-        return Q("match_all")
-
-    # blueprint permissions
-    for blueprint_permission in BlueprintPermission.objects.for_requester(
-        request, actual=True
-    ).filter(object_type=object_type, role__permissions__contains=[permission]):
-        if on_nested_field:
-            allowed.append(
-                Nested(
-                    path=on_nested_field,
-                    query=Bool(
-                        must=blueprint_permission.get_search_query(
-                            on_nested_field=on_nested_field
-                        )
-                    ),
-                )
-            )
-        else:
-            allowed.append(blueprint_permission.get_search_query())
+    on_nested_field = on_nested_field or ""
+    return queries_allowed_for_requester(
+        request, object_type, permission, nested_fields=[on_nested_field]
+    )[on_nested_field]
 
-    if not allowed:
-        return Q("match_none")
 
-    return reduce(operator.or_, allowed)
+def queries_allowed_for_requester(
+    request: Request,
+    object_type: str = PermissionObjectTypeChoices.zaak,
+    permission: str = zaken_inzien.name,
+    nested_fields: Iterable[str] = ("",),
+) -> Dict[str, Query]:
+    """
+    Like :func:`query_allowed_for_requester`, for multiple nested fields at once.
+    """
+    if getattr(request.user, "is_superuser", False) or getattr(
+        request.auth, "has_all_reading_rights", False
+    ):
+        return {field: Q("match_all") for field in nested_fields}
+
+    snapshot = get_permission_snapshot(request)
+    return get_allowed_queries(
+        request, snapshot, object_type, permission, nested_fields=nested_fields
+    )
 
 
 def search_zaakobjecten(
@@ -122,6 +108,54 @@ def search_zaakobjecten(
     return results.hits
 
 
+def eigenschap_query(name: str, search: Union[str, Dict[str, Any]]) -> Query:
+    """
+    Construct the query for a single eigenschap in the zaken index.
+
+    ``search`` holds the ``formaat`` of the eigenschap, the ``operator`` and either
+    the ``value`` or the range bounds. A plain string is a ``contains`` search on a
+    ``tekst`` eigenschap.
+    """
+    if isinstance(search, str):
+        search = {"value": search}
+    formaat = search.get("formaat", EigenschapFormaten.tekst)
+    operator = search.get(
+        "operator",
+        (
+            EigenschapOperators.contains
+            if formaat == EigenschapFormaten.tekst
+            else EigenschapOperators.exact
+        ),
+    )
+    value = search.get("value")
+
+    # replace points in the field name because ES can't process them
+    # see https://discuss.elastic.co/t/class-cast-exception-for-dynamic-field-with-in-its-name/158819/5
+    field = f"eigenschappen.{formaat}.{name.replace('.', ' ')}"
+
+    if operator == EigenschapOperators.range:
+        bounds = {
+            bound: search[bound]
+            for bound in ("gt", "gte", "lt", "lte")
+            if search.get(bound) is not None
+        }
+        return Range(**{field: bounds})
+
+    if formaat != EigenschapFormaten.tekst:
+        return Term(**{field: value})
+
+    value = str(value).lower()
+    if operator == EigenschapOperators.exact:
+        return Term(**{f"{field}.normalized": value})
+    if operator == EigenschapOperators.prefix:
+        return Prefix(**{f"{field}.normalized": value})
+    # Terms shorter than the ngrams can't be looked up in the ngram subfield.
+    if len(value) < settings.MIN_GRAM:
+        escaped = re.sub(r"([\\*?])", r"\\\1", value)
+        return Wildcard(**{f"{field}.normalized": f"*{escaped}*"})
+    return Match(**{f"{field}.ngram": {"query": value, "operator": "and"}})
+
+
 def search_zaken(
     request=None,
     size=settings.ES_SIZE,
@@ -181,15 +215,8 @@ def search_zaken(
             )
         )
     if eigenschappen:
-        for eigenschap_name, eigenschap_value in eigenschappen.items():
-            # replace points in the field name because ES can't process them
-            # see https://discuss.elastic.co/t/class-cast-exception-for-dynamic-field-with-in-its-name/158819/5
-            s = s.query(
-                QueryString(
-                    fields=[f"eigenschappen.*.{eigenschap_name.replace('.', ' ')}"],
-                    query=f"*{eigenschap_value}*",
-                ),
-            )
+        for eigenschap_name, eigenschap_search in eigenschappen.items():
+            s = s.filter(eigenschap_query(eigenschap_name, eigenschap_search))
     if object:
         zon = search_zaakobjecten(zaken=urls, objecten=[object])
         zaakobject_zaakurls = [zo.zaak for zo in zon]
@@ -232,17 +259,24 @@ def search_zaken(
     return response.hits
 
 
+def _suggest_query(field_name: str, term: str) -> Query:
+    """
+    Match the (partial) terms against a ``search_as_you_type`` field.
+    """
+    return MultiMatch(
+        query=term,
+        type="bool_prefix",
+        fields=[field_name, f"{field_name}._2gram", f"{field_name}._3gram"],
+    )
+
+
 def autocomplete_zaak_search(
     identificatie: str,
     request: Optional[Request] = None,
     only_allowed: bool = True,
 ) -> List[ZaakDocument]:
     search = ZaakDocument.search().query(
-        Match(
-            identificatie={
-                "query": identificatie,
-            }
-        )
+        _suggest_query("identificatie_suggest", identificatie)
     )
     if only_allowed:
         search = search.filter(query_allowed_for_requester(request))
@@ -251,11 +285,37 @@ def autocomplete_zaak_search(
     return response.hits
 
 
+def _get_quick_search_cache_key(
+    search_term: str, only_allowed: bool, request: Optional[Request]
+) -> Optional[str]:
+    if not settings.QUICK_SEARCH_CACHE_TIMEOUT:
+        return None
+
+    requester = "all"
+    if only_allowed:
+        if (requester_key := get_requester_key(request)) is None:
+            return None
+        requester = f"{requester_key}:{get_permission_snapshot(request).version}"
+
+    normalized_term = " ".join(search_term.lower().split())
+    term_hash = hashlib.md5(normalized_term.encode("utf-8")).hexdigest()
+    return f"quick_search:{requester}:{term_hash}"
+
+
 def quick_search(
     search_term: str,
     only_allowed: bool = False,
     request: Optional[Request] = None,
-) -> List[Union[ZaakDocument, ObjectDocument]]:
+) -> Dict[str, Response]:
+    """
+    Search zaken, objecten and documenten in a single multi search request.
+
+    If ``QUICK_SEARCH_CACHE_TIMEOUT`` is set, the results are cached per requester
+    and search term for that many seconds.
+    """
+    if only_allowed and not request:
+        raise RuntimeError("If only_allowed is True a request must be passed.")
+
     s_zaken = (
         ZaakDocument.search()
         .source(
@@ -276,7 +336,7 @@ def quick_search(
         )
         .extra(size=15)
     )
-    meta_config = MetaObjectTypesConfig.get_solo()
+    meta_config = get_config(MetaObjectTypesConfig)
     urls = [url for url in meta_config.meta_objecttype_urls.values() if url]
     s_objecten = (
         ObjectDocument.search()
@@ -292,32 +352,113 @@ def quick_search(
         .extra(size=15)
     )
 
-    if only_allowed:
-        if not request:
-            raise RuntimeError("If only_allowed is True a request must be passed.")
+    searches = {
+        "zaken": s_zaken,
+        "objecten": s_objecten,
+        "documenten": s_documenten,
+    }
 
-        allowed = query_allowed_for_requester(request)
-        s_zaken = s_zaken.filter(allowed)
+    cache_key = _get_quick_search_cache_key(search_term, only_allowed, request)
+    if cache_key and (cached := cache.get(cache_key)) is not None:
+        return {name: Response(searches[name], raw) for name, raw in cached.items()}
+
+    if only_allowed:
+        allowed = queries_allowed_for_requester(
+            request, nested_fields=["", "related_zaken"]
+        )
+        searches["zaken"] = s_zaken.filter(allowed[""])
+        searches["objecten"] = s_objecten.filter(allowed["related_zaken"])
+        searches["documenten"] = s_documenten.filter(allowed["related_zaken"])
+
+    multi_search = MultiSearch()
+    for search in searches.values():
+        multi_search = multi_search.add(search)
+    results = dict(zip(searches, multi_search.execute()))
+
+    if cache_key:
+        cache.set(
+            cache_key,
+            {name: response.to_dict() for name, response in results.items()},
+            timeout=settings.QUICK_SEARCH_CACHE_TIMEOUT,
+        )
+    return results
 
-        allowed = query_allowed_for_requester(request, on_nested_field="related_zaken")
-        s_objecten = s_objecten.filter(allowed)
-        s_documenten = s_documenten.filter(allowed)
 
-    results = {
-        "zaken": s_zaken.execute(),
-        "objecten": s_objecten.execute(),
-        "documenten": s_documenten.execute(),
+def suggest(
+    term: str,
+    request: Request,
+    size: int = 10,
+) -> Dict[str, Response]:
+    """
+    Suggest the zaken and documenten the requester is allowed to see, as they type.
+    """
+    allowed = queries_allowed_for_requester(
+        request, nested_fields=["", "related_zaken"]
+    )
+    searches = {
+        "zaken": (
+            ZaakDocument.search()
+            .source(["bronorganisatie", "identificatie", "omschrijving"])
+            .query(_suggest_query("identificatie_suggest", term))
+            .filter(allowed[""])
+            .extra(size=size)
+        ),
+        "documenten": (
+            InformatieObjectDocument.search()
+            .source(["titel", "url", "related_zaken"])
+            .query(_suggest_query("titel_suggest", term))
+            .filter(allowed["related_zaken"])
+            .extra(size=size)
+        ),
     }
-    return results
+
+    multi_search = MultiSearch()
+    for search in searches.values():
+        multi_search = multi_search.add(search)
+    return dict(zip(searches, multi_search.execute()))
 
 
 def count_by_zaaktype(request: Optional[Request] = None) -> List[ParentAggregation]:
+    """
+    Count the zaken per zaaktype, grouped by catalogus.
+
+    A composite aggregation is paged through, so no buckets are left out.
+    """
     s = search_zaken(size=0, request=request, return_search=True, only_allowed=True)
 
-    # elasticsearch-dsl does not support multiterm aggregation yet - workaround.
-    s.aggs.bucket("parent", "terms", field="zaaktype.catalogus")
-    s.aggs["parent"].bucket("child", "terms", field="zaaktype.identificatie")
-    results = [bucket.to_dict() for bucket in s.execute().aggregations.parent.buckets]
+    composite = {
+        "size": settings.ES_SIZE,
+        "sources": [
+            {"catalogus": {"terms": {"field": "zaaktype.catalogus"}}},
+            {"identificatie": {"terms": {"field": "zaaktype.identificatie"}}},
+        ],
+    }
+    counts = defaultdict(dict)
+    while True:
+        search = s.extra(size=0)
+        search.aggs.bucket("zaaktypen", "composite", **composite)
+        aggregation = search.execute().aggregations.zaaktypen
+        for bucket in aggregation.buckets:
+            counts[bucket.key.catalogus][bucket.key.identificatie] = bucket.doc_count
+
+        after_key = getattr(aggregation, "after_key", None)
+        if len(aggregation.buckets) < composite["size"] or not after_key:
+            break
+        composite["after"] = after_key.to_dict()
+
+    results = [
+        {
+            "key": catalogus,
+            "doc_count": sum(child_counts.values()),
+            "child": {
+                "buckets": [
+                    {"key": identificatie, "doc_count": doc_count}
+                    for identificatie, doc_count in child_counts.items()
+                ]
+            },
+        }
+        for catalogus, child_counts in counts.items()
+    ]
     return factory(ParentAggregation, results)
 
 
@@ -401,7 +542,7 @@ def search_objects(
         s = s.filter(Terms(url=urls))
 
     if exclude_meta:
-        meta_config = MetaObjectTypesConfig.get_solo()
+        meta_config = get_config(MetaObjectTypesConfig)
         meta_ots = [url for url in meta_config.meta_objecttype_urls.values() if url]
         s = s.filter(~Terms(type__url=meta_ots))
 
@@ -416,6 +557,30 @@ def search_objects(
     return response.hits
 
 
+def search_meta_objects(
+    objecttype: str,
+    ordering: Tuple[str, ...] = (),
+    **filters: Union[str, bool, List[str]],
+) -> Search:
+    """
+    Build the search for meta objects of the objecttype.
+
+    Lists in ``filters`` match any of their values, ``None`` values are ignored.
+    """
+    s = MetaObjectDocument.search().filter(Term(objecttype=objecttype))
+    for field_name, value in filters.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            s = s.filter(Terms(**{field_name: list(value)}))
+        else:
+            s = s.filter(Term(**{field_name: value}))
+
+    if ordering:
+        s = s.sort(*ordering)
+    return s
+
+
 def count_by_iot_in_zaak(zaak: str) -> Dict[str, int]:
     s = search_informatieobjects(zaak=zaak, size=0, return_search=True)
 
@@ -450,14 +615,81 @@ def count_zio_per_given_zaken(zaken: List[str]) -> dict:
     return counts
 
 
+SEARCH_AFTER_TIEBREAKER = "url"
+
+
+def execute_search_after(
+    search: Search,
+    size: int,
+    search_after: Optional[list] = None,
+    pit_id: Optional[str] = None,
+) -> Tuple[Response, Optional[str]]:
+    """
+    Execute one page of the search, paginated with ``search_after``.
+
+    ``url`` is added to the sort as tie-breaker, after the relevance score if the
+    search isn't sorted otherwise. If ``ES_PAGINATION_KEEP_ALIVE`` is
+    set, the page is read from a point in time, which is opened if no ``pit_id`` is
+    given. Returns the response and the point in time id to use for the next page.
+    """
+    sort = list(search._sort) or ["_score"]
+    if SEARCH_AFTER_TIEBREAKER not in sort:
+        sort.append(SEARCH_AFTER_TIEBREAKER)
+    search = search.sort(*sort).extra(from_=0, size=size)
+    if search_after:
+        search = search.extra(search_after=search_after)
+
+    if keep_alive := settings.ES_PAGINATION_KEEP_ALIVE:
+        if not pit_id:
+            es = connections.get_connection(search._using)
+            pit_id = es.open_point_in_time(index=search._index, keep_alive=keep_alive)[
+                "id"
+            ]
+        # searches in a point in time can't target an index
+        search = search.index().extra(pit={"id": pit_id, "keep_alive": keep_alive})
+
+    response = search.execute()
+    # the point in time id may change between searches
+    return response, getattr(response, "pit_id", pit_id)
+
+
+def close_point_in_time(search: Search, pit_id: Optional[str]) -> None:
+    if pit_id:
+        connections.get_connection(search._using).close_point_in_time(
+            body={"id": pit_id}
+        )
+
+
+def iter_search_chunks(
+    search: Search, chunk_size: int = settings.ES_SIZE
+) -> Iterator[List[Any]]:
+    """
+    Yield all hits of the search in chunks, in the order of the search.
+    """
+    search_after, pit_id = None, None
+    try:
+        while True:
+            response, pit_id = execute_search_after(
+                search, chunk_size, search_after=search_after, pit_id=pit_id
+            )
+            hits = list(response)
+            if hits:
+                yield hits
+            if len(hits) < chunk_size:
+                break
+            search_after = list(hits[-1].meta.sort)
+    finally:
+        close_point_in_time(search, pit_id)
+
+
 def usage_report_zaken(
     start_period: datetime,
     end_period: datetime,
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
     Build a usage report for zaken in a period.
 
-    Returns a list of dicts with fields:
+    Yields dicts, oldest registratiedatum first, with fields:
       - identificatie: str
       - zaaktype_omschrijving: str
       - omschrijving: str
@@ -465,9 +697,12 @@ def usage_report_zaken(
       - initiator_rol: str (identifier if present, else "")
       - objecten: List[{"object": <string_representation>, "objecttype": <object.type.name>}]
       - zios_count: int
+
+    The zaken are processed in chunks of ``ES_SIZE``, so the report isn't held in
+    memory as a whole.
     """
 
-    # 1) Fetch zaken within the specified period, with inner_hits for initiator role
+    # Fetch zaken within the specified period, with inner_hits for initiator role
     s_zaken = search_zaken(
         only_allowed=False,
         start_period=start_period,
@@ -480,6 +715,7 @@ def usage_report_zaken(
             "rollen",
             "url",
         ],
+        ordering=("registratiedatum",),
         return_search=True,
     ).filter(
         Nested(
@@ -494,8 +730,13 @@ def usage_report_zaken(
         )
     )
 
+    for hits in iter_search_chunks(s_zaken):
+        yield from _usage_report_zaken_rows(hits)
+
+
+def _usage_report_zaken_rows(es_hits: List[Any]) -> List[Dict[str, Any]]:
+    # 1) Build the rows of the zaken
     zaken_map: Dict[str, Dict[str, Any]] = {}
-    es_hits = s_zaken.execute().hits
     for hit in es_hits:
         # Extract the initiator role identificatie from inner hits (defensive)
         initiator_ident = ""
@@ -527,15 +768,25 @@ def usage_report_zaken(
     zios_counts: Dict[str, int] = count_zio_per_given_zaken(zaken=zaak_urls)
 
     # 3) Fetch zaakobjecten for these zaken
-    zon = search_zaakobjecten(zaken=zaak_urls)
+    zon = list(
+        ZaakObjectDocument.search()
+        .filter(Terms(zaak=zaak_urls))
+        .params(size=settings.ES_SIZE)
+        .scan()
+    )
 
     # 4) Collect unique object URLs and fetch objects (excluding meta), only needed fields
     object_urls = {zo.object for zo in zon}
-    objects = search_objects(
-        urls=list(object_urls),
-        fields=["url", "string_representation", "type.name"],
-        exclude_meta=True,
-        return_search=False,
+    objects = (
+        search_objects(
+            size=len(object_urls),
+            urls=list(object_urls),
+            fields=["url", "string_representation", "type.name"],
+            exclude_meta=True,
+            return_search=False,
+        )
+        if object_urls
+        else []
     )
     # Index by URL for O(1) lookup
     objects_by_url: Dict[str, Any] = {obj.url: obj for obj in objects}
@@ -569,33 +820,14 @@ def usage_report_zaken(
         row["objecten"] = zaak_to_objects.get(zurl, [])
         row["zios_count"] = int(zios_counts.get(zurl, 0) or 0)
 
-    # 7) Optional: make output deterministic — sort by registratiedatum (oldest first, None last)
-    def _parse_sort_dt(val: Any) -> Optional[datetime]:
-        if isinstance(val, datetime):
-            return val
-        if isinstance(val, str) and val:
-            try:
-                return datetime.fromisoformat(val.replace("Z", "+00:00"))
-            except Exception:
-                return None
-        return None
-
-    rows: List[Dict[str, Any]] = list(zaken_map.values())
-    rows.sort(
-        key=lambda r: (
-            (_parse_sort_dt(r.get("registratiedatum")) is None),
-            _parse_sort_dt(r.get("registratiedatum")) or datetime.max,
-        )
-    )
-
-    return rows
+    return list(zaken_map.values())
 
 
 def usage_report_informatieobjecten(
     start_period: datetime, end_period: datetime
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    Return a list of dicts for InformatieObjectDocuments within [start_period, end_period],
+    Yield dicts for InformatieObjectDocuments within [start_period, end_period],
     mapping:
       auteur                           -> "auteur"
       beschrijving                     -> "beschrijving"
@@ -625,7 +857,6 @@ def usage_report_informatieobjecten(
         .params(size=settings.ES_SIZE)
     )
 
-    results: List[Dict[str, Any]] = []
     for doc in s.scan():
         auteur = getattr(doc, "auteur", "") or ""
         bestandsnaam = getattr(doc, "bestandsnaam", "") or ""
@@ -649,15 +880,11 @@ def usage_report_informatieobjecten(
 
             gerelateerde_zaken_list.append(f"{ident}: {zt_oms}".strip(": ").strip())
 
-        results.append(
-            {
-                "auteur": auteur,
-                "beschrijving": beschrijving,
-                "bestandsnaam": bestandsnaam,
-                "informatieobjecttype": iot_omschrijving,
-                "creatiedatum": creatiedatum,
-                "gerelateerde_zaken": gerelateerde_zaken_list,
-            }
-        )
-
-    return results
+        yield {
+            "auteur": auteur,
+            "beschrijving": beschrijving,
+            "bestandsnaam": bestandsnaam,
+            "informatieobjecttype": iot_omschrijving,
+            "creatiedatum": creatiedatum,
+            "gerelateerde_zaken": gerelateerde_zaken_list,
+        }
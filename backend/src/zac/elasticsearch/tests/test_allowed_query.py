@@ -0,0 +1,177 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
+
+from zac.accounts.constants import PermissionObjectTypeChoices
+from zac.accounts.datastructures import VA_ORDER
+from zac.accounts.tests.factories import (
+    AtomicPermissionFactory,
+    BlueprintPermissionFactory,
+    SuperUserFactory,
+    UserFactory,
+)
+from zac.core.permissions import zaken_inzien
+from zac.core.tests.utils import ClearCachesMixin
+
+from ..permissions import get_terms_lookup
+from ..searches import query_allowed_for_requester
+
+
+class QueryAllowedForRequesterTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = UserFactory.create()
+        self.request = MagicMock()
+        self.request.user = self.user
+        self.request.auth = None
+
+    def _add_blueprint_permission(self, omschrijving: str, max_va: str):
+        BlueprintPermissionFactory.create(
+            role__name=f"role-{omschrijving}-{max_va}",
+            role__permissions=[zaken_inzien.name],
+            for_user=self.user,
+            policy={
+                "catalogus": "some-domein",
+                "zaaktype_omschrijving": omschrijving,
+                "max_va": max_va,
+            },
+        )
+
+    def test_superuser(self):
+        self.request.user = SuperUserFactory.create()
+
+        query = query_allowed_for_requester(self.request)
+
+        self.assertEqual(query.to_dict(), {"match_all": {}})
+
+    def test_no_permissions(self):
+        query = query_allowed_for_requester(self.request)
+
+        self.assertEqual(query.to_dict(), {"match_none": {}})
+
+    def test_blueprint_permissions_collapsed(self):
+        self._add_blueprint_permission("ZT1", VertrouwelijkheidsAanduidingen.openbaar)
+        self._add_blueprint_permission("ZT1", VertrouwelijkheidsAanduidingen.geheim)
+        self._add_blueprint_permission("ZT2", VertrouwelijkheidsAanduidingen.geheim)
+
+        query = query_allowed_for_requester(self.request)
+
+        self.assertEqual(
+            query.to_dict(),
+            {
+                "bool": {
+                    "should": [
+                        {
+                            "bool": {
+                                "filter": [
+                                    {
+                                        "term": {
+                                            "zaaktype.catalogus_domein": "some-domein"
+                                        }
+                                    },
+                                    {
+                                        "terms": {
+                                            "zaaktype.omschrijving": ["ZT1", "ZT2"]
+                                        }
+                                    },
+                                    {
+                                        "range": {
+                                            "va_order": {
+                                                "lte": VA_ORDER[
+                                                    VertrouwelijkheidsAanduidingen.geheim
+                                                ]
+                                            }
+                                        }
+                                    },
+                                ]
+                            }
+                        }
+                    ],
+                    "minimum_should_match": 1,
+                }
+            },
+        )
+
+    def test_atomic_permissions_nested(self):
+        AtomicPermissionFactory.create(
+            object_type=PermissionObjectTypeChoices.zaak,
+            permission=zaken_inzien.name,
+            object_url="https://zaken.nl/zaken/1",
+            for_user=self.user,
+        )
+
+        query = query_allowed_for_requester(
+            self.request, on_nested_field="related_zaken"
+        )
+
+        self.assertEqual(
+            query.to_dict(),
+            {
+                "nested": {
+                    "path": "related_zaken",
+                    "query": {
+                        "bool": {
+                            "should": [
+                                {
+                                    "terms": {
+                                        "related_zaken.url": [
+                                            "https://zaken.nl/zaken/1"
+                                        ]
+                                    }
+                                }
+                            ],
+                            "minimum_should_match": 1,
+                        }
+                    },
+                }
+            },
+        )
+
+    @override_settings(ES_PERMISSIONS_TERMS_LOOKUP_THRESHOLD=1)
+    def test_atomic_permissions_terms_lookup(self):
+        for i in range(2):
+            AtomicPermissionFactory.create(
+                object_type=PermissionObjectTypeChoices.zaak,
+                permission=zaken_inzien.name,
+                object_url=f"https://zaken.nl/zaken/{i}",
+                for_user=self.user,
+            )
+        lookup = {"index": "permissions", "id": "some-id", "path": "urls"}
+
+        with patch(
+            "zac.elasticsearch.permissions.get_terms_lookup", return_value=lookup
+        ) as m_lookup:
+            query = query_allowed_for_requester(self.request)
+            # the compiled query is cached
+            query_allowed_for_requester(self.request)
+
+        m_lookup.assert_called_once()
+        self.assertEqual(
+            m_lookup.call_args.args[1],
+            ["https://zaken.nl/zaken/0", "https://zaken.nl/zaken/1"],
+        )
+        self.assertEqual(
+            query.to_dict()["bool"]["should"], [{"terms": {"url": lookup}}]
+        )
+
+
+@patch("zac.elasticsearch.permissions._lookup_index_ready", False)
+@patch("zac.elasticsearch.permissions.PermissionLookupDocument")
+@patch("zac.elasticsearch.permissions.Index")
+class TermsLookupTests(TestCase):
+    def test_lookup_index_checked_once(self, m_index, m_document):
+        m_index.return_value.exists.return_value = False
+
+        for version in range(2):
+            lookup = get_terms_lookup("user:1:zaak:zaken:inzien", ["a", "b"], version)
+
+        m_index.return_value.exists.assert_called_once_with()
+        m_document.init.assert_called_once_with()
+        self.assertEqual(m_document.return_value.save.call_count, 2)
+        self.assertEqual(
+            lookup,
+            {"index": "permissions", "id": "user:1:zaak:zaken:inzien", "path": "urls"},
+        )
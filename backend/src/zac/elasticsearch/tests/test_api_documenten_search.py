@@ -434,10 +434,11 @@ class ESZaakDocumentsResponseTests(ClearCachesMixin, ESMixin, APITransactionTest
                     locked_by=user.email,
                 )
             ],
-        ):
+        ) as mock_check_document_status:
             response = self.client.post(self.endpoint)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_check_document_status.assert_any_call(zaak=self.zaak1["url"])
 
         results = response.json()
         self.assertEqual(results["count"], 2)
@@ -465,6 +466,7 @@ class ESZaakDocumentsResponseTests(ClearCachesMixin, ESMixin, APITransactionTest
                         "omschrijving": self.iot.omschrijving,
                     },
                     "lastEditedDate": None,
+                    "lastEditedBy": None,
                     "locked": self.document1.locked,
                     "lockedBy": user.email if self.document1.locked else "",
                     "readUrl": f"/api/dowc/{self.document1.bronorganisatie}/{self.document1.identificatie}/read",
@@ -496,6 +498,7 @@ class ESZaakDocumentsResponseTests(ClearCachesMixin, ESMixin, APITransactionTest
                         "omschrijving": self.iot.omschrijving,
                     },
                     "lastEditedDate": None,
+                    "lastEditedBy": None,
                     "locked": self.document2.locked,
                     "lockedBy": "",
                     "readUrl": f"/api/dowc/{self.document2.bronorganisatie}/{self.document2.identificatie}/read",
@@ -0,0 +1,86 @@
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from django.urls import reverse_lazy
+
+from rest_framework.test import APITestCase
+
+from zac.accounts.tests.factories import ApplicationTokenFactory
+
+from ..drf_api.views import VGUReportInformatieObjectenView
+
+ROWS = [
+    {
+        "auteur": "some-auteur",
+        "beschrijving": "",
+        "bestandsnaam": "some-file.txt",
+        "informatieobjecttype": "some-iot",
+        "creatiedatum": datetime(2024, 1, 1, 12, 0),
+        "gerelateerde_zaken": ["ZAAK-1: some-zaaktype", "ZAAK-2: other-zaaktype"],
+    },
+    {
+        "auteur": "other-auteur",
+        "beschrijving": "some beschrijving",
+        "bestandsnaam": "other-file.txt",
+        "informatieobjecttype": "some-iot",
+        "creatiedatum": None,
+        "gerelateerde_zaken": [],
+    },
+]
+
+
+@patch.object(
+    VGUReportInformatieObjectenView,
+    "report_fn",
+    staticmethod(lambda start_period, end_period: iter(ROWS)),
+)
+class VGUReportStreamingTests(APITestCase):
+    endpoint = reverse_lazy("vgu-reports-informatieobjecten")
+    data = {"startPeriod": "2024-01-01T00:00:00", "endPeriod": "2024-12-31T00:00:00"}
+
+    def setUp(self):
+        super().setUp()
+        token = ApplicationTokenFactory.create()
+        self.client.credentials(HTTP_AUTHORIZATION=f"ApplicationToken {token.token}")
+
+    def _get_content(self, response) -> str:
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_json(self):
+        response = self.client.post(self.endpoint, self.data)
+
+        self.assertEqual(response["Content-Type"], "application/json; charset=utf-8")
+        results = json.loads(self._get_content(response))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]["bestandsnaam"], "some-file.txt")
+        self.assertEqual(
+            results[0]["gerelateerdeZaken"],
+            ["ZAAK-1: some-zaaktype", "ZAAK-2: other-zaaktype"],
+        )
+
+    def test_ndjson(self):
+        response = self.client.post(
+            self.endpoint, self.data, HTTP_ACCEPT="application/x-ndjson"
+        )
+
+        lines = self._get_content(response).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["auteur"], "other-auteur")
+
+    def test_csv(self):
+        response = self.client.post(f"{self.endpoint}?format=csv", self.data)
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        lines = self._get_content(response).splitlines()
+        self.assertEqual(
+            lines[0],
+            "auteur,beschrijving,bestandsnaam,informatieobjecttype,creatiedatum,"
+            "gerelateerdeZaken",
+        )
+        self.assertEqual(
+            lines[1].split(",")[-1], "ZAAK-1: some-zaaktype; ZAAK-2: other-zaaktype"
+        )
+        self.assertEqual(len(lines), 3)
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
+from furl import furl
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from ..drf_api.pagination import ESPagination
+from ..searches import iter_search_chunks
+
+
+def es_response(search, hits):
+    return Response(
+        search,
+        {
+            "hits": {
+                "total": {"value": 3, "relation": "eq"},
+                "hits": [
+                    {"_id": url, "_source": {"url": url}, "sort": [identificatie, url]}
+                    for identificatie, url in hits
+                ],
+            }
+        },
+    )
+
+
+class ESCursorPaginationTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.search = Search(index="zaken").sort("-identificatie.keyword")
+        self.factory = APIRequestFactory()
+
+    def _paginate(self, query_params, hits):
+        request = Request(self.factory.get("/api/search/", query_params))
+        paginator = ESPagination()
+        with patch.object(
+            Search, "execute", autospec=True, side_effect=lambda s: es_response(s, hits)
+        ) as m_execute:
+            page = paginator.paginate_queryset(self.search, request)
+        return paginator, page, m_execute.call_args[0][0]
+
+    def test_first_page(self):
+        paginator, page, search = self._paginate(
+            {"cursor": "", "pageSize": 2},
+            [("zaak3", "url3"), ("zaak2", "url2"), ("zaak1", "url1")],
+        )
+
+        self.assertEqual([hit.url for hit in page], ["url3", "url2"])
+        body = search.to_dict()
+        self.assertEqual(
+            body["sort"], [{"identificatie.keyword": {"order": "desc"}}, "url"]
+        )
+        self.assertEqual(body["size"], 3)
+        self.assertNotIn("search_after", body)
+
+        response = paginator.get_paginated_response([], [])
+        self.assertEqual(response.data["count"], 3)
+        self.assertIsNone(response.data["previous"])
+
+        next_link = furl(response.data["next"])
+        self.assertEqual(next_link.args["pageSize"], "2")
+        self.assertEqual(
+            paginator.decode_cursor(
+                Request(self.factory.get("/", {"cursor": next_link.args["cursor"]}))
+            ),
+            {"search_after": ["zaak2", "url2"]},
+        )
+
+    def test_next_page(self):
+        cursor = ESPagination().encode_cursor({"search_after": ["zaak2", "url2"]})
+
+        paginator, page, search = self._paginate(
+            {"cursor": cursor, "pageSize": 2}, [("zaak1", "url1")]
+        )
+
+        self.assertEqual([hit.url for hit in page], ["url1"])
+        self.assertEqual(search.to_dict()["search_after"], ["zaak2", "url2"])
+        self.assertIsNone(paginator.get_paginated_response([], []).data["next"])
+
+    def test_relevance_order(self):
+        self.search = Search(index="zaken").query("match", omschrijving="some")
+
+        _, _, search = self._paginate({"cursor": "", "pageSize": 2}, [])
+
+        self.assertEqual(search.to_dict()["sort"], ["_score", "url"])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self._paginate({"cursor": "tampered", "pageSize": 2}, [])
+
+
+class SearchChunksTests(SimpleTestCase):
+    def test_iter_search_chunks(self):
+        pages = iter(
+            [
+                [("zaak1", "url1"), ("zaak2", "url2")],
+                [("zaak3", "url3")],
+            ]
+        )
+        searches = []
+
+        def execute(search):
+            searches.append(search.to_dict())
+            return es_response(search, next(pages))
+
+        search = Search(index="zaken").sort("registratiedatum")
+        with patch.object(Search, "execute", autospec=True, side_effect=execute):
+            chunks = list(iter_search_chunks(search, chunk_size=2))
+
+        self.assertEqual(
+            [[hit.url for hit in chunk] for chunk in chunks],
+            [["url1", "url2"], ["url3"]],
+        )
+        self.assertEqual(searches[0]["sort"], ["registratiedatum", "url"])
+        self.assertNotIn("search_after", searches[0])
+        self.assertEqual(searches[1]["search_after"], ["zaak2", "url2"])
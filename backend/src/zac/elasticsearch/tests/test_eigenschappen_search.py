@@ -0,0 +1,133 @@
+from django.test import SimpleTestCase
+
+from ..drf_api.serializers import SearchSerializer
+from ..searches import eigenschap_query
+
+
+class EigenschapQueryTests(SimpleTestCase):
+    def test_contains_is_default_for_tekst(self):
+        query = eigenschap_query("Adres", {"value": "Leidsche Rijn"})
+
+        self.assertEqual(
+            query.to_dict(),
+            {
+                "match": {
+                    "eigenschappen.tekst.Adres.ngram": {
+                        "query": "leidsche rijn",
+                        "operator": "and",
+                    }
+                }
+            },
+        )
+
+    def test_plain_value(self):
+        query = eigenschap_query("Adres", "Leid")
+
+        self.assertEqual(
+            query.to_dict(),
+            {
+                "match": {
+                    "eigenschappen.tekst.Adres.ngram": {
+                        "query": "leid",
+                        "operator": "and",
+                    }
+                }
+            },
+        )
+
+    def test_contains_short_value(self):
+        query = eigenschap_query("Adres", {"value": "L*"})
+
+        self.assertEqual(
+            query.to_dict(),
+            {"wildcard": {"eigenschappen.tekst.Adres.normalized": "*l\\**"}},
+        )
+
+    def test_exact_and_prefix(self):
+        self.assertEqual(
+            eigenschap_query(
+                "Some.name", {"value": "Utrecht", "operator": "exact"}
+            ).to_dict(),
+            {"term": {"eigenschappen.tekst.Some name.normalized": "utrecht"}},
+        )
+        self.assertEqual(
+            eigenschap_query("Adres", {"value": "Utr", "operator": "prefix"}).to_dict(),
+            {"prefix": {"eigenschappen.tekst.Adres.normalized": "utr"}},
+        )
+
+    def test_typed_values(self):
+        self.assertEqual(
+            eigenschap_query("Bedrag", {"formaat": "getal", "value": 10.5}).to_dict(),
+            {"term": {"eigenschappen.getal.Bedrag": 10.5}},
+        )
+        self.assertEqual(
+            eigenschap_query(
+                "Datum",
+                {
+                    "formaat": "datum",
+                    "operator": "range",
+                    "gte": "2021-01-01",
+                    "lt": "2022-01-01",
+                },
+            ).to_dict(),
+            {
+                "range": {
+                    "eigenschappen.datum.Datum": {
+                        "gte": "2021-01-01",
+                        "lt": "2022-01-01",
+                    }
+                }
+            },
+        )
+
+
+class EigenschappenSerializerTests(SimpleTestCase):
+    def _validate(self, eigenschappen):
+        serializer = SearchSerializer(data={"eigenschappen": eigenschappen})
+        return serializer.is_valid(), serializer
+
+    def test_defaults(self):
+        is_valid, serializer = self._validate(
+            {
+                "Adres": {"value": "Leidsche Rijn"},
+                "Bedrag": {"formaat": "getal", "value": "10"},
+            }
+        )
+
+        self.assertTrue(is_valid)
+        self.assertEqual(
+            serializer.validated_data["eigenschappen"],
+            {
+                "Adres": {
+                    "formaat": "tekst",
+                    "operator": "contains",
+                    "value": "Leidsche Rijn",
+                },
+                "Bedrag": {"formaat": "getal", "operator": "exact", "value": 10.0},
+            },
+        )
+
+    def test_range(self):
+        is_valid, serializer = self._validate(
+            {"Datum": {"formaat": "datum", "operator": "range", "gte": "2021-01-01"}}
+        )
+
+        self.assertTrue(is_valid)
+        self.assertEqual(
+            serializer.validated_data["eigenschappen"]["Datum"],
+            {"formaat": "datum", "operator": "range", "gte": "2021-01-01"},
+        )
+
+    def test_invalid(self):
+        for eigenschap in [
+            {"operator": "range", "gte": "a"},
+            {"formaat": "getal", "operator": "contains", "value": "1"},
+            {"formaat": "datum", "operator": "range"},
+            {"formaat": "datum", "value": "not a date"},
+            {"operator": "prefix"},
+        ]:
+            with self.subTest(eigenschap=eigenschap):
+                is_valid, serializer = self._validate({"Some": eigenschap})
+
+                self.assertFalse(is_valid)
+                self.assertIn("Some", serializer.errors["eigenschappen"])
@@ -1,9 +1,10 @@
 from copy import deepcopy
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
 from django.core.management import call_command
+from django.test import SimpleTestCase
 
 import requests_mock
 from rest_framework.test import APITransactionTestCase
@@ -17,6 +18,9 @@ from zac.tests.compat import generate_oas_component, mock_service_oas_get
 from zac.tests.utils import mock_resource_get, paginated_response
 
 from ..documents import ZaakDocument
+from ..management.bulk_join import RelatedObjectStore
+from ..management.commands.base_index import IndexCommand
+from ..management.commands.index_zaken import Command as IndexZakenCommand
 from .utils import ESMixin
 
 CATALOGI_ROOT = "https://api.catalogi.nl/api/v1/"
@@ -627,6 +631,82 @@ class IndexZakenTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
             zaak_document.status.statustoelichting, "some-statustoelichting"
         )
 
+    def test_index_zaken_bulk_join(self, m):
+        # mock API requests
+        mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
+        mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
+        zaak = deepcopy(self.zaak)
+        zaak["status"] = f"{ZAKEN_ROOT}statussen/dd4573d0-4d99-4e90-a05c-e08911e8673e"
+        other_zaak = generate_oas_component(
+            "zrc",
+            "schemas/Zaak",
+            url=f"{ZAKEN_ROOT}zaken/5abd5f22-5317-4bf2-a750-7cf2f4910370",
+            zaaktype=self.zaaktype["url"],
+            identificatie="ZAAK2",
+            vertrouwelijkheidaanduiding="zaakvertrouwelijk",
+            status=None,
+        )
+        status_response = generate_oas_component(
+            "zrc",
+            "schemas/Status",
+            url=zaak["status"],
+            statustype=f"{CATALOGI_ROOT}statustypen/c612f300-8e16-4811-84f4-78c99fdebe74",
+            statustoelichting="some-statustoelichting",
+            zaak=zaak["url"],
+        )
+        statustype_response = generate_oas_component(
+            "ztc",
+            "schemas/StatusType",
+            url=f"{CATALOGI_ROOT}statustypen/c612f300-8e16-4811-84f4-78c99fdebe74",
+        )
+        rol = {
+            "url": f"{ZAKEN_ROOT}rollen/b80022cf-6084-4cf6-932b-799effdcdb26",
+            "zaak": zaak["url"],
+            "betrokkene": None,
+            "betrokkeneType": "medewerker",
+            "roltype": f"{CATALOGI_ROOT}roltypen/bfd62804-f46c-42e7-a31c-4139b4c661ac",
+            "omschrijving": "zaak behandelaar",
+            "omschrijvingGeneriek": "behandelaar",
+            "roltoelichting": "some description",
+            "registratiedatum": "2020-09-01T00:00:00Z",
+            "indicatieMachtiging": "",
+            "betrokkeneIdentificatie": {
+                "identificatie": f"{AssigneeTypeChoices.user}:some_username",
+            },
+        }
+        m.get(f"{CATALOGI_ROOT}zaaktypen", json=paginated_response([self.zaaktype]))
+        m.get(f"{ZAKEN_ROOT}zaken", json=paginated_response([zaak, other_zaak]))
+        m.get(f"{ZAKEN_ROOT}rollen", json=paginated_response([rol]))
+        m.get(f"{ZAKEN_ROOT}statussen", json=paginated_response([status_response]))
+        mock_resource_get(m, self.zaaktype)
+        mock_resource_get(m, self.catalogus)
+        mock_resource_get(m, statustype_response)
+
+        with patch(
+            "zac.elasticsearch.management.commands.index_zaken.get_zaakeigenschappen",
+            return_value=[],
+        ):
+            call_command("index_zaken", bulk_join=True, stdout=StringIO())
+
+        zaak_document = ZaakDocument.get(id=zaak["url"].split("/")[-1])
+        self.assertEqual(
+            zaak_document.status.statustoelichting, "some-statustoelichting"
+        )
+        self.assertEqual([rol["url"] for rol in zaak_document.rollen], [rol["url"]])
+        other_zaak_document = ZaakDocument.get(id=other_zaak["url"].split("/")[-1])
+        self.assertIsNone(other_zaak_document.status)
+        self.assertEqual(other_zaak_document.rollen, [])
+
+        # the ROLlen and STATUSsen are retrieved once for all ZAAKen
+        rol_requests = [
+            req for req in m.request_history if req.path == "/api/v1/rollen"
+        ]
+        status_requests = [
+            req for req in m.request_history if req.path.startswith("/api/v1/statussen")
+        ]
+        self.assertEqual(len(rol_requests), 1)
+        self.assertEqual(len(status_requests), 1)
+
     def test_index_zaken_reindex_last_argument(self, m):
         # mock API requests
         mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
@@ -683,3 +763,61 @@ class IndexZakenTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
         zaak2_id = zaak2["url"].split("/")[-1]
         zd2 = ZaakDocument.get(id=zaak2_id)
         self.assertEqual(zd2.identificatie, "ZAAK-002")
+
+
+class RelatedObjectStoreTests(SimpleTestCase):
+    def test_add_and_get_many(self):
+        objects = [
+            {"url": "https://zaken.nl/rollen/1", "zaak": "https://zaken.nl/zaken/1"},
+            {"url": "https://zaken.nl/rollen/2", "zaak": "https://zaken.nl/zaken/1"},
+            {"url": "https://zaken.nl/rollen/3", "zaak": "https://zaken.nl/zaken/2"},
+        ]
+
+        with RelatedObjectStore() as store:
+            self.assertEqual(store.add("rol", "zaak", iter(objects), batch_size=2), 3)
+
+            results = store.get_many(
+                "rol", ["https://zaken.nl/zaken/1", "https://zaken.nl/zaken/3"]
+            )
+            self.assertEqual(store.get_many("status", ["https://zaken.nl/zaken/1"]), {})
+
+        self.assertEqual(
+            dict(results), {"https://zaken.nl/zaken/1": [objects[0], objects[1]]}
+        )
+
+
+class BulkJoinStoreCleanupTests(SimpleTestCase):
+    def test_store_closed_when_indexing_fails(self):
+        store = MagicMock()
+
+        def handle(command, **options):
+            command.store = store
+            raise ConnectionError("ES is gone")
+
+        command = IndexZakenCommand(stdout=StringIO())
+        with patch.object(IndexCommand, "handle", autospec=True, side_effect=handle):
+            with self.assertRaises(ConnectionError):
+                command.handle(
+                    bulk_join=True,
+                    bulk_join_dir=None,
+                    reindex_last=None,
+                    reindex_zaak=None,
+                )
+
+        store.close.assert_called_once_with()
+        self.assertIsNone(command.store)
+
+    @patch(
+        "zac.elasticsearch.management.commands.index_zaken.iter_paginated_results",
+        side_effect=ConnectionError("ZRC is gone"),
+    )
+    @patch("zac.elasticsearch.management.commands.index_zaken.RelatedObjectStore")
+    def test_store_closed_when_loading_fails(self, m_store, m_iter):
+        m_store.return_value.add.side_effect = lambda kind, key, objects: list(objects)
+        command = IndexZakenCommand(stdout=StringIO())
+        command.bulk_join_dir = None
+
+        with self.assertRaises(ConnectionError):
+            command.load_related_objects([MagicMock()])
+
+        m_store.return_value.close.assert_called_once_with()
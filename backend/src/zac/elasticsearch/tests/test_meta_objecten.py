@@ -0,0 +1,242 @@
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from elasticsearch_dsl import Index
+
+from zac.accounts.tests.factories import GroupFactory, UserFactory
+from zac.contrib.objects.checklists.tests.factories import (
+    ZAAK_URL,
+    ZAKEN_ROOT,
+    checklist_factory,
+    checklist_object_factory,
+)
+from zac.contrib.objects.kownsl.tests.factories import (
+    review_request_factory,
+    review_request_object_factory,
+)
+from zac.contrib.objects.services import (
+    fetch_all_checklists_for_user_groups,
+    fetch_all_unanswered_checklists_for_user,
+)
+from zac.contrib.objects.tests.utils import OBJECTS_ROOT
+from zac.core.models import MetaObjectTypesConfig
+from zac.core.tests.utils import ClearCachesMixin
+from zac.notifications.handlers.objecten import ObjectenHandler
+
+from ..api import create_meta_object_document, update_meta_object_document
+from ..documents import MetaObjectDocument
+
+
+class CreateMetaObjectDocumentTests(SimpleTestCase):
+    def test_checklist(self):
+        checklist = checklist_factory(
+            answers=[
+                {"question": "1", "answer": "", "userAssignee": "bob"},
+                {"question": "2", "answer": "Ja", "userAssignee": "alice"},
+                {"question": "3", "answer": "", "groupAssignee": "groep"},
+                {"question": "4", "answer": "", "userAssignee": "bob"},
+            ],
+        )
+        checklist_object = checklist_object_factory(record__data=checklist)
+
+        document = create_meta_object_document(checklist_object)
+
+        self.assertEqual(document.meta.id, checklist_object["uuid"])
+        self.assertEqual(document.objecttype, checklist_object["type"])
+        self.assertEqual(document.zaak, ZAAK_URL)
+        self.assertFalse(document.locked)
+        self.assertEqual(document.open_user_assignees, ["bob"])
+        self.assertEqual(document.open_group_assignees, ["groep"])
+        self.assertEqual(document.record_data, checklist)
+
+    def test_review_request(self):
+        review_request = review_request_factory()
+        rr_object = review_request_object_factory(record__data=review_request)
+        rr_object["type"] = {"url": rr_object["type"]}
+
+        document = create_meta_object_document(rr_object)
+
+        self.assertEqual(document.objecttype, rr_object["type"]["url"])
+        self.assertEqual(document.requester, "some-author")
+        self.assertEqual(document.created, review_request["created"])
+        self.assertEqual(document.open_user_assignees, [])
+
+
+OTHER_ZAAK_URL = f"{ZAKEN_ROOT}zaken/6f1ee5f3-6d1b-4f76-9d3a-1e4c2c8e1c50"
+LOCKED_ZAAK_URL = f"{ZAKEN_ROOT}zaken/0f1d5b5c-2d5c-4c1e-8a55-7cf9f0b4a3b1"
+
+
+def get_checklist_object(uuid: str, zaak: str, answers: list, locked: bool = False):
+    return checklist_object_factory(
+        url=f"{OBJECTS_ROOT}objects/{uuid}",
+        uuid=uuid,
+        record__data=checklist_factory(zaak=zaak, answers=answers, locked=locked),
+    )
+
+
+class MetaObjectenESMixin:
+    @staticmethod
+    def clear_index(init=False):
+        Index(settings.ES_INDEX_META_OBJECTEN).delete(ignore=404)
+        if init:
+            MetaObjectDocument.init()
+
+    @staticmethod
+    def refresh_index():
+        Index(settings.ES_INDEX_META_OBJECTEN).refresh()
+
+    def setUp(self):
+        super().setUp()
+        self.clear_index(init=True)
+        self.addCleanup(self.clear_index)
+
+        self.checklist_objecttype = checklist_object_factory()["type"]
+        meta_config = MetaObjectTypesConfig.get_solo()
+        meta_config.checklist_objecttype = self.checklist_objecttype
+        meta_config.save()
+
+
+class ChecklistSearchTests(MetaObjectenESMixin, ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        for checklist_object in [
+            get_checklist_object(
+                "85e6c250-9f51-4286-8340-25109d0b96d1",
+                ZAAK_URL,
+                [
+                    {"question": "1", "answer": "", "userAssignee": "bob"},
+                    {"question": "2", "answer": "Ja", "userAssignee": "alice"},
+                    {"question": "3", "answer": "", "groupAssignee": "groep"},
+                ],
+            ),
+            get_checklist_object(
+                "9d3a4d6b-3c8e-4a3a-8f0e-0b7e0bb7c9a2",
+                OTHER_ZAAK_URL,
+                [
+                    {"question": "1", "answer": "Nee", "groupAssignee": "groep"},
+                    {"question": "2", "answer": "", "groupAssignee": "andere-groep"},
+                ],
+            ),
+            get_checklist_object(
+                "d5c1f1a2-5b0e-4f4b-9b8e-8c8a3e1f2d44",
+                LOCKED_ZAAK_URL,
+                [{"question": "1", "answer": "", "userAssignee": "bob"}],
+                locked=True,
+            ),
+        ]:
+            update_meta_object_document(checklist_object)
+        self.refresh_index()
+
+    def test_unanswered_checklists_for_user(self):
+        bob = UserFactory.create(username="bob")
+
+        checklists = fetch_all_unanswered_checklists_for_user(bob)
+
+        # the checklist of the locked zaak is left out
+        self.assertEqual([checklist["zaak"] for checklist in checklists], [ZAAK_URL])
+        self.assertEqual(checklists[0]["answers"][0]["user_assignee"], "bob")
+
+    def test_answered_checklists_for_user(self):
+        alice = UserFactory.create(username="alice")
+
+        self.assertEqual(fetch_all_unanswered_checklists_for_user(alice), [])
+
+    def test_checklists_for_user_groups(self):
+        user = UserFactory.create()
+        user.groups.add(GroupFactory.create(name="groep"))
+
+        checklists = fetch_all_checklists_for_user_groups(user)
+
+        # the question of the group on the other zaak is answered already
+        self.assertEqual([checklist["zaak"] for checklist in checklists], [ZAAK_URL])
+
+    def test_checklists_for_any_of_user_groups(self):
+        user = UserFactory.create()
+        user.groups.add(
+            GroupFactory.create(name="groep"), GroupFactory.create(name="andere-groep")
+        )
+
+        checklists = fetch_all_checklists_for_user_groups(user)
+
+        self.assertEqual(
+            {checklist["zaak"] for checklist in checklists},
+            {ZAAK_URL, OTHER_ZAAK_URL},
+        )
+
+    def test_checklists_for_user_without_groups(self):
+        user = UserFactory.create()
+
+        self.assertEqual(fetch_all_checklists_for_user_groups(user), [])
+
+
+class MetaObjectIndexSyncTests(MetaObjectenESMixin, ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.checklist_object = get_checklist_object(
+            "85e6c250-9f51-4286-8340-25109d0b96d1",
+            ZAAK_URL,
+            [{"question": "1", "answer": "", "userAssignee": "bob"}],
+        )
+
+    def test_index_meta_objecten(self):
+        with patch(
+            "zac.elasticsearch.management.commands.index_meta_objecten.search_objects",
+            return_value=({"results": [self.checklist_object]}, {}),
+        ) as m_search_objects:
+            call_command("index_meta_objecten")
+
+        m_search_objects.assert_called_once_with(
+            {"type": self.checklist_objecttype}, query_params={"pageSize": 100}
+        )
+        self.refresh_index()
+        document = MetaObjectDocument.get(id=self.checklist_object["uuid"])
+        self.assertEqual(document.zaak, ZAAK_URL)
+        self.assertEqual(list(document.open_user_assignees), ["bob"])
+
+    @patch("zac.notifications.handlers.objecten.update_object_document")
+    @patch("zac.notifications.handlers.objecten.fetch_object")
+    def test_handler_updates_document(self, m_fetch_object, m_update_object):
+        checklist_object = {
+            **self.checklist_object,
+            "type": {"url": self.checklist_objecttype},
+        }
+        m_fetch_object.return_value = checklist_object
+
+        ObjectenHandler().handle(
+            {
+                "kanaal": "objecten",
+                "resource": "object",
+                "actie": "update",
+                "hoofd_object": checklist_object["url"],
+            }
+        )
+        self.refresh_index()
+
+        document = MetaObjectDocument.get(id=checklist_object["uuid"])
+        self.assertEqual(list(document.open_user_assignees), ["bob"])
+        m_update_object.assert_not_called()
+
+    @patch("zac.notifications.handlers.objecten.delete_zaakobjecten_of_object")
+    @patch("zac.notifications.handlers.objecten.delete_object_document")
+    def test_handler_destroy_deletes_document(
+        self, m_delete_object, m_delete_zaakobjecten
+    ):
+        update_meta_object_document(self.checklist_object)
+        self.refresh_index()
+
+        ObjectenHandler().handle(
+            {
+                "kanaal": "objecten",
+                "resource": "object",
+                "actie": "destroy",
+                "hoofd_object": self.checklist_object["url"],
+            }
+        )
+        self.refresh_index()
+
+        self.assertFalse(MetaObjectDocument.exists(id=self.checklist_object["uuid"]))
+        m_delete_object.assert_called_once_with(self.checklist_object["url"])
+        m_delete_zaakobjecten.assert_called_once_with(self.checklist_object["url"])
@@ -1,10 +1,12 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
+from django.test import TestCase, override_settings
 from django.urls import reverse_lazy
 
 import requests_mock
-from elasticsearch_dsl import Index
+from elasticsearch_dsl import Index, MultiSearch
+from elasticsearch_dsl.response import Response
 from rest_framework.test import APITransactionTestCase
 from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
 from zgw_consumers.constants import APITypes
@@ -357,3 +359,51 @@ class QuickSearchTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
         self.assertEqual(len(results["zaken"]), 0)
         self.assertEqual(len(results["objecten"]), 0)
         self.assertEqual(len(results["documenten"]), 0)
+
+
+class QuickSearchMultiSearchTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = MagicMock(user=UserFactory.create(), auth=None)
+
+    def _execute(self, multi_search):
+        self.executed.append(multi_search.to_dict())
+        return [
+            Response(search, {"hits": {"total": {"value": 0}, "hits": []}})
+            for search in multi_search._searches
+        ]
+
+    def _quick_search(self, search_term):
+        with patch.object(
+            MultiSearch, "execute", autospec=True, side_effect=self._execute
+        ):
+            return quick_search(search_term, only_allowed=True, request=self.request)
+
+    def test_single_multi_search(self):
+        self.executed = []
+
+        results = self._quick_search("some term")
+
+        self.assertEqual(len(self.executed), 1)
+        # header and body per search
+        self.assertEqual(len(self.executed[0]), 6)
+        self.assertEqual(
+            [header["index"] for header in self.executed[0][::2]],
+            [["zaken"], ["objecten"], ["documenten"]],
+        )
+        self.assertEqual(set(results), {"zaken", "objecten", "documenten"})
+
+    @override_settings(QUICK_SEARCH_CACHE_TIMEOUT=60)
+    def test_results_cached_per_normalized_term(self):
+        self.executed = []
+
+        self._quick_search("Some  term")
+        results = self._quick_search("some term ")
+
+        self.assertEqual(len(self.executed), 1)
+        self.assertEqual(len(results["zaken"]), 0)
+
+        self.request.user = UserFactory.create()
+        self._quick_search("some term")
+
+        self.assertEqual(len(self.executed), 2)
@@ -0,0 +1,205 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.urls import reverse_lazy
+
+from elasticsearch_dsl import MultiSearch
+from elasticsearch_dsl.response import Response
+from rest_framework.test import APITestCase
+
+from zac.accounts.tests.factories import SuperUserFactory, UserFactory
+from zac.core.tests.utils import ClearCachesMixin
+
+from ..documents import InformatieObjectDocument, ZaakDocument
+from ..drf_api.serializers import (
+    DEFAULT_ES_INFORMATIEOBJECTDOCUMENT_FIELDS,
+    DEFAULT_ES_ZAAKDOCUMENT_FIELDS,
+)
+from ..searches import autocomplete_zaak_search
+from .utils import ESMixin
+
+HITS = {
+    "zaken": [
+        {
+            "bronorganisatie": "123456782",
+            "identificatie": "ZAAK-2021-0000000001",
+            "omschrijving": "some zaak",
+        }
+    ],
+    "documenten": [
+        {
+            "titel": "some-document.txt",
+            "url": "http://documents.nl/api/v1/enkelvoudiginformatieobjecten/1",
+            "related_zaken": [
+                {
+                    "bronorganisatie": "123456782",
+                    "identificatie": "ZAAK-2021-0000000001",
+                    "omschrijving": "some zaak",
+                }
+            ],
+        }
+    ],
+}
+
+
+class SuggestFieldsTests(APITestCase):
+    def test_mapping(self):
+        zaak_properties = ZaakDocument._doc_type.mapping.to_dict()["properties"]
+        document_properties = InformatieObjectDocument._doc_type.mapping.to_dict()[
+            "properties"
+        ]
+
+        self.assertEqual(
+            zaak_properties["identificatie_suggest"],
+            {"type": "search_as_you_type", "analyzer": "strip_leading_zeros"},
+        )
+        self.assertEqual(
+            document_properties["titel_suggest"], {"type": "search_as_you_type"}
+        )
+
+    def test_not_in_returnable_fields(self):
+        self.assertNotIn("identificatie_suggest", DEFAULT_ES_ZAAKDOCUMENT_FIELDS)
+        self.assertNotIn("titel_suggest", DEFAULT_ES_INFORMATIEOBJECTDOCUMENT_FIELDS)
+
+
+class AutocompleteZaakSearchTests(ESMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        for i, identificatie in enumerate(
+            ["ZAAK-2020-0000000010", "ZAAK-2020-0000000100", "ZAAK-2021-0000000020"]
+        ):
+            ZaakDocument(
+                meta={"id": str(i)},
+                url=f"https://zaken.nl/api/v1/zaken/{i}",
+                identificatie=identificatie,
+                identificatie_suggest=identificatie,
+            ).save()
+        self.refresh_index()
+
+    def _search(self, term: str) -> list:
+        return [
+            zaak.identificatie
+            for zaak in autocomplete_zaak_search(term, only_allowed=False)
+        ]
+
+    def test_leading_zeros_stripped(self):
+        results = self._search("ZAAK-2020-10")
+
+        self.assertIn("ZAAK-2020-0000000010", results)
+        self.assertNotEqual(results[0], "ZAAK-2021-0000000020")
+
+    def test_number_prefix(self):
+        self.assertEqual(
+            set(self._search("10")),
+            {"ZAAK-2020-0000000010", "ZAAK-2020-0000000100"},
+        )
+        self.assertEqual(self._search("ZAAK-2021-2")[0], "ZAAK-2021-0000000020")
+
+
+class SuggestViewTests(ClearCachesMixin, APITestCase):
+    endpoint = reverse_lazy("suggest")
+
+    def setUp(self):
+        super().setUp()
+        self.executed = []
+
+    def _execute(self, multi_search):
+        self.executed.append(multi_search.to_dict())
+        return [
+            Response(
+                search,
+                {
+                    "hits": {
+                        "total": {"value": 1},
+                        "hits": [{"_source": source} for source in HITS[name]],
+                    }
+                },
+            )
+            for name, search in zip(HITS, multi_search._searches)
+        ]
+
+    def _get(self, params):
+        with patch.object(
+            MultiSearch, "execute", autospec=True, side_effect=self._execute
+        ):
+            return self.client.get(self.endpoint, params)
+
+    def test_not_authenticated(self):
+        response = self.client.get(self.endpoint, {"search": "ZAAK-2021"})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_search_required(self):
+        self.client.force_authenticate(SuperUserFactory.create())
+
+        response = self._get({})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.executed, [])
+
+    def test_suggest(self):
+        self.client.force_authenticate(SuperUserFactory.create())
+
+        response = self._get({"search": "ZAAK-2021-00"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "zaken": [
+                    {
+                        "identificatie": "ZAAK-2021-0000000001",
+                        "bronorganisatie": "123456782",
+                        "omschrijving": "some zaak",
+                    }
+                ],
+                "documenten": [
+                    {
+                        "titel": "some-document.txt",
+                        "relatedZaken": [
+                            {
+                                "identificatie": "ZAAK-2021-0000000001",
+                                "bronorganisatie": "123456782",
+                                "omschrijving": "some zaak",
+                            }
+                        ],
+                    }
+                ],
+            },
+        )
+
+        self.assertEqual(len(self.executed), 1)
+        zaken_body, documenten_body = self.executed[0][1::2]
+        self.assertEqual(
+            zaken_body["query"]["bool"]["must"],
+            [
+                {
+                    "multi_match": {
+                        "query": "ZAAK-2021-00",
+                        "type": "bool_prefix",
+                        "fields": [
+                            "identificatie_suggest",
+                            "identificatie_suggest._2gram",
+                            "identificatie_suggest._3gram",
+                        ],
+                    }
+                }
+            ],
+        )
+        self.assertEqual(
+            documenten_body["query"]["bool"]["must"][0]["multi_match"]["fields"][0],
+            "titel_suggest",
+        )
+
+    def test_suggest_only_allowed(self):
+        self.client.force_authenticate(UserFactory.create())
+
+        response = self._get({"search": "some"})
+
+        self.assertEqual(response.status_code, 200)
+        zaken_body, documenten_body = self.executed[0][1::2]
+        # no permissions - nothing can match
+        self.assertEqual(zaken_body["query"]["bool"]["filter"], [{"match_none": {}}])
+        self.assertEqual(
+            documenten_body["query"]["bool"]["filter"], [{"match_none": {}}]
+        )
@@ -0,0 +1,181 @@
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from elasticsearch_dsl import Index
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import Catalogus, ZaakType
+from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
+
+from zac.accounts.datastructures import VA_ORDER
+from zac.tests.compat import generate_oas_component
+from zgw.models.zrc import Zaak
+
+from ..api import (
+    update_related_zaak_in_informatieobject_documents,
+    update_related_zaak_in_object_documents,
+)
+from ..documents import (
+    InformatieObjectDocument,
+    ObjectDocument,
+    RelatedZaakDocument,
+    ZaakTypeDocument,
+)
+
+CATALOGI_ROOT = "https://api.catalogi.nl/api/v1/"
+ZAKEN_ROOT = "https://api.zaken.nl/api/v1/"
+CATALOGUS = factory(
+    Catalogus,
+    generate_oas_component(
+        "ztc",
+        "schemas/Catalogus",
+        url=f"{CATALOGI_ROOT}catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd",
+        domein="DOME",
+    ),
+)
+ZAAKTYPE = factory(
+    ZaakType,
+    generate_oas_component(
+        "ztc",
+        "schemas/ZaakType",
+        url=f"{CATALOGI_ROOT}zaaktypen/a8c8bc90-defa-4548-bacd-793874c013aa",
+        catalogus=CATALOGUS.url,
+        omschrijving="ZT1",
+        identificatie="ZT1",
+    ),
+)
+ZAAK_URL = f"{ZAKEN_ROOT}zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+OTHER_ZAAK_URL = f"{ZAKEN_ROOT}zaken/482de5b2-4779-4b29-b84f-add888352182"
+
+
+def get_related_zaak(url: str, omschrijving: str) -> RelatedZaakDocument:
+    return RelatedZaakDocument(
+        url=url,
+        bronorganisatie="002220647",
+        identificatie="ZAAK-001",
+        omschrijving=omschrijving,
+        va_order=VA_ORDER[VertrouwelijkheidsAanduidingen.openbaar],
+        zaaktype=ZaakTypeDocument(
+            url=ZAAKTYPE.url,
+            catalogus=CATALOGUS.url,
+            catalogus_domein="DOME",
+            omschrijving="ZT1",
+            identificatie="ZT1",
+        ),
+    )
+
+
+@patch("zac.core.services.fetch_catalogus", return_value=CATALOGUS)
+class UpdateRelatedZaakTests(SimpleTestCase):
+    @staticmethod
+    def clear_index(init=False):
+        Index(settings.ES_INDEX_OBJECTEN).delete(ignore=404)
+        Index(settings.ES_INDEX_DOCUMENTEN).delete(ignore=404)
+
+        if init:
+            ObjectDocument.init()
+            InformatieObjectDocument.init()
+
+    @staticmethod
+    def refresh_index():
+        Index(settings.ES_INDEX_OBJECTEN).refresh()
+        Index(settings.ES_INDEX_DOCUMENTEN).refresh()
+
+    def setUp(self):
+        super().setUp()
+        self.clear_index(init=True)
+        self.addCleanup(self.clear_index)
+
+        self.zaak = factory(
+            Zaak,
+            generate_oas_component(
+                "zrc",
+                "schemas/Zaak",
+                url=ZAAK_URL,
+                bronorganisatie="002220647",
+                identificatie="ZAAK-001",
+                omschrijving="new omschrijving",
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduidingen.openbaar,
+            ),
+        )
+        self.zaak.zaaktype = ZAAKTYPE
+
+    def test_related_zaak_updated_in_documents_and_objects(self, m_catalogus):
+        related_zaak = get_related_zaak(ZAAK_URL, "old omschrijving")
+        other_related_zaak = get_related_zaak(OTHER_ZAAK_URL, "other zaak")
+        for document_class in [InformatieObjectDocument, ObjectDocument]:
+            document_class(
+                meta={"id": "related"},
+                url="https://example.com/related",
+                related_zaken=[other_related_zaak, related_zaak],
+            ).save()
+            document_class(
+                meta={"id": "unrelated"},
+                url="https://example.com/unrelated",
+                related_zaken=[other_related_zaak],
+            ).save()
+        self.refresh_index()
+
+        update_related_zaak_in_informatieobject_documents(self.zaak)
+        update_related_zaak_in_object_documents(self.zaak)
+        self.refresh_index()
+
+        for document_class in [InformatieObjectDocument, ObjectDocument]:
+            with self.subTest(document_class=document_class.__name__):
+                related = document_class.get(id="related")
+                self.assertEqual(related.meta.version, 2)
+                self.assertEqual(
+                    {rz.url: rz.omschrijving for rz in related.related_zaken},
+                    {ZAAK_URL: "new omschrijving", OTHER_ZAAK_URL: "other zaak"},
+                )
+                self.assertEqual(document_class.get(id="unrelated").meta.version, 1)
+
+    def test_unchanged_related_zaak_left_alone(self, m_catalogus):
+        InformatieObjectDocument(
+            meta={"id": "related"},
+            url="https://example.com/related",
+            related_zaken=[get_related_zaak(ZAAK_URL, "new omschrijving")],
+        ).save()
+        self.refresh_index()
+
+        update_related_zaak_in_informatieobject_documents(self.zaak)
+        self.refresh_index()
+
+        self.assertEqual(InformatieObjectDocument.get(id="related").meta.version, 1)
+
+
+@patch("zac.core.services.fetch_catalogus", return_value=CATALOGUS)
+@patch("elasticsearch_dsl.update_by_query.UpdateByQuery.execute")
+class UpdateRelatedZaakConflictsTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = factory(
+            Zaak,
+            generate_oas_component(
+                "zrc",
+                "schemas/Zaak",
+                url=ZAAK_URL,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduidingen.openbaar,
+            ),
+        )
+        self.zaak.zaaktype = ZAAKTYPE
+
+    def test_retried_on_version_conflicts(self, m_execute, m_catalogus):
+        m_execute.side_effect = [
+            MagicMock(version_conflicts=2),
+            MagicMock(version_conflicts=0),
+        ]
+
+        update_related_zaak_in_informatieobject_documents(self.zaak)
+
+        self.assertEqual(m_execute.call_count, 2)
+
+    @override_settings(ES_RETRY_ON_CONFLICT=3)
+    def test_gives_up_after_retries(self, m_execute, m_catalogus):
+        m_execute.return_value = MagicMock(version_conflicts=1)
+
+        update_related_zaak_in_object_documents(self.zaak)
+
+        self.assertEqual(m_execute.call_count, 3)
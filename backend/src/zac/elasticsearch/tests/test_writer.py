@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from elasticsearch.exceptions import ConnectionError as ESConnectionError
+from elasticsearch.helpers import BulkIndexError
+
+from ..documents import RolDocument
+from ..writer import BufferedWriter, read_your_writes, write_through
+
+
+@override_settings(ES_WRITER_MAX_DELAY=60, ES_WRITER_MAX_ACTIONS=10)
+@patch("zac.elasticsearch.writer.connections")
+@patch("zac.elasticsearch.writer.bulk", return_value=(0, []))
+class BufferedWriterTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.writer = BufferedWriter()
+        self.addCleanup(self.writer.discard, "zaken", "1")
+        self.addCleanup(self.writer.flush)
+
+    def test_updates_are_merged_per_document(self, m_bulk, m_connections):
+        self.writer.update("zaken", "1", {"omschrijving": "old", "toelichting": "t"})
+        self.writer.update("zaken", "1", {"omschrijving": "new"})
+        self.writer.update("zaken", "2", {"rollen": [RolDocument(url="rol")]})
+
+        m_bulk.assert_not_called()
+
+        self.writer.flush()
+
+        actions = m_bulk.call_args[0][1]
+        self.assertEqual(
+            [
+                (action["_index"], action["_id"], action["script"]["params"]["doc"])
+                for action in actions
+            ],
+            [
+                ("zaken", "1", {"omschrijving": "new", "toelichting": "t"}),
+                ("zaken", "2", {"rollen": [{"url": "rol"}]}),
+            ],
+        )
+
+    @override_settings(ES_WRITER_MAX_ACTIONS=2)
+    def test_flush_on_max_actions(self, m_bulk, m_connections):
+        self.writer.update("zaken", "1", {"omschrijving": "some"})
+        m_bulk.assert_not_called()
+
+        self.writer.update("zaken", "2", {"omschrijving": "other"})
+
+        m_bulk.assert_called_once()
+        self.assertEqual(len(m_bulk.call_args[0][1]), 2)
+
+    def test_discard(self, m_bulk, m_connections):
+        self.writer.update("zaken", "1", {"omschrijving": "some"})
+        self.writer.discard("zaken", "1")
+
+        self.writer.flush()
+
+        m_bulk.assert_not_called()
+
+    def test_read_your_writes(self, m_bulk, m_connections):
+        with patch("zac.elasticsearch.writer.writer", self.writer):
+            with read_your_writes():
+                self.writer.update("zaken", "1", {"omschrijving": "some"})
+                self.writer.update("objecten", "1", {"record_data": {}})
+
+        m_bulk.assert_called_once()
+        m_connections.get_connection.return_value.indices.refresh.assert_called_once_with(
+            index="objecten,zaken"
+        )
+
+    def test_write_through(self, m_bulk, m_connections):
+        with patch("zac.elasticsearch.writer.writer", self.writer):
+            with write_through():
+                self.writer.update("zaken", "1", {"omschrijving": "some"})
+
+        m_bulk.assert_called_once()
+        m_connections.get_connection.return_value.indices.refresh.assert_not_called()
+
+    def test_failed_flush_keeps_updates(self, m_bulk, m_connections):
+        def fail(*args, **kwargs):
+            # an update coming in during the request is newer
+            self.writer.update("zaken", "1", {"omschrijving": "newer"})
+            raise ESConnectionError("N/A", "Connection refused", None)
+
+        self.writer.update("zaken", "1", {"omschrijving": "old", "toelichting": "t"})
+        m_bulk.side_effect = fail
+
+        with self.assertRaises(ESConnectionError):
+            self.writer.flush()
+
+        m_bulk.side_effect = None
+        self.writer.flush()
+
+        actions = m_bulk.call_args[0][1]
+        self.assertEqual(
+            [action["script"]["params"]["doc"] for action in actions],
+            [{"omschrijving": "newer", "toelichting": "t"}],
+        )
+
+    def test_document_errors_raised(self, m_bulk, m_connections):
+        not_found = {"update": {"_id": "1", "status": 404, "error": {}}}
+        conflict = {"update": {"_id": "2", "status": 409, "error": {}}}
+        m_bulk.return_value = (0, [not_found, conflict])
+        self.writer.update("zaken", "1", {"omschrijving": "some"})
+        self.writer.update("zaken", "2", {"omschrijving": "other"})
+
+        with self.assertRaises(BulkIndexError) as context:
+            self.writer.flush()
+
+        self.assertEqual(context.exception.errors, [not_found])
+
+    def test_background_flush_retried(self, m_bulk, m_connections):
+        m_bulk.side_effect = ESConnectionError("N/A", "Connection refused", None)
+        self.writer.update("zaken", "1", {"omschrijving": "some"})
+
+        self.writer._flush_in_background()
+
+        self.assertIsNotNone(self.writer._timer)
+        m_bulk.side_effect = None
+        self.writer.flush()
+        self.assertIsNone(self.writer._timer)
+        self.assertEqual(m_bulk.call_count, 2)
@@ -0,0 +1,248 @@
+"""
+Buffered partial updates of the documents in the search indices.
+
+Forcing a refresh on every write blocks the caller for up to a refresh interval and
+creates many tiny segments. Instead, updates are buffered per document, merged and
+sent in a single bulk request once enough of them are pending or after a short
+delay. Searches see them after the next scheduled index refresh.
+
+Flows that must see their own writes in search results right away wrap them in
+:func:`read_your_writes`. Flows that must know whether their writes succeeded - the
+notification handlers, so the notification is retried - wrap them in
+:func:`write_through`. Other buffered updates are sent from a background timer,
+which retries them when the bulk request fails. Updates still buffered when the
+process is killed are lost: the index is corrected by the next change of the
+object or by reindexing.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+from elasticsearch.helpers import BulkIndexError, bulk
+from elasticsearch_dsl.connections import connections
+
+logger = logging.getLogger(__name__)
+
+# Top-level fields are replaced rather than merged into the stored values, in the same
+# way pending updates of a document are merged in the buffer.
+UPDATE_SCRIPT = """
+for (def entry : params.doc.entrySet()) {
+    ctx._source[entry.getKey()] = entry.getValue();
+}
+"""
+
+
+@dataclass
+class WriteToken:
+    """
+    Reference to buffered writes, see :meth:`BufferedWriter.wait_for`.
+    """
+
+    generation: int
+    indices: Set[str] = field(default_factory=set)
+
+    def merge(self, other: "WriteToken") -> "WriteToken":
+        return WriteToken(
+            generation=max(self.generation, other.generation),
+            indices=self.indices | other.indices,
+        )
+
+
+_collected_tokens: ContextVar[Optional[List[WriteToken]]] = ContextVar(
+    "es_write_tokens", default=None
+)
+
+
+def _to_dict(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+class BufferedWriter:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pending: Dict[Tuple[str, str], dict] = {}
+        # incremented on every flush, so tokens can tell if their writes are sent
+        self._generation = 0
+        self._last_flush = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+    def update(self, index: str, id: str, doc: dict) -> WriteToken:
+        """
+        Buffer an update of (some of) the top-level fields of an indexed document.
+        """
+        doc = {name: _to_dict(value) for name, value in doc.items()}
+        with self._lock:
+            self._pending.setdefault((index, str(id)), {}).update(doc)
+            token = WriteToken(generation=self._generation, indices={index})
+
+            if (
+                settings.ES_WRITER_MAX_DELAY <= 0
+                or len(self._pending) >= settings.ES_WRITER_MAX_ACTIONS
+            ):
+                self.flush()
+            else:
+                self._schedule_flush()
+
+        if (tokens := _collected_tokens.get()) is not None:
+            tokens.append(token)
+        return token
+
+    def discard(self, index: str, id: str) -> None:
+        """
+        Drop the buffered updates of a document, e.g. because it is deleted.
+        """
+        with self._lock:
+            self._pending.pop((index, str(id)), None)
+
+    def _schedule_flush(self) -> None:
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(
+                    settings.ES_WRITER_MAX_DELAY, self._flush_in_background
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Send the buffered updates.
+
+        If the bulk request fails, the updates are buffered again and the error is
+        raised. Updates of documents that ES rejected, other than version conflicts,
+        are raised as a :class:`BulkIndexError`.
+        """
+        # The lock is held during the request so the bulk requests go out in order.
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            pending, self._pending = self._pending, {}
+            if not pending:
+                self._generation += 1
+                return
+
+            actions = [
+                {
+                    "_op_type": "update",
+                    "_index": index,
+                    "_id": id,
+                    "retry_on_conflict": settings.ES_RETRY_ON_CONFLICT,
+                    "script": {
+                        "source": UPDATE_SCRIPT,
+                        "lang": "painless",
+                        "params": {"doc": doc},
+                    },
+                }
+                for (index, id), doc in pending.items()
+            ]
+            try:
+                _, errors = bulk(
+                    connections.get_connection(),
+                    actions,
+                    chunk_size=settings.ES_CHUNK_SIZE,
+                    raise_on_error=False,
+                )
+            except Exception:
+                # Keep the updates for the next flush - updates that came in since
+                # are newer. Resending already applied updates is harmless, they
+                # replace the fields.
+                for key, doc in pending.items():
+                    self._pending[key] = {**doc, **self._pending.get(key, {})}
+                raise
+
+            self._generation += 1
+            self._last_flush = time.monotonic()
+
+        failed = []
+        for error in errors:
+            ((_, result),) = error.items()
+            if result.get("status") == 409:
+                logger.warning("Version conflict updating indexed document: %s", error)
+            else:
+                failed.append(error)
+        if failed:
+            raise BulkIndexError(
+                f"{len(failed)} indexed document(s) could not be updated.", failed
+            )
+
+    def _flush_in_background(self, retry: bool = True) -> None:
+        try:
+            self.flush()
+        except BulkIndexError as exc:
+            logger.error("%s Errors: %r", exc.args[0], exc.errors)
+        except Exception:
+            logger.exception("Could not flush the buffered index updates.")
+            if retry:
+                self._schedule_flush()
+
+    def wait_for(self, token: WriteToken, refresh: bool = True) -> None:
+        """
+        Send the writes of the token and, with ``refresh``, make them visible to
+        searches.
+        """
+        with self._lock:
+            if token.generation == self._generation:
+                self.flush()
+            recently_flushed = (
+                time.monotonic() - self._last_flush < settings.ES_REFRESH_INTERVAL
+            )
+
+        if refresh and recently_flushed and token.indices:
+            connections.get_connection().indices.refresh(
+                index=",".join(sorted(token.indices))
+            )
+
+
+writer = BufferedWriter()
+atexit.register(writer._flush_in_background, retry=False)
+
+
+@contextmanager
+def _collect_tokens() -> Iterator[List[WriteToken]]:
+    tokens = []
+    reset_token = _collected_tokens.set(tokens)
+    try:
+        yield tokens
+    finally:
+        _collected_tokens.reset(reset_token)
+
+
+def _wait_for(tokens: List[WriteToken], refresh: bool) -> None:
+    if tokens:
+        token = tokens[0]
+        for other in tokens[1:]:
+            token = token.merge(other)
+        writer.wait_for(token, refresh=refresh)
+
+
+@contextmanager
+def read_your_writes() -> Iterator[None]:
+    """
+    Make the index updates done in the block visible to searches when it exits.
+    """
+    with _collect_tokens() as tokens:
+        yield
+    _wait_for(tokens, refresh=True)
+
+
+@contextmanager
+def write_through() -> Iterator[None]:
+    """
+    Send the index updates done in the block when it exits, raising any errors.
+    """
+    with _collect_tokens() as tokens:
+        yield
+    _wait_for(tokens, refresh=False)
@@ -5,6 +5,7 @@ from urllib.parse import urljoin
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+from zac.core.config_snapshot import get_config
 from zac.utils.http import get_session
 
 from .models import FormsConfig
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 class OpenFormsClient:
     def __init__(self):
-        config = FormsConfig.get_solo()
+        config = get_config(FormsConfig)
         if not config.forms_service:
             raise ImproperlyConfigured("No Open Forms service specified yet!")
 
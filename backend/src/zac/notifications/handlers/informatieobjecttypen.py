@@ -15,4 +15,4 @@ class InformatieObjecttypenHandler:
             catalogus = data.get("kenmerken", {}).get("catalogus")
             if catalogus:
                 invalidate_informatieobjecttypen_cache(catalogus=catalogus)
-            invalidate_informatieobjecttypen_cache()
+            invalidate_informatieobjecttypen_cache(url=data.get("resource_url", ""))
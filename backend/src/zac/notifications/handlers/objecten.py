@@ -8,9 +8,15 @@ from zgw_consumers.api_models.base import factory
 from zac.contrib.objects.kownsl.cache import invalidate_review_requests_cache
 from zac.contrib.objects.kownsl.data import ReviewRequest
 from zac.core.cache import invalidate_fetch_object_cache
+from zac.core.config_snapshot import get_config
 from zac.core.models import MetaObjectTypesConfig
 from zac.core.services import delete_zaakobjecten_of_object, fetch_object
-from zac.elasticsearch.api import delete_object_document, update_object_document
+from zac.elasticsearch.api import (
+    delete_meta_object_document,
+    delete_object_document,
+    update_meta_object_document,
+    update_object_document,
+)
 
 logger = logging.getLogger(__name__)
 Notification = Dict[str, Any]
@@ -32,7 +38,7 @@ class ObjectenHandler:
                 )
 
     def _meta_object_handlers(self) -> Dict[str, callable]:
-        meta_config = MetaObjectTypesConfig.get_solo()
+        meta_config = get_config(MetaObjectTypesConfig)
         return {
             meta_config.review_request_objecttype: self._review_request_object_handler
         }
@@ -53,12 +59,17 @@ class ObjectenHandler:
             ) is not None:
                 handler(obj)
 
-            if (
-                obj["type"]["url"]
-                not in MetaObjectTypesConfig.get_solo().meta_objecttype_urls.values()
-            ):
+            meta_config = get_config(MetaObjectTypesConfig)
+            if obj["type"]["url"] in {
+                meta_config.checklist_objecttype,
+                meta_config.review_request_objecttype,
+            }:
+                update_meta_object_document(obj)
+
+            if obj["type"]["url"] not in meta_config.meta_objecttype_urls.values():
                 update_object_document(obj)
 
         elif actie == "destroy":
+            delete_meta_object_document(hoofd_object)
             delete_object_document(hoofd_object)
             delete_zaakobjecten_of_object(hoofd_object)
@@ -0,0 +1,11 @@
+from typing import Any, Dict
+
+from zac.core.cache import invalidate_objecttypes_cache
+
+Notification = Dict[str, Any]
+
+
+class ObjecttypenHandler:
+    def handle(self, data: Notification) -> None:
+        if data.get("resource") in {"objecttype", "objectversion"}:
+            invalidate_objecttypes_cache()
@@ -13,6 +13,7 @@ from zac.accounts.permission_loaders import add_permission_for_behandelaar
 from zac.activities.constants import ActivityStatuses
 from zac.activities.models import Activity
 from zac.camunda.user_tasks.api import get_camunda_user_tasks
+from zac.contrib.board.cache import invalidate_management_dashboard_summary_cache
 from zac.contrib.board.models import BoardItem
 from zac.contrib.dowc.api import bulk_close_all_documents_for_zaak
 from zac.contrib.objects.services import (
@@ -115,6 +116,7 @@ class ZakenHandler:
         if zaak.status:
             zaak_doc.status = create_status_document(zaak.status)
         zaak_doc.save(refresh=True)
+        invalidate_management_dashboard_summary_cache()
 
     def _on_zaak_destroy(self, data: Notification) -> None:
         zaak_url = data["hoofd_object"]
@@ -122,6 +124,7 @@ class ZakenHandler:
         BoardItem.objects.filter(object=zaak_url).delete()
         AccessRequest.objects.filter(zaak=zaak_url).delete()
         delete_zaak_document(zaak_url)
+        invalidate_management_dashboard_summary_cache()
 
     # ---- Resultaat ----
     def _on_resultaat_create(self, data: Notification) -> None:
@@ -142,6 +145,7 @@ class ZakenHandler:
 
         if zaak.status.statustype.is_eindstatus:
             update_status_in_zaak_document(zaak)
+            invalidate_management_dashboard_summary_cache()
             bulk_lock_review_requests_for_zaak(
                 zaak, reason=f"Zaak is {zaak.status.statustype.omschrijving.lower()}."
             )
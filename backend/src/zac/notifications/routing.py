@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional, Protocol
 from .handlers.documenten import InformatieObjectenHandler
 from .handlers.informatieobjecttypen import InformatieObjecttypenHandler
 from .handlers.objecten import ObjectenHandler
+from .handlers.objecttypen import ObjecttypenHandler
 from .handlers.zaaktypen import ZaaktypenHandler
 from .handlers.zaken import ZakenHandler
 
@@ -43,6 +44,7 @@ handler = RoutingHandler(
         "informatieobjecttypen": InformatieObjecttypenHandler(),
         "zaken": ZakenHandler(),
         "objecten": ObjectenHandler(),
+        "objecttypen": ObjecttypenHandler(),
         "documenten": InformatieObjectenHandler(),
     }
 )
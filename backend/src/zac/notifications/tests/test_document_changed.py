@@ -117,7 +117,7 @@ class InformatieObjectChangedTests(ClearCachesMixin, ESMixin, APITransactionTest
             )
 
         url = reverse("notifications:callback")
-        with patch("zac.elasticsearch.api.parallel", return_value=mock_parallel()):
+        with patch("zac.core.services.parallel", return_value=mock_parallel()):
             response = self.client.post(url, NOTIFICATION_CREATE)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
@@ -174,6 +174,7 @@ class InformatieObjectChangedTests(ClearCachesMixin, ESMixin, APITransactionTest
         self.assertEqual(
             io_document.last_edited_date.isoformat(), "2022-03-04T12:11:39.293000+01:00"
         )
+        self.assertEqual(io_document.last_edited_by, "John Doe")
 
     def test_informatieobject_destroyed_in_es(self, rm):
         self._setup_mocks(rm)
@@ -92,6 +92,11 @@ class ReviewUpdatedTests(ClearCachesMixin, APITestCase):
     def setUp(self):
         super().setUp()
         self.client.force_authenticate(user=self.user)
+        patcher = patch(
+            "zac.notifications.handlers.objecten.update_meta_object_document"
+        )
+        self.mock_update_meta_object_document = patcher.start()
+        self.addCleanup(patcher.stop)
 
     # UPDATED: patch path for invalidate_review_requests_cache
     @patch(
@@ -163,3 +168,4 @@ class ReviewUpdatedTests(ClearCachesMixin, APITestCase):
         self.assertFalse(
             cache.has_key(f"review_request:detail:{self.review_request['id']}")
         )
+        self.mock_update_meta_object_document.assert_called_once_with(rr)
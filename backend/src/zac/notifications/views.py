@@ -2,6 +2,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from zac.elasticsearch.writer import write_through
+
 from .routing import handler
 from .serializers import NotificatieSerializer
 
@@ -21,4 +23,6 @@ class BaseNotificationCallbackView(APIView):
 
 class NotificationCallbackView(BaseNotificationCallbackView):
     def handle_notification(self, data: dict) -> None:
-        handler.handle(data)
+        # a failed index update fails the callback, so the notification is retried
+        with write_through():
+            handler.handle(data)
@@ -0,0 +1,30 @@
+"""
+Carry context variables into the worker threads of ``zgw_consumers.concurrent``.
+
+Threads of a :class:`concurrent.futures.ThreadPoolExecutor` start with an empty
+context, so context variables set by the caller (e.g.
+:func:`zac.utils.decorators.bulk_cache`) would not apply to the work it hands to
+``parallel``. :func:`wrap_fn` replaces the wrapper ``parallel`` applies to every
+submitted callable - see :meth:`zac.core.apps.CoreConfig.ready`.
+"""
+
+import contextvars
+import functools
+
+from zgw_consumers.concurrent import wrap_fn as _wrap_fn
+
+
+def wrap_fn(fn):
+    """
+    Run ``fn`` in a copy of the context of the thread submitting it.
+    """
+    context = contextvars.copy_context()
+    wrapped = _wrap_fn(fn)
+
+    @functools.wraps(fn)
+    def run_in_context(*args, **kwargs):
+        # a context can only be entered by one thread at a time, and ``map`` runs
+        # the same callable in several threads
+        return context.copy().run(wrapped, *args, **kwargs)
+
+    return run_in_context
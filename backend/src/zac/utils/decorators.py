@@ -1,19 +1,58 @@
 import functools
 import inspect
 import logging
+import math
 import pickle
+import random
+import threading
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 import requests
 
 logger = logging.getLogger(__name__)
 
 _STALE_SUFFIX = ":stale"
+_LOCK_SUFFIX = ":lock"
+_META_SUFFIX = ":xfetch"
 _DEFAULT_STALE_TTL_MULTIPLIER = 10
 
+# Only the job entering the block is affected, not other requests of the (web)
+# process. The worker threads of ``zgw_consumers.concurrent.parallel`` inherit the
+# context of the caller, see :func:`zac.utils.concurrent.wrap_fn`.
+_bulk_mode: ContextVar[Optional["_BulkMode"]] = ContextVar("bulk_mode", default=None)
+
+
+class _BulkMode:
+    def __init__(self, alias: Optional[str]):
+        self.alias = alias
+
+
+@contextmanager
+def bulk_cache(alias: Optional[str] = None):
+    """
+    Keep bulk jobs from filling the shared cache used by :func:`cache`.
+
+    Results already in the shared cache are still used, but results of cache misses
+    are not written to it (nor to the stale shadow keys). If ``alias`` is given,
+    they are written to that cache instead - typically a bounded local memory cache,
+    so repeated lookups within the job remain cheap.
+
+    Applies to the current context (thread) and the ``parallel`` workers it starts
+    for the duration of the block.
+    """
+    token = _bulk_mode.set(_BulkMode(alias))
+    try:
+        yield
+    finally:
+        _bulk_mode.reset(token)
+
 
 class CircuitOpenError(Exception):
     """Raised when a service circuit breaker is open."""
@@ -23,12 +62,54 @@ class CircuitOpenError(Exception):
         super().__init__(f"Circuit breaker open for '{service_name}': refusing call.")
 
 
+class _CircuitState:
+    """
+    What this process knows about a circuit breaker.
+
+    Redis is only touched on state transitions: counting a failure and closing the
+    circuit again. The failure count is shared, so other processes open their circuit
+    as soon as they record a failure of their own once the threshold is reached.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.open_until = 0.0
+        # set once this process recorded a failure, until a success resets it
+        self.dirty = False
+
+
+_circuits_lock = threading.Lock()
+_circuits: Dict[Tuple[str, str], _CircuitState] = {}
+
+
+def _get_circuit(alias: str, cb_name: str) -> _CircuitState:
+    with _circuits_lock:
+        state = _circuits.get((alias, cb_name))
+        if state is None:
+            state = _circuits[(alias, cb_name)] = _CircuitState()
+        return state
+
+
+def reset_circuits() -> None:
+    """
+    Forget the circuit breaker state of this process.
+    """
+    with _circuits_lock:
+        _circuits.clear()
+
+
 def _record_failure(
-    cache_backend, cb_name, failure_window, failure_threshold, recovery_timeout
+    cache_backend,
+    state,
+    cb_name,
+    failure_window,
+    failure_threshold,
+    recovery_timeout,
 ):
     """Record a failure and trip the circuit if threshold is exceeded."""
     failures_key = f"cb:{cb_name}:failures"
-    open_key = f"cb:{cb_name}:open"
+    with state.lock:
+        state.dirty = True
     try:
         try:
             new_count = cache_backend.incr(failures_key)
@@ -37,7 +118,8 @@ def _record_failure(
             new_count = 1
 
         if new_count >= failure_threshold:
-            cache_backend.set(open_key, 1, recovery_timeout)
+            with state.lock:
+                state.open_until = time.monotonic() + recovery_timeout
             logger.warning(
                 "Circuit breaker OPEN for '%s' after %d failures in %ds.",
                 cb_name,
@@ -48,24 +130,164 @@ def _record_failure(
         pass  # Redis unavailable — fail open
 
 
-def _reset_circuit(cache_backend, cb_name):
+def _reset_circuit(cache_backend, state, cb_name):
     """Reset circuit breaker state after a successful call."""
+    with state.lock:
+        if not state.dirty:
+            return
+        state.dirty = False
+        state.open_until = 0.0
     try:
         cache_backend.delete(f"cb:{cb_name}:failures")
-        cache_backend.delete(f"cb:{cb_name}:open")
     except Exception:
         pass
 
 
-def _is_circuit_open(cache_backend, cb_name):
+def _is_circuit_open(state):
     """Check if the circuit is currently open."""
+    return state.open_until > time.monotonic()
+
+
+def _store(cache_backend, entries, delete=()):
+    """
+    Write ``(key, value, timeout)`` entries and delete ``delete`` keys.
+
+    Every distinct value is serialized only once. On Redis, all commands are sent in
+    a single pipelined round-trip.
+    """
+    client = getattr(cache_backend, "client", None)
+    if not (hasattr(client, "encode") and hasattr(client, "get_client")):
+        for key, value, timeout in entries:
+            cache_backend.set(key, value, timeout)
+        if delete:
+            cache_backend.delete_many(delete)
+        return
+
+    # serialize everything before anything is written
+    encoded = {}
+    for _, value, _ in entries:
+        if id(value) not in encoded:
+            encoded[id(value)] = client.encode(value)
+
+    pipeline = client.get_client(write=True).pipeline(transaction=False)
+    for key, value, timeout in entries:
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = cache_backend.default_timeout
+        if timeout is not None and int(timeout * 1000) <= 0:
+            pipeline.delete(client.make_key(key))
+            continue
+        pipeline.set(
+            client.make_key(key),
+            encoded[id(value)],
+            px=int(timeout * 1000) if timeout is not None else None,
+        )
+    for key in delete:
+        pipeline.delete(client.make_key(key))
+    pipeline.execute()
+
+
+class _Flight:
+    """
+    A computation of a cache key in progress in this process.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception: Optional[BaseException] = None
+
+
+_flights_lock = threading.Lock()
+_flights: Dict[str, _Flight] = {}
+
+
+def _coalesce(flight_key: str, load: Callable[[], Any], current: Any, timeout: float):
+    """
+    Call ``load`` once per key in this process, concurrent callers share the result.
+
+    Callers that already have a (soon to expire) ``current`` value don't wait.
+    """
+    with _flights_lock:
+        flight = _flights.get(flight_key)
+        leader = flight is None
+        if leader:
+            flight = _flights[flight_key] = _Flight()
+
+    if not leader:
+        if current is not None:
+            return current
+        if not flight.done.wait(timeout):
+            return load()
+        if flight.exception is not None:
+            raise flight.exception
+        return flight.result
+
+    try:
+        flight.result = load()
+        return flight.result
+    except BaseException as exc:
+        flight.exception = exc
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[flight_key]
+        flight.done.set()
+
+
+def _acquire_lock(cache_backend, lock_key: str, timeout: float) -> bool:
+    try:
+        return cache_backend.add(lock_key, 1, timeout)
+    except Exception:
+        return True  # Redis unavailable — fail open
+
+
+def _release_lock(cache_backend, lock_key: str) -> None:
     try:
-        return cache_backend.get(f"cb:{cb_name}:open") is not None
+        cache_backend.delete(lock_key)
     except Exception:
-        return False  # Redis unavailable — fail open
+        pass
 
 
-def cache(key: str, alias: str = "default", stale_ttl: int = None, **set_options):
+def _wait_for_result(
+    cache_backend, cache_key: str, lock_key: str, timeout: float, poll_interval: float
+):
+    """
+    Poll until the process holding the lock stored the result or gave up.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        try:
+            values = cache_backend.get_many([cache_key, lock_key])
+        except Exception:
+            return None
+        if values.get(cache_key) is not None:
+            return values[cache_key]
+        if lock_key not in values:
+            return None
+    return None
+
+
+def _should_refresh_early(meta: Optional[Tuple[float, float]], beta: float) -> bool:
+    """
+    Probabilistic early expiration ("XFetch"): the closer to expiry and the more
+    expensive the computation, the likelier a caller recomputes the value.
+    """
+    if meta is None:
+        return False
+    delta, expires_at = meta
+    # 1 - random() lies in (0, 1], so the logarithm is defined and <= 0
+    return time.time() - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def cache(
+    key: str,
+    alias: str = "default",
+    stale_ttl: int = None,
+    hot: bool = False,
+    beta: float = 1.0,
+    **set_options,
+):
     """
     Cache decorator that safely caches function results using a formatted key.
 
@@ -76,7 +298,23 @@ def cache(key: str, alias: str = "default", stale_ttl: int = None, **set_options
       shadow key with a longer TTL.
     - Circuit breaker: short-circuits calls to services that have failed
       repeatedly, serving stale data or raising CircuitOpenError.
+    - Inside a :func:`bulk_cache` block, results are not written to ``alias``.
+    - Single-flight: on a miss, only one caller per key computes the result. Other
+      threads in the process wait for it, other processes poll the cache while the
+      computing process holds a lock.
+    - ``hot=True`` keys are recomputed early, with a probability growing towards
+      their expiry (scaled by ``beta``), so popular keys don't expire under load.
+    - A result is serialized once and, on Redis, written together with its shadow
+      keys in one pipelined round-trip. Circuit breaker state is kept in process and
+      only synced to the cache when it changes.
+
+    ``timeout`` is the only supported cache option.
     """
+    unsupported = set(set_options) - {"timeout"}
+    if unsupported:
+        raise TypeError(
+            "Unsupported cache option(s): %s" % ", ".join(sorted(unsupported))
+        )
 
     def decorator(func: callable):
         argspec = inspect.getfullargspec(func)
@@ -92,6 +330,9 @@ def cache(key: str, alias: str = "default", stale_ttl: int = None, **set_options
         if _stale_ttl is None and "timeout" in set_options:
             _stale_ttl = set_options["timeout"] * _DEFAULT_STALE_TTL_MULTIPLIER
 
+        # Early recomputation needs to know when the key expires
+        early_refresh = hot and set_options.get("timeout") is not None
+
         # Circuit breaker identity
         cb_name = func.__qualname__
 
@@ -117,20 +358,45 @@ def cache(key: str, alias: str = "default", stale_ttl: int = None, **set_options
 
             cache_key = key.format(**key_kwargs)
             stale_key = cache_key + _STALE_SUFFIX
+            lock_key = cache_key + _LOCK_SUFFIX
+            meta_key = cache_key + _META_SUFFIX
             _cache = caches[alias]
+            bulk_mode = _bulk_mode.get()
+            bulk_cache_backend = (
+                caches[bulk_mode.alias] if bulk_mode and bulk_mode.alias else None
+            )
 
             # --- Primary cache hit ---
-            result = _cache.get(cache_key)
-            if result is not None:
+            refresh_early = False
+            if early_refresh and bulk_mode is None:
+                values = _cache.get_many([cache_key, meta_key])
+                result = values.get(cache_key)
+                refresh_early = result is not None and _should_refresh_early(
+                    values.get(meta_key), beta
+                )
+            else:
+                result = _cache.get(cache_key)
+            if result is not None and not refresh_early:
                 logger.debug("Cache key '%s' hit", cache_key)
                 return result
 
+            if bulk_cache_backend is not None:
+                result = bulk_cache_backend.get(cache_key)
+                if result is not None:
+                    logger.debug("Bulk cache key '%s' hit", cache_key)
+                    return result
+
             # --- Circuit breaker check ---
             cb_threshold = getattr(settings, "CB_FAILURE_THRESHOLD", 5)
             cb_window = getattr(settings, "CB_FAILURE_WINDOW", 60)
             cb_recovery = getattr(settings, "CB_RECOVERY_TIMEOUT", 30)
+            lock_timeout = getattr(settings, "CACHE_LOCK_TIMEOUT", 30)
+            poll_interval = getattr(settings, "CACHE_LOCK_POLL_INTERVAL", 0.1)
 
-            if _is_circuit_open(_cache, cb_name):
+            circuit = _get_circuit(alias, cb_name)
+            if _is_circuit_open(circuit):
+                if result is not None:
+                    return result
                 if _stale_ttl is not None:
                     stale = _cache.get(stale_key)
                     if stale is not None:
@@ -142,42 +408,103 @@ def cache(key: str, alias: str = "default", stale_ttl: int = None, **set_options
                         return stale
                 raise CircuitOpenError(cb_name)
 
-            # --- Primary cache miss: call the function ---
-            try:
-                result = func(*args, **kwargs)
-            except Exception as exc:
-                _record_failure(_cache, cb_name, cb_window, cb_threshold, cb_recovery)
+            def compute(locked: bool = False):
+                # the lock is released together with the writes, or else afterwards
+                release = [lock_key] if locked else []
+                try:
+                    return _compute(release)
+                finally:
+                    if release:
+                        _release_lock(_cache, lock_key)
+
+            def _compute(release: list):
+                # --- Primary cache miss: call the function ---
+                started = time.monotonic()
+                try:
+                    computed = func(*args, **kwargs)
+                except Exception as exc:
+                    _record_failure(
+                        _cache, circuit, cb_name, cb_window, cb_threshold, cb_recovery
+                    )
+
+                    # An early refresh failed, the current value is still valid
+                    if result is not None:
+                        return result
+
+                    # Stale-while-error fallback
+                    if _stale_ttl is not None:
+                        stale = _cache.get(stale_key)
+                        if stale is not None:
+                            logger.warning(
+                                "Service call failed for '%s', serving stale data. Error: %s",
+                                cache_key,
+                                exc,
+                            )
+                            return stale
+                    raise
+                duration = time.monotonic() - started
+
+                # --- Success: store result and reset circuit ---
+                _reset_circuit(_cache, circuit, cb_name)
 
-                # Stale-while-error fallback
-                if _stale_ttl is not None:
-                    stale = _cache.get(stale_key)
-                    if stale is not None:
-                        logger.warning(
-                            "Service call failed for '%s', serving stale data. Error: %s",
+                try:
+                    if bulk_mode is None:
+                        timeout = set_options.get("timeout", DEFAULT_TIMEOUT)
+                        entries = [(cache_key, computed, timeout)]
+                        if _stale_ttl is not None:
+                            entries.append((stale_key, computed, _stale_ttl))
+                        if early_refresh:
+                            meta = (duration, time.time() + timeout)
+                            entries.append((meta_key, meta, timeout))
+                        _store(_cache, entries, delete=list(release))
+                        release.clear()
+                        logger.debug("Cache key '%s' stored successfully", cache_key)
+                    elif bulk_cache_backend is not None:
+                        bulk_cache_backend.set(
                             cache_key,
-                            exc,
+                            computed,
+                            set_options.get("timeout", DEFAULT_TIMEOUT),
                         )
-                        return stale
-                raise
-
-            # --- Success: store result and reset circuit ---
-            _reset_circuit(_cache, cb_name)
-
-            try:
-                pickle.dumps(result)
-                _cache.set(cache_key, result, **set_options)
-                if _stale_ttl is not None:
-                    _cache.set(stale_key, result, _stale_ttl)
-                logger.debug("Cache key '%s' stored successfully", cache_key)
-            except Exception as e:
-                logger.debug(
-                    "Skipping cache for key '%s': object of type %s is unpicklable (%s)",
-                    cache_key,
-                    type(result).__name__,
-                    e,
+                        logger.debug(
+                            "Bulk cache key '%s' stored successfully", cache_key
+                        )
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    logger.debug(
+                        "Skipping cache for key '%s': object of type %s is unpicklable (%s)",
+                        cache_key,
+                        type(computed).__name__,
+                        e,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to store cache key '%s': %s: %s",
+                        cache_key,
+                        type(e).__name__,
+                        e,
+                    )
+
+                return computed
+
+            def load():
+                # Bulk jobs don't store their results in the shared cache, so other
+                # processes would wait for them in vain.
+                if bulk_mode is not None:
+                    return compute()
+
+                if _acquire_lock(_cache, lock_key, lock_timeout):
+                    return compute(locked=True)
+
+                # Another process is already refreshing the key
+                if result is not None:
+                    return result
+                waited = _wait_for_result(
+                    _cache, cache_key, lock_key, lock_timeout, poll_interval
                 )
+                if waited is not None:
+                    return waited
+                return compute()
 
-            return result
+            return _coalesce(f"{alias}:{cache_key}", load, result, lock_timeout)
 
         return wrapped
 
@@ -1,4 +1,8 @@
+import base64
+import json
+import math
 import threading
+from typing import IO, Iterator
 
 from django.conf import settings
 
@@ -52,3 +56,47 @@ def get_session() -> Session:
                 mount_retry_adapter(session)
                 _shared_session = session
     return _shared_session
+
+
+class Base64JSONBody:
+    """
+    JSON request body embedding the base64 encoded content of a file.
+
+    The content is read and encoded chunk by chunk while the body is sent, so
+    the file is never held in memory as a whole. The length of the body is
+    known upfront, so the request is sent with a Content-Length header rather
+    than chunked.
+    """
+
+    def __init__(
+        self, data: dict, field: str, file: IO[bytes], size: int, chunk_size: int
+    ):
+        self.file = file
+        self.chunk_size = chunk_size
+
+        separator = ", " if data else ""
+        self.prefix = (
+            f'{json.dumps(data)[:-1]}{separator}{json.dumps(field)}: "'.encode()
+        )
+        self.suffix = b'"}'
+        self.length = len(self.prefix) + 4 * math.ceil(size / 3) + len(self.suffix)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+
+        self.file.seek(0)
+        remainder = b""
+        while chunk := self.file.read(self.chunk_size):
+            # only encode multiples of 3 bytes to avoid padding halfway
+            chunk = remainder + chunk
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            if cutoff:
+                yield base64.b64encode(chunk[:cutoff])
+        if remainder:
+            yield base64.b64encode(remainder)
+
+        yield self.suffix
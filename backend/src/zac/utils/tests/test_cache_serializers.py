@@ -0,0 +1,114 @@
+import pickle
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+import orjson
+from dateutil.relativedelta import relativedelta
+from zgw_consumers.api_models.base import Model
+
+from zac.core.management.commands.benchmark_cache_serializer import (
+    get_documents,
+    get_rollen,
+    get_zaak,
+)
+
+from ..cache_serializers import CompactSerializer, _get_schema
+
+
+@dataclass
+class Item(Model):
+    name: str
+    created: date
+    modified: Optional[datetime] = None
+
+
+class CompactSerializerTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.serializer = CompactSerializer({"SERIALIZER_COMPRESS_MIN_LENGTH": 0})
+
+    def _roundtrip(self, value):
+        return self.serializer.loads(self.serializer.dumps(value))
+
+    def test_zgw_models(self):
+        for value in [get_zaak(), get_rollen(3), get_documents(3)]:
+            with self.subTest(value=value):
+                data = self.serializer.dumps(value)
+
+                self.assertEqual(data[:1], b"j")
+                self.assertLess(len(data), len(pickle.dumps(value)))
+                self.assertEqual(self.serializer.loads(data), value)
+
+    def test_nested_model_and_types(self):
+        zaak = get_zaak()
+
+        result = self._roundtrip(zaak)
+
+        self.assertEqual(result.zaaktype, zaak.zaaktype)
+        self.assertIsInstance(result.startdatum, date)
+        self.assertEqual(result.zaaktype.doorlooptijd, relativedelta(days=30))
+        self.assertIsNone(result.einddatum)
+
+    def test_unexpected_field_values(self):
+        item = Item(name="item", created=date(2021, 1, 1))
+        # values that don't match the annotations are kept as they are
+        item.created = "2021-01-01"
+        item.modified = date(2021, 1, 2)
+        item.extra = {1: (datetime(2021, 1, 1, tzinfo=timezone.utc), "$")}
+
+        result = self._roundtrip(item)
+
+        self.assertEqual(result.created, "2021-01-01")
+        self.assertEqual(result.modified, date(2021, 1, 2))
+        self.assertNotIsInstance(result.modified, datetime)
+        self.assertEqual(
+            result.extra, {1: (datetime(2021, 1, 1, tzinfo=timezone.utc), "$")}
+        )
+
+    def test_only_marked_fields_decoded(self):
+        item = Item(name="item", created=date(2021, 1, 1))
+        item.created = "2021-01-01"
+        item.tags = ["a", "b"]
+
+        payload = orjson.loads(self.serializer.dumps(item)[1:])
+
+        self.assertEqual(payload["v"]["c"], [1])
+        self.assertEqual(self._roundtrip(item).tags, ["a", "b"])
+
+    def test_pickle_fallback(self):
+        value = {"set": {1, 2}}
+
+        data = self.serializer.dumps(value)
+
+        self.assertEqual(pickle.loads(data), value)
+        self.assertEqual(self.serializer.loads(data), value)
+
+    def test_reads_pickles(self):
+        zaak = get_zaak()
+
+        self.assertEqual(self.serializer.loads(pickle.dumps(zaak)), zaak)
+
+    def test_changed_schema_is_miss(self):
+        data = self.serializer.dumps(Item(name="item", created=date(2021, 1, 1)))
+        name, fingerprint, field_names, kinds = _get_schema(Item)
+
+        with patch(
+            "zac.utils.cache_serializers._get_schema",
+            return_value=(name, fingerprint + 1, field_names, kinds),
+        ):
+            self.assertIsNone(self.serializer.loads(data))
+
+    def test_compression(self):
+        serializer = CompactSerializer({"SERIALIZER_COMPRESS_MIN_LENGTH": 1024})
+        documents = get_documents(20)
+
+        small = serializer.dumps(documents[0])
+        large = serializer.dumps(documents)
+
+        self.assertEqual(small[:1], b"j")
+        self.assertEqual(large[:1], b"z")
+        self.assertEqual(serializer.loads(large), documents)
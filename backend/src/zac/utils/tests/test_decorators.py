@@ -0,0 +1,325 @@
+import threading
+import time
+from unittest.mock import Mock, call, patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from zgw_consumers.concurrent import parallel
+
+from zac.core.tests.utils import ClearCachesMixin
+
+from ..decorators import CircuitOpenError, _store, bulk_cache, cache
+
+
+class BulkCacheTests(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.func = Mock(return_value="result")
+        self.func.__qualname__ = "func"
+        self.cached_func = cache("func:{arg}", timeout=60)(lambda arg: self.func(arg))
+
+    def test_reads_shared_cache(self):
+        caches["default"].set("func:1", "cached")
+
+        with bulk_cache():
+            result = self.cached_func(1)
+
+        self.assertEqual(result, "cached")
+        self.func.assert_not_called()
+
+    def test_does_not_write_shared_cache(self):
+        with bulk_cache():
+            self.cached_func(1)
+            self.cached_func(1)
+
+        self.assertEqual(self.func.call_count, 2)
+        self.assertIsNone(caches["default"].get("func:1"))
+        self.assertIsNone(caches["default"].get("func:1:stale"))
+
+    def test_writes_bulk_cache(self):
+        with bulk_cache(alias="bulk"):
+            self.cached_func(1)
+            result = self.cached_func(1)
+
+        self.assertEqual(result, "result")
+        self.func.assert_called_once_with(1)
+        self.assertIsNone(caches["default"].get("func:1"))
+        self.assertEqual(caches["bulk"].get("func:1"), "result")
+
+    def test_restored_after_block(self):
+        with bulk_cache():
+            with bulk_cache(alias="bulk"):
+                pass
+            self.cached_func(1)
+
+        self.assertIsNone(caches["default"].get("func:1"))
+
+        self.cached_func(1)
+
+        self.assertEqual(caches["default"].get("func:1"), "result")
+
+    def test_other_threads_unaffected(self):
+        with bulk_cache(alias="bulk"):
+            thread = threading.Thread(target=self.cached_func, args=(1,))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(caches["default"].get("func:1"), "result")
+        self.assertIsNone(caches["bulk"].get("func:1"))
+
+    def test_parallel_workers_inherit_bulk_mode(self):
+        with bulk_cache(alias="bulk"):
+            with parallel(max_workers=2) as executor:
+                results = list(executor.map(self.cached_func, [1, 2]))
+
+        self.assertEqual(results, ["result", "result"])
+        self.assertIsNone(caches["default"].get("func:1"))
+        self.assertEqual(caches["bulk"].get("func:2"), "result")
+
+
+@override_settings(CACHE_LOCK_TIMEOUT=5, CACHE_LOCK_POLL_INTERVAL=0.01)
+class SingleFlightTests(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.func = Mock(return_value="result")
+        self.func.__qualname__ = "func"
+        self.cached_func = cache("func:{arg}", timeout=60)(lambda arg: self.func(arg))
+
+    def test_concurrent_misses_in_process(self):
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow(arg):
+            entered.set()
+            release.wait(5)
+            return "result"
+
+        self.func.side_effect = slow
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cached_func(1)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        entered.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.func.assert_called_once_with(1)
+        self.assertEqual(results, ["result"] * 5)
+
+    def test_waits_for_other_process(self):
+        caches["default"].add("func:1:lock", 1)
+        threading.Timer(
+            0.05, lambda: caches["default"].set("func:1", "other process")
+        ).start()
+
+        result = self.cached_func(1)
+
+        self.assertEqual(result, "other process")
+        self.func.assert_not_called()
+
+    def test_other_process_gave_up(self):
+        caches["default"].add("func:1:lock", 1)
+        threading.Timer(0.05, lambda: caches["default"].delete("func:1:lock")).start()
+
+        result = self.cached_func(1)
+
+        self.assertEqual(result, "result")
+        self.func.assert_called_once_with(1)
+
+    def test_lock_released(self):
+        self.cached_func(1)
+
+        self.assertIsNone(caches["default"].get("func:1:lock"))
+
+
+class EarlyRefreshTests(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.func = Mock(return_value="new")
+        self.func.__qualname__ = "func"
+        self.cached_func = cache("func:{arg}", timeout=60, hot=True)(
+            lambda arg: self.func(arg)
+        )
+
+    def test_stores_expiry(self):
+        self.cached_func(1)
+
+        delta, expires_at = caches["default"].get("func:1:xfetch")
+        self.assertGreaterEqual(delta, 0)
+        self.assertAlmostEqual(expires_at, time.time() + 60, delta=5)
+
+    def test_not_refreshed_far_from_expiry(self):
+        caches["default"].set("func:1", "current")
+        caches["default"].set("func:1:xfetch", (0.1, time.time() + 60))
+
+        result = self.cached_func(1)
+
+        self.assertEqual(result, "current")
+        self.func.assert_not_called()
+
+    def test_refreshed_at_expiry(self):
+        caches["default"].set("func:1", "current")
+        caches["default"].set("func:1:xfetch", (0.1, time.time() - 1))
+
+        result = self.cached_func(1)
+
+        self.assertEqual(result, "new")
+        self.assertEqual(caches["default"].get("func:1"), "new")
+
+    def test_refreshed_elsewhere(self):
+        caches["default"].set("func:1", "current")
+        caches["default"].set("func:1:xfetch", (0.1, time.time() - 1))
+        caches["default"].add("func:1:lock", 1)
+
+        result = self.cached_func(1)
+
+        self.assertEqual(result, "current")
+        self.func.assert_not_called()
+
+    def test_refresh_fails(self):
+        caches["default"].set("func:1", "current")
+        caches["default"].set("func:1:xfetch", (0.1, time.time() - 1))
+        self.func.side_effect = ConnectionError
+
+        result = self.cached_func(1)
+
+        self.assertEqual(result, "current")
+
+
+@override_settings(CB_FAILURE_THRESHOLD=2, CB_RECOVERY_TIMEOUT=30)
+class CircuitBreakerTests(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.func = Mock(return_value="result")
+        self.func.__qualname__ = "func"
+
+        def func(arg):
+            return self.func(arg)
+
+        func.__qualname__ = "func"
+        self.cached_func = cache("func:{arg}", timeout=60)(func)
+
+    def test_success_does_not_touch_circuit_keys(self):
+        with patch.object(
+            caches["default"], "delete_many", wraps=caches["default"].delete_many
+        ) as m_delete_many, patch.object(
+            caches["default"], "get", wraps=caches["default"].get
+        ) as m_get:
+            self.cached_func(1)
+
+        m_delete_many.assert_called_once_with(["func:1:lock"])
+        m_get.assert_called_once_with("func:1")
+
+    def test_opens_after_failures(self):
+        self.func.side_effect = ConnectionError
+
+        for arg in range(2):
+            with self.assertRaises(ConnectionError):
+                self.cached_func(arg)
+
+        with self.assertRaises(CircuitOpenError):
+            self.cached_func(3)
+
+        self.assertEqual(self.func.call_count, 2)
+        self.assertEqual(caches["default"].get("cb:func:failures"), 2)
+
+    def test_closed_after_recovery(self):
+        self.func.side_effect = [ConnectionError, ConnectionError, "result"]
+        for arg in range(2):
+            with self.assertRaises(ConnectionError):
+                self.cached_func(arg)
+
+        with patch(
+            "zac.utils.decorators.time.monotonic", return_value=time.monotonic() + 31
+        ):
+            result = self.cached_func(3)
+
+        self.assertEqual(result, "result")
+        self.assertIsNone(caches["default"].get("cb:func:failures"))
+
+    def test_opened_by_other_process(self):
+        caches["default"].set("cb:func:failures", 5)
+        self.func.side_effect = ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            self.cached_func(1)
+        with self.assertRaises(CircuitOpenError):
+            self.cached_func(2)
+
+        self.func.assert_called_once_with(1)
+
+
+class StoreFailureTests(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cached_func = cache("func:{arg}", timeout=60)(lambda arg: "result")
+
+    @patch("zac.utils.decorators.logger")
+    def test_unpicklable_result(self, m_logger):
+        with patch("zac.utils.decorators._store", side_effect=TypeError("no pickle")):
+            result = self.cached_func(1)
+
+        self.assertEqual(result, "result")
+        self.assertIn("unpicklable", m_logger.debug.call_args[0][0])
+        m_logger.warning.assert_not_called()
+
+    @patch("zac.utils.decorators.logger")
+    def test_cache_unavailable(self, m_logger):
+        with patch(
+            "zac.utils.decorators._store", side_effect=ConnectionError("refused")
+        ):
+            result = self.cached_func(1)
+
+        self.assertEqual(result, "result")
+        message, *args = m_logger.warning.call_args[0]
+        self.assertNotIn("unpicklable", message)
+        self.assertEqual(args[:2], ["func:1", "ConnectionError"])
+        self.assertEqual(str(args[2]), "refused")
+
+
+class CacheOptionsTests(SimpleTestCase):
+    def test_unsupported_options_rejected(self):
+        with self.assertRaises(TypeError):
+            cache("func:{arg}", timeout=60, version=2)
+
+
+class StoreTests(SimpleTestCase):
+    def test_redis_pipeline(self):
+        backend = Mock(default_timeout=300)
+        backend.client.make_key.side_effect = lambda key: f":1:{key}"
+        backend.client.encode.side_effect = lambda value: f"encoded-{value}"
+        pipeline = backend.client.get_client.return_value.pipeline.return_value
+        value = "value"
+
+        _store(
+            backend,
+            [("key", value, 60), ("key:stale", value, 600), ("other", "meta", None)],
+            delete=["key:lock"],
+        )
+
+        backend.client.encode.assert_has_calls([call("value"), call("meta")])
+        self.assertEqual(backend.client.encode.call_count, 2)
+        self.assertEqual(
+            pipeline.mock_calls,
+            [
+                call.set(":1:key", "encoded-value", px=60000),
+                call.set(":1:key:stale", "encoded-value", px=600000),
+                call.set(":1:other", "encoded-meta", px=None),
+                call.delete(":1:key:lock"),
+                call.execute(),
+            ],
+        )
+        backend.set.assert_not_called()
+
+    def test_other_backends(self):
+        _store(caches["default"], [("key", "value", 60)], delete=["key:lock"])
+
+        self.assertEqual(caches["default"].get("key"), "value")
+        caches["default"].clear()
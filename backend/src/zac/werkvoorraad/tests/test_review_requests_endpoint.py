@@ -1,8 +1,12 @@
+from copy import deepcopy
 from unittest.mock import patch
 
+from django.conf import settings
 from django.urls import reverse
 
 import requests_mock
+from elasticsearch_dsl import Index
+from furl import furl
 from rest_framework.test import APITestCase
 from zgw_consumers.constants import APITypes
 
@@ -23,10 +27,12 @@ from zac.contrib.objects.kownsl.tests.factories import (
 )
 from zac.core.models import CoreConfig, MetaObjectTypesConfig
 from zac.core.tests.utils import ClearCachesMixin
+from zac.elasticsearch.api import update_meta_object_document
+from zac.elasticsearch.documents import MetaObjectDocument
 from zac.elasticsearch.tests.utils import ESMixin
 from zac.tests import ServiceFactory
 from zac.tests.compat import generate_oas_component, mock_service_oas_get
-from zac.tests.utils import mock_resource_get, paginated_response
+from zac.tests.utils import mock_resource_get
 
 CATALOGUS_URL = f"{CATALOGI_ROOT}catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
 REVIEW_OBJECTTYPE = review_object_type_version_factory()
@@ -61,7 +67,7 @@ class ReviewRequestsTests(ClearCachesMixin, ESMixin, APITestCase):
         meta_config.review_objecttype = REVIEW_OBJECTTYPE["url"]
         meta_config.save()
 
-        cls.user = UserFactory.create()
+        cls.user = UserFactory.create(username="some-author")
         cls.catalogus = generate_oas_component(
             "ztc",
             "schemas/Catalogus",
@@ -92,6 +98,20 @@ class ReviewRequestsTests(ClearCachesMixin, ESMixin, APITestCase):
         )
         cls.review_request = review_request_factory()
 
+    def setUp(self):
+        super().setUp()
+        Index(settings.ES_INDEX_META_OBJECTEN).delete(ignore=404)
+        MetaObjectDocument.init()
+
+    def index_review_request(self, review_request: dict, uuid: str):
+        rr_object = review_request_object_factory(
+            url=f"{OBJECTS_ROOT}objects/{uuid}",
+            uuid=uuid,
+            type=REVIEW_REQUEST_OBJECTTYPE["url"],
+            record__data=review_request,
+        )
+        update_meta_object_document(rr_object)
+
     @patch("zac.core.services.fetch_objecttypes", return_value=[])
     def test_workstack_review_requests_endpoint_no_zaak(self, m, *mocks):
         mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
@@ -99,12 +119,10 @@ class ReviewRequestsTests(ClearCachesMixin, ESMixin, APITestCase):
         mock_service_oas_get(m, OBJECTTYPES_ROOT, "objecttypes")
         mock_resource_get(m, self.catalogus)
 
-        rr_object = review_request_object_factory(record__data=self.review_request)
-
-        m.post(
-            f"{OBJECTS_ROOT}objects/search?pageSize=20&page=1",
-            json=paginated_response([rr_object]),
+        self.index_review_request(
+            self.review_request, "85e6c250-9f51-4286-8340-25109d0b96d1"
         )
+        Index(settings.ES_INDEX_META_OBJECTEN).refresh()
 
         self.client.force_authenticate(user=self.user)
 
@@ -167,12 +185,10 @@ class ReviewRequestsTests(ClearCachesMixin, ESMixin, APITestCase):
         zaak_document.save()
         self.refresh_index()
 
-        rr_object = review_request_object_factory(record__data=self.review_request)
-
-        m.post(
-            f"{OBJECTS_ROOT}objects/search?pageSize=20&page=1",
-            json=paginated_response([rr_object]),
+        self.index_review_request(
+            self.review_request, "85e6c250-9f51-4286-8340-25109d0b96d1"
         )
+        Index(settings.ES_INDEX_META_OBJECTEN).refresh()
 
         self.client.force_authenticate(user=self.user)
 
@@ -250,3 +266,73 @@ class ReviewRequestsTests(ClearCachesMixin, ESMixin, APITestCase):
             },
             response.json(),
         )
+
+    @patch("zac.core.services.fetch_objecttypes", return_value=[])
+    def test_workstack_review_requests_endpoint_filter_and_paginate(self, m, *mocks):
+        mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
+        # newest first
+        for index, created in enumerate(
+            ["2022-04-14T15:49:09Z", "2022-04-16T15:49:09Z", "2022-04-15T15:49:09Z"]
+        ):
+            review_request = deepcopy(self.review_request)
+            review_request["id"] = f"14aec7a0-06de-4b55-b839-a1c9a0415b4{index}"
+            review_request["created"] = created
+            self.index_review_request(
+                review_request, f"85e6c250-9f51-4286-8340-25109d0b96d{index}"
+            )
+        locked = deepcopy(self.review_request)
+        locked["locked"] = True
+        self.index_review_request(locked, "85e6c250-9f51-4286-8340-25109d0b96e0")
+        other_requester = deepcopy(self.review_request)
+        other_requester["requester"]["username"] = "some-other-author"
+        self.index_review_request(
+            other_requester, "85e6c250-9f51-4286-8340-25109d0b96e1"
+        )
+        Index(settings.ES_INDEX_META_OBJECTEN).refresh()
+
+        self.client.force_authenticate(user=self.user)
+
+        with patch(
+            "zac.contrib.objects.services.fetch_reviews",
+            return_value=[],
+        ):
+            response = self.client.get(self.endpoint, {"pageSize": 2})
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertEqual(data["count"], 3)
+            self.assertEqual(
+                [rr["id"] for rr in data["results"]],
+                [
+                    "14aec7a0-06de-4b55-b839-a1c9a0415b41",
+                    "14aec7a0-06de-4b55-b839-a1c9a0415b42",
+                ],
+            )
+            self.assertIsNone(data["previous"])
+            self.assertEqual(furl(data["next"]).args["page"], "2")
+
+            response = self.client.get(self.endpoint, {"pageSize": 2, "page": 2})
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertEqual(
+                [rr["id"] for rr in data["results"]],
+                ["14aec7a0-06de-4b55-b839-a1c9a0415b40"],
+            )
+            self.assertIsNone(data["next"])
+
+
+class ReviewRequestsPaginationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=UserFactory.create())
+
+    def test_invalid_page(self):
+        endpoint = reverse("werkvoorraad:review-requests")
+        for page in ["abc", "0", "-1"]:
+            with self.subTest(page=page):
+                with patch(
+                    "zac.werkvoorraad.views.get_review_requests_paginated"
+                ) as m_get_review_requests:
+                    response = self.client.get(endpoint, {"page": page})
+
+                self.assertEqual(response.status_code, 404)
+                m_get_review_requests.assert_not_called()
@@ -297,8 +297,8 @@ class WorkStackReviewRequestsView(views.APIView):
             self.paginator.page_size_query_param: self.paginator.get_page_size(
                 self.request
             ),
-            self.paginator.page_query_param: self.request.query_params.get(
-                self.paginator.page_query_param, 1
+            self.paginator.page_query_param: self.paginator.get_page_number_or_404(
+                self.request
             ),
         }
 
@@ -338,7 +338,6 @@ class WorkStackReviewRequestsView(views.APIView):
             query_params=self.get_query_params(),
             requester=request.user,
             not_locked=True,
-            latest_version=True,
         )
         review_requests = self.resolve_zaken(results["results"])
         review_requests = self.resolve_reviews(results["results"])